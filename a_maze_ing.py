@@ -2,10 +2,25 @@
 
 This script loads a configuration file, generates a maze based on the
 specified parameters, and launches an interactive visualization using
-MiniLibX graphics.
+MiniLibX graphics. With ``STREAM=True`` in the configuration, the maze is
+instead generated row by row with Eller's algorithm and streamed straight
+to the output file, without any size limit or window. With
+``INPUT_FILE=<file>``, a maze previously written to an output file is
+loaded and shown instead of generating a new one. With ``--batch N``, N
+mazes are generated headlessly across a process pool, job ``i`` seeded
+with ``--seed + i`` (or ``SEED + i``) and written to ``OUTPUT_FILE``
+suffixed with ``_i``. With ``--headless``, the maze is generated, solved
+and written to ``OUTPUT_FILE`` without opening a window: MiniLibX is
+never imported, so no display is needed. ``--image FILE`` also draws the
+maze and its solution into a PNG or PPM file (one per job with
+``--batch``), without any display either.
+
+Modules are imported only by the mode that uses them, which keeps startup
+fast for the headless modes.
 
 Usage:
-    python a_maze_ing.py <config_file>
+    python a_maze_ing.py <config_file> [--headless] [--image FILE]
+    python a_maze_ing.py <config_file> [--batch N] [--workers W] [--seed S]
 
 Args:
     config_file: Path to a .txt or .conf configuration file containing
@@ -13,31 +28,125 @@ Args:
 
 Example:
     python a_maze_ing.py config.conf
+    python a_maze_ing.py config.conf --headless
+    python a_maze_ing.py config.conf --batch 1000 --seed 42
+    python a_maze_ing.py config.conf --headless --image maze.png
 """
 
+import argparse
+import os
 import sys
+from typing import Any
 from configs.config_parser import parser
-from render.render import mlx_render
-from utils.errors import InvalidCoordinates, ConfigsError
+from maze.service import (Maze, MazeQueue, build_maze, from_generator,
+                          save_maze)
+from utils.errors import (InvalidCoordinates, ConfigsError,
+                          InvalidDistinationFor42Path, InvalidEntryExitPoint,
+                          InvalidMazeFile)
+
+
+def build_from_configs(configs: dict[str, Any], warn: bool) -> Maze:
+    """Build a maze from the parsed configuration."""
+    return build_maze(
+        configs["WIDTH"],
+        configs["HEIGHT"],
+        configs["ENTRY"],
+        configs["EXIT"],
+        configs["PERFECT"],
+        configs["SEED"],
+        warn=warn
+    )
+
 
 if len(sys.argv) < 2:
     print("Error: configuration file argument missing")
     sys.exit(1)
 
-file = sys.argv[1]
+arguments = argparse.ArgumentParser(
+    description="Generate, solve and display mazes.")
+arguments.add_argument("config_file")
+arguments.add_argument("--headless", action="store_true",
+                       help="write OUTPUT_FILE without opening a window")
+arguments.add_argument("--batch", type=int, metavar="N",
+                       help="generate N mazes headlessly and exit")
+arguments.add_argument("--workers", type=int, metavar="W",
+                       help="worker processes for --batch (default: CPUs)")
+arguments.add_argument("--seed", type=int, metavar="S",
+                       help="base seed for --batch; job i uses S + i "
+                       "(default: SEED from the config, or 0)")
+arguments.add_argument("--image", metavar="FILE",
+                       help="also draw the maze and its solution into a "
+                       ".png or .ppm file")
+arguments.add_argument("--cell-size", type=int, default=10, metavar="PX",
+                       help="side of a cell in the --image, in pixels "
+                       "(default: 10)")
+args = arguments.parse_args()
+if args.batch is not None and args.batch < 1:
+    arguments.error("--batch must be at least 1")
+if args.workers is not None and args.workers < 1:
+    arguments.error("--workers must be at least 1")
+if args.image:
+    from maze.image import FORMATS
+    if os.path.splitext(args.image)[1].lower() not in FORMATS:
+        arguments.error("--image must be a .png or .ppm file")
+    if args.cell_size < 3:
+        arguments.error("--cell-size must be at least 3")
 
 try:
-    configs = parser(file)
-    mlx_render(
-        configs.get("WIDTH"),
-        configs.get("HEIGHT"),
-        configs.get("ENTRY"),
-        configs.get("EXIT"),
-        configs.get("OUTPUT_FILE"),
-        configs.get("PERFECT"),
-        configs.get("SEED")
-    )
+    configs = parser(args.config_file)
+    if args.batch is not None:
+        from maze.batch import generate_batch
+        base_seed = args.seed
+        if base_seed is None:
+            base_seed = configs.get("SEED") or 0
+        files = generate_batch(configs, args.batch, base_seed, args.workers,
+                               args.image, args.cell_size)
+        print(f"{len(files)} mazes written")
+        sys.exit()
+    if configs.get("STREAM"):
+        from maze.streaming import stream_maze
+        if args.image:
+            print("Error: --image needs the whole maze, it cannot be used "
+                  "with STREAM=True")
+            sys.exit(1)
+        stream_maze(
+            configs.get("WIDTH"),
+            configs.get("HEIGHT"),
+            configs.get("ENTRY"),
+            configs.get("EXIT"),
+            configs.get("OUTPUT_FILE"),
+            configs.get("SEED")
+        )
+        sys.exit()
+    if configs.get("INPUT_FILE"):
+        from maze.hexfile import load_output_file
+        loaded, _ = load_output_file(configs.get("INPUT_FILE"))
+        first = from_generator(loaded)
+        save_maze(first, configs.get("OUTPUT_FILE"))
+    else:
+        first = build_from_configs(configs, warn=not args.headless)
+        save_maze(first, configs["OUTPUT_FILE"])
+    if args.image:
+        from maze.image import export_image
+        export_image(first, args.image, args.cell_size)
+    if args.headless:
+        sys.exit()
+    from render.render import mlx_render
+    # G keeps the size, entry and exit of the first maze, which may come
+    # from INPUT_FILE rather than from the config
+    ready = MazeQueue(lambda: build_maze(first.width, first.height,
+                                         first.entry, first.exit,
+                                         configs["PERFECT"], configs["SEED"],
+                                         warn=True),
+                      configs["OUTPUT_FILE"], configs["QUEUE_SIZE"])
+    try:
+        mlx_render(first, ready.get)
+    finally:
+        ready.close()
+        print(ready)
 
-except (ModuleNotFoundError, InvalidCoordinates, ConfigsError) as e:
+except (ModuleNotFoundError, InvalidCoordinates, ConfigsError,
+        InvalidDistinationFor42Path, InvalidEntryExitPoint,
+        InvalidMazeFile) as e:
     print(e)
     exit()
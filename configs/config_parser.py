@@ -27,7 +27,15 @@ def parser(file: Any) -> Any:
             - EXIT (tuple): Exit point coordinates (x, y).
             - OUTPUT_FILE (str): Path for the output maze file.
             - PERFECT (bool): Whether to generate a perfect maze.
-            - SEED (bool): Whether to use a fixed random seed.
+            - SEED (int | None): Seed of the maze generator, None for a
+              different maze on every run. "True" means seed 1 and "False"
+              means None.
+            - STREAM (bool): Optional, defaults to False. Whether to stream
+              the maze row by row to OUTPUT_FILE instead of rendering it.
+            - INPUT_FILE (str | None): Optional. A maze file previously
+              written to OUTPUT_FILE to load instead of generating one.
+            - QUEUE_SIZE (int): Optional, defaults to 2. Number of mazes
+              generated ahead in the background for the G key.
 
     Raises:
         ConfigsError: If the file format is invalid, required keys are
@@ -45,7 +53,8 @@ def parser(file: Any) -> Any:
         """Validate and convert configuration values to appropriate types.
 
         Checks that all required keys are present and converts string values
-        to their proper types (integers, booleans, tuples).
+        to their proper types (integers, booleans, tuples). Optional keys
+        that are absent get their default value.
 
         Args:
             configs: Dictionary of raw string configuration values.
@@ -87,14 +96,22 @@ def parser(file: Any) -> Any:
                         )
                 elif key == "SEED":
                     if configs["SEED"] == "True":
-                        configs["SEED"] = True
+                        configs["SEED"] = 1
                     elif configs["SEED"] == "False":
-                        configs["SEED"] = False
+                        configs["SEED"] = None
                     else:
-                        raise errors.ConfigsError(
-                            f'Error: \'{key}\' must be either '
-                            '"True" or "False" (case-sensitive)'
-                        )
+                        try:
+                            configs["SEED"] = int(configs["SEED"])
+                        except ValueError:
+                            raise errors.ConfigsError(
+                                f'Error: \'{key}\' must be a non-negative '
+                                'integer, "True" or "False" (case-sensitive)'
+                            )
+                        if configs["SEED"] < 0:
+                            raise errors.ConfigsError(
+                                f"Error: '{key}' must be a non-negative "
+                                "integer"
+                            )
                 elif key == "OUTPUT_FILE":
                     if configs.get(key).endswith(".txt") is False:
                         raise errors.ConfigsError(
@@ -127,6 +144,38 @@ def parser(file: Any) -> Any:
                 raise errors.ConfigsError(
                     f"Error: missing mandatory configuration key: '{key}'"
                 )
+        optional_keys = {"STREAM": False, "INPUT_FILE": None,
+                         "QUEUE_SIZE": 2}
+        for key, default in optional_keys.items():
+            if key not in configs:
+                configs[key] = default
+            elif key == "QUEUE_SIZE":
+                try:
+                    configs[key] = int(configs.get(key))
+                except ValueError:
+                    raise errors.ConfigsError(
+                        f"Error: invalid '{key}' "
+                        "value (expected a positive integer)"
+                    )
+                if configs[key] <= 0:
+                    raise errors.ConfigsError(
+                        f"Error: '{key}' must be positive integer"
+                    )
+            elif key == "INPUT_FILE":
+                if configs.get(key).endswith(".txt") is False:
+                    raise errors.ConfigsError(
+                        "Error: invalid input file "
+                        "format (expected a .txt file)"
+                    )
+            elif configs[key] == "True":
+                configs[key] = True
+            elif configs[key] == "False":
+                configs[key] = False
+            else:
+                raise errors.ConfigsError(
+                    f'Error: \'{key}\' must be either '
+                    '"True" or "False" (case-sensitive)'
+                )
 
     def parsing(file_obj: Any, file: str) -> Any:
         """Parse configuration file contents into a dictionary.
@@ -0,0 +1,100 @@
+"""Headless generation of many mazes in parallel.
+
+Every job builds its own ``MazeGenerator`` with a private
+``random.Random(base_seed + i)``, so a job's maze depends only on its
+seed: the same batch is bit-identical from one run to the next, whatever
+the number of workers or the order in which jobs finish. Each job solves
+its maze and writes it to its own output file, and optionally draws it to
+its own image file (see ``maze.image``).
+"""
+
+import os
+import random
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Optional
+from maze.image import export_image
+from maze.service import build_maze, save_maze
+
+
+def batch_file(out_file: str, i: int, count: int) -> str:
+    """
+    Return the output or image file of job ``i``: ``maze.txt`` becomes
+    ``maze_007.txt``, zero-padded to the width of the last job number.
+    """
+    root, ext = os.path.splitext(out_file)
+    return f"{root}_{i:0{len(str(count - 1))}d}{ext}"
+
+
+def generate_one(width: int, height: int, entry: Any, exit: Any,
+                 out_file: str, perfect: bool, seed: Optional[int],
+                 image: Optional[str] = None, cell_size: int = 10) -> str:
+    """
+    Generate, solve and write one maze.
+
+    Mazes too small for the 42 pattern are generated without it, as in
+    the interactive mode.
+
+    Args:
+        width (int): Number of columns.
+        height (int): Number of rows.
+        entry (tuple[int, int]): Entry point coordinates.
+        exit (tuple[int, int]): Exit point coordinates.
+        out_file (str): Path to the output file.
+        perfect (bool): Use the backtracker if True. Otherwise use Prim's
+        and open extra walls, so the maze has loops.
+        seed (int | None): Seed of the job's random generator, None for a
+        system-seeded one.
+        image (str | None): Also draw the maze into this PNG or PPM file.
+        cell_size (int): Side of a cell in the image, in pixels.
+
+    Returns:
+        str: ``out_file``.
+
+    Raises:
+        InvalidEntryExitPoint: If entry or exit points are inside the 42
+        path.
+    """
+    maze = build_maze(width, height, entry, exit, perfect,
+                      rng=random.Random(seed))
+    save_maze(maze, out_file)
+    if image:
+        export_image(maze, image, cell_size)
+    return out_file
+
+
+def _generate_job(job: tuple[Any, ...]) -> str:
+    """Unpack one job for ``ProcessPoolExecutor.map``."""
+    return generate_one(*job)
+
+
+def generate_batch(configs: dict[str, Any], count: int, base_seed: int = 0,
+                   workers: Optional[int] = None,
+                   image: Optional[str] = None,
+                   cell_size: int = 10) -> list[str]:
+    """
+    Generate ``count`` mazes from one configuration across processes.
+
+    Args:
+        configs (dict): Parsed configuration (see ``configs.parser``).
+        count (int): Number of mazes.
+        base_seed (int): Job ``i`` is seeded with ``base_seed + i``.
+        workers (int | None): Number of worker processes; defaults to the
+        number of CPUs. 1 generates in this process.
+        image (str | None): Also draw job ``i`` into ``batch_file(image, i,
+        count)``, a PNG or PPM file.
+        cell_size (int): Side of a cell in the images, in pixels.
+
+    Returns:
+        list[str]: The output file of every job, in job order.
+    """
+    jobs = [(configs["WIDTH"], configs["HEIGHT"], configs["ENTRY"],
+             configs["EXIT"], batch_file(configs["OUTPUT_FILE"], i, count),
+             configs["PERFECT"], base_seed + i,
+             batch_file(image, i, count) if image else None, cell_size)
+            for i in range(count)]
+    workers = workers or os.cpu_count() or 1
+    if workers == 1:
+        return [_generate_job(job) for job in jobs]
+    with ProcessPoolExecutor(workers) as pool:
+        return list(pool.map(_generate_job, jobs,
+                             chunksize=max(1, count // (workers * 16))))
@@ -0,0 +1,274 @@
+"""Compact array-backed storage for maze grids.
+
+Walls are kept as a 4-bit mask per cell (N=1, E=2, S=4, W=8, the same bits
+used by the hex output file) in one flat ``bytearray``. The "visited" and
+"42 pattern" flags live in two separate bitsets, so a maze costs about
+1.25 bytes per cell instead of one Python object per cell.
+"""
+
+from typing import Any, Iterator
+
+NORTH = 1
+EAST = 2
+SOUTH = 4
+WEST = 8
+ALL_WALLS = NORTH | EAST | SOUTH | WEST
+
+# Hex digit of each wall mask, as written in the output file, and the
+# matching ``bytes.translate`` table to encode a whole buffer of masks.
+HEX_DIGITS = "0123456789ABCDEF"
+HEX_TABLE = bytes.maketrans(bytes(range(16)), HEX_DIGITS.encode())
+
+# Byte-per-bit expansion of every possible bitset byte, least significant
+# bit first, used to unpack a bitset into a one-byte-per-cell map.
+_EXPANDED_BITS = [bytes((value >> bit) & 1 for bit in range(8))
+                  for value in range(256)]
+
+
+class CellView:
+    """
+    Read-only view of a single grid cell.
+
+    Exposes the same attributes as the historical ``Cell`` object so that
+    the renderer and other callers can keep using ``maze[y][x].north``.
+
+    Attributes:
+        grid (Grid): The grid the cell belongs to.
+        index (int): Flat index of the cell (``y * width + x``).
+    """
+    __slots__ = ("grid", "index")
+
+    def __init__(self, grid: "Grid", index: int) -> None:
+        """Bind the view to the cell at ``index`` in ``grid``."""
+        self.grid = grid
+        self.index = index
+
+    @property
+    def mask(self) -> int:
+        """int: The 4-bit wall mask of the cell."""
+        return self.grid.mask(self.index)
+
+    @property
+    def north(self) -> bool:
+        """bool: True if the north wall exists."""
+        return bool(self.grid.mask(self.index) & NORTH)
+
+    @property
+    def east(self) -> bool:
+        """bool: True if the east wall exists."""
+        return bool(self.grid.mask(self.index) & EAST)
+
+    @property
+    def south(self) -> bool:
+        """bool: True if the south wall exists."""
+        return bool(self.grid.mask(self.index) & SOUTH)
+
+    @property
+    def west(self) -> bool:
+        """bool: True if the west wall exists."""
+        return bool(self.grid.mask(self.index) & WEST)
+
+    @property
+    def visited(self) -> bool:
+        """bool: True if the cell was visited during generation."""
+        return self.grid.is_visited(self.index)
+
+    @property
+    def _42_path(self) -> bool:
+        """bool: True if the cell is part of the "42 pattern"."""
+        return self.grid.is_blocked(self.index)
+
+
+class GridRow:
+    """
+    Read-only sequence of the ``CellView`` objects of one grid row.
+
+    Attributes:
+        grid (Grid): The grid the row belongs to.
+        start (int): Flat index of the first cell of the row.
+    """
+    __slots__ = ("grid", "start")
+
+    def __init__(self, grid: "Grid", y: int) -> None:
+        """Bind the row view to row ``y`` of ``grid``."""
+        self.grid = grid
+        self.start = y * grid.width
+
+    def __len__(self) -> int:
+        """Return the number of cells in the row."""
+        return self.grid.width
+
+    def __getitem__(self, x: int) -> CellView:
+        """Return a view of the cell in column ``x``."""
+        if x < 0:
+            x += self.grid.width
+        if not 0 <= x < self.grid.width:
+            raise IndexError("grid column out of range")
+        return CellView(self.grid, self.start + x)
+
+    def __iter__(self) -> Iterator[CellView]:
+        """Iterate over the cells of the row from west to east."""
+        grid = self.grid
+        for index in range(self.start, self.start + grid.width):
+            yield CellView(grid, index)
+
+
+class Grid:
+    """
+    Flat, array-backed maze grid.
+
+    Cell ``(x, y)`` lives at flat index ``y * width + x``. Indexing the grid
+    as ``grid[y][x]`` returns a read-only ``CellView``; all mutations go
+    through the methods below.
+
+    Attributes:
+        width (int): Number of columns.
+        height (int): Number of rows.
+        walls (bytearray): One wall mask per cell.
+        visited (bytearray): Bitset of cells visited during generation.
+        blocked (bytearray): Bitset of cells belonging to the 42 pattern.
+    """
+    __slots__ = ("width", "height", "walls", "visited", "blocked")
+
+    def __init__(self, width: int, height: int) -> None:
+        """
+        Create a grid with every wall standing and no flag set.
+
+        Args:
+            width (int): Number of columns.
+            height (int): Number of rows.
+        """
+        size = width * height
+        self.width = width
+        self.height = height
+        self.walls = bytearray([ALL_WALLS]) * size
+        self.visited = bytearray((size + 7) >> 3)
+        self.blocked = bytearray((size + 7) >> 3)
+
+    @classmethod
+    def from_walls(cls, width: int, height: int, walls: Any) -> "Grid":
+        """
+        Build a grid from an existing buffer of wall masks.
+
+        Args:
+            width (int): Number of columns.
+            height (int): Number of rows.
+            walls (bytes-like): ``width * height`` wall masks in row-major
+            order.
+
+        Returns:
+            Grid: A grid holding a copy of the masks, with no flag set.
+
+        Raises:
+            ValueError: If the buffer does not hold exactly one mask per
+            cell.
+        """
+        grid = cls(0, 0)
+        grid.width = width
+        grid.height = height
+        grid.walls = bytearray(walls)
+        if len(grid.walls) != width * height:
+            raise ValueError(
+                f"expected {width * height} wall masks, "
+                f"got {len(grid.walls)}")
+        grid.visited = bytearray((width * height + 7) >> 3)
+        grid.blocked = bytearray((width * height + 7) >> 3)
+        return grid
+
+    def __len__(self) -> int:
+        """Return the number of rows."""
+        return self.height
+
+    def __getitem__(self, y: int) -> GridRow:
+        """Return a view of row ``y``."""
+        if y < 0:
+            y += self.height
+        if not 0 <= y < self.height:
+            raise IndexError("grid row out of range")
+        return GridRow(self, y)
+
+    def __iter__(self) -> Iterator[GridRow]:
+        """Iterate over the rows from north to south."""
+        for y in range(self.height):
+            yield GridRow(self, y)
+
+    def index(self, x: int, y: int) -> int:
+        """Return the flat index of cell ``(x, y)``."""
+        return y * self.width + x
+
+    def mask(self, index: int) -> int:
+        """Return the wall mask of the cell at ``index``."""
+        return self.walls[index]
+
+    def is_visited(self, index: int) -> bool:
+        """Return True if the cell at ``index`` is marked visited."""
+        return bool(self.visited[index >> 3] & (1 << (index & 7)))
+
+    def mark_visited(self, index: int) -> None:
+        """Mark the cell at ``index`` as visited."""
+        self.visited[index >> 3] |= 1 << (index & 7)
+
+    def is_blocked(self, index: int) -> bool:
+        """Return True if the cell at ``index`` is part of the 42 pattern."""
+        return bool(self.blocked[index >> 3] & (1 << (index & 7)))
+
+    def mark_blocked(self, index: int) -> None:
+        """Mark the cell at ``index`` as part of the 42 pattern."""
+        self.blocked[index >> 3] |= 1 << (index & 7)
+
+    def closed_map(self) -> bytearray:
+        """
+        Unpack the visited and 42-pattern bitsets into a byte per cell.
+
+        Hot generation loops test this map instead of the bitsets, trading a
+        temporary byte per cell for a single subscript per neighbour check.
+
+        Returns:
+            bytearray: 1 for every visited or blocked cell, 0 otherwise.
+        """
+        table = _EXPANDED_BITS
+        closed = bytearray(b"".join(
+            table[visited | blocked]
+            for visited, blocked in zip(self.visited, self.blocked)))
+        del closed[self.width * self.height:]
+        return closed
+
+    def blocked_row(self, y: int) -> bytes:
+        """
+        Unpack the 42-pattern bits of row ``y`` into a byte per cell.
+
+        Returns:
+            bytes: 1 for every cell of the row in the 42 pattern, 0
+            otherwise.
+        """
+        start = y * self.width
+        table = _EXPANDED_BITS
+        expanded = b"".join(
+            table[value]
+            for value in self.blocked[start >> 3:
+                                      (start + self.width + 7) >> 3])
+        offset = start & 7
+        return expanded[offset:offset + self.width]
+
+    def carve(self, index: int, other: int) -> None:
+        """
+        Remove the wall shared by two adjacent cells.
+
+        Args:
+            index (int): Flat index of the first cell.
+            other (int): Flat index of an orthogonal neighbour of the first
+            cell. Non-adjacent pairs are ignored.
+        """
+        walls = self.walls
+        if other == index - self.width:
+            walls[index] &= ~NORTH
+            walls[other] &= ~SOUTH
+        elif other == index + self.width:
+            walls[index] &= ~SOUTH
+            walls[other] &= ~NORTH
+        elif other == index + 1 and other % self.width:
+            walls[index] &= ~EAST
+            walls[other] &= ~WEST
+        elif other == index - 1 and index % self.width:
+            walls[index] &= ~WEST
+            walls[other] &= ~EAST
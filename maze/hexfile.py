@@ -0,0 +1,175 @@
+"""Reader for the hex maze files written by ``creat_output_file``.
+
+The file is read row by row, so even very large mazes are never held as
+text in memory. Every row is decoded with ``bytes.translate`` and checked
+against its neighbours as it arrives: the east wall of each cell must
+match the west wall of the next one, the north walls of a row must match
+the south walls of the row above, and the outer border must be closed.
+The exit must also be reachable from the entry, either along the path line
+or, when the file has none, by a search.
+"""
+
+from typing import Any, Optional
+from maze.grid import ALL_WALLS, EAST, NORTH, SOUTH, WEST, Grid
+from maze.mazegen import MazeGenerator, pattern_42_cells
+from maze.pathfinder import bfs
+from utils.errors import InvalidMazeFile
+
+_INVALID = 0xFF
+# hex digit (either case) -> wall mask, anything else -> _INVALID
+_FROM_HEX = bytes(int(chr(value), 16)
+                  if chr(value) in "0123456789abcdefABCDEF" else _INVALID
+                  for value in range(256))
+_WALL_BIT = {
+    bit: bytes(1 if value & bit else 0 for value in range(256))
+    for bit in (NORTH, EAST, SOUTH, WEST)
+}
+_MOVES = {"N": (0, -1, NORTH), "E": (1, 0, EAST), "S": (0, 1, SOUTH),
+          "W": (-1, 0, WEST)}
+
+
+def _first_difference(a: bytes, b: bytes) -> int:
+    """Return the first index where two equal-length buffers differ."""
+    return next(i for i in range(len(a)) if a[i] != b[i])
+
+
+def _parse_point(line: bytes, name: str, path: str) -> tuple[int, int]:
+    """Parse an ``x, y`` line of the file."""
+    try:
+        x, y = line.split(b",")
+        return int(x), int(y)
+    except ValueError:
+        raise InvalidMazeFile(
+            f"Error: '{path}': invalid {name} line "
+            f"'{line.decode(errors='replace')}' (expected x, y)")
+
+
+def load_output_file(
+        path: str, out_file: Optional[str] = None
+) -> tuple[MazeGenerator, Optional[list[tuple[int, int]]]]:
+    """Rebuild a maze from a file written by ``creat_output_file``.
+
+    Args:
+        path (str): Path of the hex maze file.
+        out_file (str | None): Output file of the returned generator.
+        Defaults to ``path``.
+
+    Returns:
+        tuple: The ``MazeGenerator`` holding the maze, and the solution as
+        a list of (x, y) cells from entry to exit, or None when the file
+        has no path line (e.g. a streamed maze).
+
+    Raises:
+        InvalidMazeFile: If the file is malformed, its walls are
+        inconsistent, or the exit cannot be reached from the entry.
+    """
+    walls = bytearray()
+    width = 0
+    height = 0
+    previous_south = b""
+    try:
+        file = open(path, "rb")
+    except OSError as e:
+        raise InvalidMazeFile(f"Error: cannot read '{path}': {e.strerror}")
+    with file:
+        for line in file:
+            line = line.rstrip(b"\r\n")
+            if not line:
+                break
+            row = line.translate(_FROM_HEX)
+            if _INVALID in row:
+                raise InvalidMazeFile(
+                    f"Error: '{path}' line {height + 1}: invalid hex digit "
+                    f"in column {row.index(_INVALID)}")
+            if not width:
+                width = len(row)
+                if row.translate(_WALL_BIT[NORTH]) != b"\1" * width:
+                    raise InvalidMazeFile(
+                        f"Error: '{path}': the north border is open")
+            elif len(row) != width:
+                raise InvalidMazeFile(
+                    f"Error: '{path}' line {height + 1}: expected {width} "
+                    f"cells, got {len(row)}")
+            if not row[0] & WEST or not row[-1] & EAST:
+                raise InvalidMazeFile(
+                    f"Error: '{path}' line {height + 1}: the west or east "
+                    "border is open")
+            east = row.translate(_WALL_BIT[EAST])[:-1]
+            west = row.translate(_WALL_BIT[WEST])[1:]
+            if east != west:
+                raise InvalidMazeFile(
+                    f"Error: '{path}' line {height + 1}: east and west walls "
+                    f"disagree in column {_first_difference(east, west)}")
+            north = row.translate(_WALL_BIT[NORTH])
+            if previous_south and north != previous_south:
+                raise InvalidMazeFile(
+                    f"Error: '{path}' line {height + 1}: north wall disagrees "
+                    "with the row above in column "
+                    f"{_first_difference(north, previous_south)}")
+            previous_south = row.translate(_WALL_BIT[SOUTH])
+            walls += row
+            height += 1
+        if not height:
+            raise InvalidMazeFile(f"Error: '{path}' holds no maze")
+        if previous_south != b"\1" * width:
+            raise InvalidMazeFile(
+                f"Error: '{path}': the south border is open")
+        tail = [line.strip() for line in file]
+
+    if len(tail) < 2:
+        raise InvalidMazeFile(f"Error: '{path}': missing entry/exit lines")
+    entry = _parse_point(tail[0], "entry", path)
+    exit = _parse_point(tail[1], "exit", path)
+    for name, (x, y) in (("entry", entry), ("exit", exit)):
+        if not (0 <= x < width and 0 <= y < height):
+            raise InvalidMazeFile(
+                f"Error: '{path}': {name} ({x}, {y}) is out of the maze")
+
+    maze = MazeGenerator.from_grid(Grid.from_walls(width, height, walls),
+                                   entry, exit, out_file or path)
+    _restore_42_pattern(maze.maze)
+
+    moves = tail[2].decode(errors="replace") if len(tail) > 2 else ""
+    if not moves:
+        found, _ = bfs(maze.maze.walls, width, width * height,
+                       entry[1] * width + entry[0], exit[1] * width + exit[0])
+        if not found:
+            raise InvalidMazeFile(
+                f"Error: '{path}': the exit cannot be reached from the "
+                "entry")
+        return maze, None
+    return maze, _follow_moves(maze.maze, entry, exit, moves, path)
+
+
+def _restore_42_pattern(grid: Grid) -> None:
+    """Mark the 42 pattern if all of its cells are fully walled."""
+    if grid.width < 9 or grid.height < 9:
+        return
+    cells = [grid.index(x, y)
+             for x, y in pattern_42_cells(grid.width, grid.height)]
+    if all(grid.walls[index] == ALL_WALLS for index in cells):
+        for index in cells:
+            grid.mark_blocked(index)
+
+
+def _follow_moves(grid: Any, entry: tuple[int, int], exit: tuple[int, int],
+                  moves: str, path: str) -> list[tuple[int, int]]:
+    """Turn the path line into cells, checking it never crosses a wall."""
+    x, y = entry
+    cells = [entry]
+    for step, move in enumerate(moves):
+        if move not in _MOVES:
+            raise InvalidMazeFile(
+                f"Error: '{path}': invalid move '{move}' in the path line")
+        dx, dy, bit = _MOVES[move]
+        if grid.walls[y * grid.width + x] & bit:
+            raise InvalidMazeFile(
+                f"Error: '{path}': path move {step + 1} ('{move}') goes "
+                f"through a wall at ({x}, {y})")
+        x += dx
+        y += dy
+        cells.append((x, y))
+    if (x, y) != exit:
+        raise InvalidMazeFile(f"Error: '{path}': the path does not end at "
+                              f"the exit")
+    return cells
@@ -0,0 +1,197 @@
+"""Offscreen images of mazes, without MiniLibX or a display.
+
+``export_image`` draws a maze and its solution into a PNG or binary PPM
+file at any cell size. The image is produced one scanline at a time by
+``scanlines`` and written as soon as each line is ready (PNG lines go
+through a ``zlib.compressobj``), so memory stays proportional to the width
+of the image whatever its height.
+
+Each cell is ``cell_size`` pixels square with its walls on its own border,
+as in the window. Cells on the solution get a centred square, coloured
+differently at the entry and the exit, and the cells of the 42 pattern are
+filled. A scanline is assembled from per-cell pixel runs looked up by
+wall mask and cell kind, and the identical lines inside a row of cells are
+only assembled once.
+"""
+
+import os
+import struct
+import zlib
+from typing import BinaryIO, Callable, Iterator
+from maze.grid import EAST, NORTH, SOUTH, WEST
+from maze.service import Maze
+
+BACKGROUND = 0x000000
+PATH_COLOR = 0x00FFFF
+ENTRY_COLOR = 0x00FF00
+EXIT_COLOR = 0xFF0000
+PATTERN_COLOR = 0x808080
+
+# kind of a cell, kept above its 4 wall bits in the code of the cell
+_PLAIN, _PATH, _ENTRY, _EXIT, _BLOCKED = range(5)
+_KIND_COLORS = (BACKGROUND, PATH_COLOR, ENTRY_COLOR, EXIT_COLOR,
+                PATTERN_COLOR)
+_CODES = (_BLOCKED + 1) << 4
+_PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+_IDAT_SIZE = 1 << 16
+
+
+def _line_tables(cell_size: int,
+                 wall_color: int) -> tuple[list[list[bytes]], list[int]]:
+    """
+    Build the pixels of every line of a cell, for every cell code.
+
+    Returns:
+        tuple: The distinct tables, ``tables[t][code]`` being the RGB
+        pixels of a cell line for ``code = kind << 4 | walls``, and for
+        each line of a cell the index of its table.
+    """
+    wall = wall_color.to_bytes(3, "big")
+    background = BACKGROUND.to_bytes(3, "big")
+    inset = max(1, cell_size // 4)
+    tables: list[list[bytes]] = []
+    lines = []
+    for line in range(cell_size):
+        table = []
+        for code in range(_CODES):
+            kind, walls = code >> 4, code & 0xF
+            color = _KIND_COLORS[kind].to_bytes(3, "big")
+            if kind == _BLOCKED:
+                pixels = [color] * cell_size
+            elif ((line == 0 and walls & NORTH)
+                  or (line == cell_size - 1 and walls & SOUTH)):
+                pixels = [wall] * cell_size
+            else:
+                pixels = [background] * cell_size
+                if kind != _PLAIN and inset <= line < cell_size - inset:
+                    pixels[inset:cell_size - inset] = (
+                        [color] * (cell_size - 2 * inset))
+                if walls & WEST:
+                    pixels[0] = wall
+                if walls & EAST:
+                    pixels[-1] = wall
+            table.append(b"".join(pixels))
+        if table not in tables:
+            tables.append(table)
+        lines.append(tables.index(table))
+    return tables, lines
+
+
+def scanlines(maze: Maze, cell_size: int = 10,
+              wall_color: int = 0xFFFFFF) -> Iterator[bytes]:
+    """
+    Return the RGB scanlines of an image of ``maze``, top to bottom.
+
+    Args:
+        maze (Maze): The maze and its solution.
+        cell_size (int): Side of a cell in pixels, at least 3.
+        wall_color (int): Color of the walls (RGB format).
+
+    Returns:
+        Iterator[bytes]: ``maze.height * cell_size`` lines of
+        ``maze.width * cell_size`` pixels, 3 bytes (R, G, B) each.
+
+    Raises:
+        ValueError: If ``cell_size`` is below 3.
+    """
+    if cell_size < 3:
+        raise ValueError(
+            f"Error: cell size must be at least 3 pixels, got {cell_size}")
+    return _scanlines(maze, *_line_tables(cell_size, wall_color))
+
+
+def _scanlines(maze: Maze, tables: list[list[bytes]],
+               lines: list[int]) -> Iterator[bytes]:
+    """Yield the scanlines of every row of cells (see ``scanlines``)."""
+    grid = maze.grid
+    width = grid.width
+    marks: dict[int, dict[int, int]] = {}
+    for x, y in maze.solution:
+        marks.setdefault(y, {})[x] = _PATH
+    marks.setdefault(maze.entry[1], {})[maze.entry[0]] = _ENTRY
+    marks.setdefault(maze.exit[1], {})[maze.exit[0]] = _EXIT
+    for y in range(grid.height):
+        codes = bytearray(grid.walls[y * width:(y + 1) * width])
+        for x, kind in marks.get(y, {}).items():
+            codes[x] = codes[x] & 0xF | kind << 4
+        blocked = grid.blocked_row(y)
+        x = blocked.find(1)
+        while x >= 0:
+            codes[x] = codes[x] & 0xF | _BLOCKED << 4
+            x = blocked.find(1, x + 1)
+        rows: dict[int, bytes] = {}
+        for table in lines:
+            if table not in rows:
+                rows[table] = b"".join(map(tables[table].__getitem__, codes))
+            yield rows[table]
+
+
+def _png_chunk(kind: bytes, payload: bytes) -> bytes:
+    """Frame a PNG chunk with its length and CRC."""
+    return (struct.pack(">I", len(payload)) + kind + payload
+            + struct.pack(">I", zlib.crc32(kind + payload)))
+
+
+def write_png(file: BinaryIO, width: int, height: int,
+              rows: Iterator[bytes]) -> None:
+    """
+    Write 8-bit RGB scanlines as a PNG image.
+
+    The compressed data is written in IDAT chunks of about 64 KiB as the
+    lines come in.
+    """
+    file.write(_PNG_SIGNATURE)
+    file.write(_png_chunk(b"IHDR", struct.pack(">IIBBBBB", width, height,
+                                               8, 2, 0, 0, 0)))
+    compressor = zlib.compressobj()
+    pending = bytearray()
+    for row in rows:
+        # filter type 0 (None) in front of every line
+        pending += compressor.compress(b"\0")
+        pending += compressor.compress(row)
+        if len(pending) >= _IDAT_SIZE:
+            file.write(_png_chunk(b"IDAT", bytes(pending)))
+            pending.clear()
+    pending += compressor.flush()
+    file.write(_png_chunk(b"IDAT", bytes(pending)))
+    file.write(_png_chunk(b"IEND", b""))
+
+
+def write_ppm(file: BinaryIO, width: int, height: int,
+              rows: Iterator[bytes]) -> None:
+    """Write 8-bit RGB scanlines as a binary (P6) PPM image."""
+    file.write(f"P6\n{width} {height}\n255\n".encode())
+    for row in rows:
+        file.write(row)
+
+
+FORMATS: dict[str, Callable[[BinaryIO, int, int, Iterator[bytes]],
+                            None]] = {".png": write_png, ".ppm": write_ppm}
+
+
+def export_image(maze: Maze, out_file: str, cell_size: int = 10,
+                 wall_color: int = 0xFFFFFF) -> None:
+    """
+    Draw a maze and its solution into an image file.
+
+    The format follows the extension of ``out_file``: ``.png`` or ``.ppm``.
+
+    Args:
+        maze (Maze): The maze to draw, e.g. from ``build_maze`` or
+        ``from_generator``.
+        out_file (str): Path to the image file.
+        cell_size (int): Side of a cell in pixels, at least 3.
+        wall_color (int): Color of the walls (RGB format).
+
+    Raises:
+        ValueError: If the extension or the cell size is not supported.
+    """
+    extension = os.path.splitext(out_file)[1].lower()
+    if extension not in FORMATS:
+        raise ValueError(
+            f"Error: unsupported image format '{extension}' "
+            f"(expected {' or '.join(FORMATS)})")
+    rows = scanlines(maze, cell_size, wall_color)
+    with open(out_file, "wb") as file:
+        FORMATS[extension](file, maze.width * cell_size,
+                           maze.height * cell_size, rows)
@@ -1,12 +1,21 @@
 import random
-from typing import Any
+from array import array
+from typing import Any, Iterator, Optional
+from maze.grid import EAST, HEX_DIGITS, HEX_TABLE, NORTH, SOUTH, WEST, Grid
 from utils.errors import InvalidDistinationFor42Path, InvalidEntryExitPoint
 
+# walls opened per cell by ``open_extra_walls`` when PERFECT is False
+EXTRA_WALLS_RATIO = 0.3
+
 
 class Cell:
     """
     Represents a single cell in the maze.
 
+    ``MazeGenerator`` stores its grid in a compact ``maze.grid.Grid`` whose
+    cell views expose these same attributes; this class remains for callers
+    that build cells by hand.
+
     Attributes:
         north (bool): True if the north wall exists.
         south (bool): True if the south wall exists.
@@ -27,6 +36,60 @@ class Cell:
         self._42_path = False
 
 
+def pattern_42_cells(cols: int, rows: int) -> list[tuple[int, int]]:
+    """
+    List the cells of the '42' pattern centered in a cols x rows maze.
+
+    Args:
+        cols (int): Number of columns of the maze.
+        rows (int): Number of rows of the maze.
+
+    Returns:
+        list[tuple[int, int]]: Coordinates (x, y) of the pattern cells.
+    """
+    cells: list[tuple[int, int]] = []
+    x = cols // 2 - 3
+    y = rows // 2 - 3
+    first_y = y
+    # show 4
+    for move in range(0, 4):
+        cells.append((x, y + move))
+        last_y = move
+    y += last_y
+    for move in range(1, 3):
+        cells.append((x + move, y))
+        last_x = move
+    x += last_x
+    for move in range(1, 4):
+        cells.append((x, y + move))
+        last_y = move
+    y += last_y
+    y = first_y
+    x += 2
+    # show 2
+    for move in range(0, 3):
+        cells.append((x + move, y))
+        last_x = move
+    x += last_x
+    for move in range(1, 4):
+        cells.append((x, y + move))
+        last_y = move
+    y += last_y
+    for move in range(1, 3):
+        cells.append((x - move, y))
+        last_x = move
+    x -= last_x
+    for move in range(1, 4):
+        cells.append((x, y + move))
+        last_y = move
+    y += last_y
+    for move in range(1, 3):
+        cells.append((x + move, y))
+        last_x = move
+    x += last_x
+    return cells
+
+
 class MazeGenerator:
     """
     Generates mazes using different algorithms (Backtracker, Prim's) and can
@@ -35,14 +98,19 @@ class MazeGenerator:
     Attributes:
         x (int): Number of columns in the maze.
         y (int): Number of rows in the maze.
-        maze (list[list[Cell]]): 2D grid representing the maze.
+        maze (Grid): Array-backed grid representing the maze; ``maze[y][x]``
+        returns a read-only view with the same attributes as ``Cell``.
         stack (list[list[Cell]]): Helper stack used in some algorithms.
         entry (tuple[int, int]): Coordinates of the maze entry point.
         exit (tuple[int, int]): Coordinates of the maze exit point.
         out_file (str): Path to the file where the maze output will be saved.
+        rng (random.Random): Random generator owned by this maze; the
+        algorithms draw from it only, never from the global ``random``
+        state.
     """
     def __init__(self, cols: int, rows: int, Entry: Any, EXIT: Any,
-                 out_file: Any) -> None:
+                 out_file: Any, rng: Any = None,
+                 seed: Optional[int] = None) -> None:
         """
         Initialize the maze generator with dimensions, entry/exit points, and
         output file.
@@ -53,23 +121,50 @@ class MazeGenerator:
             Entry (tuple[int, int]): Entry point coordinates.
             EXIT (tuple[int, int]): Exit point coordinates.
             out_file (str): Path to the output file.
+            rng (random.Random | None): Random generator to use, e.g. a
+            ``maze.vectorized.BlockRandom``. Anything with ``choice``,
+            ``randrange`` and ``random`` methods works.
+            seed (int | None): Seed of the ``random.Random`` created when
+            ``rng`` is not given; None seeds it from the system.
         """
+        self.rng: Any = rng if rng is not None else random.Random(seed)
         self.x = cols
         self.y = rows
-        self.maze:  list[list[Cell]] = self.creat_grid()
+        self.maze: Grid = self.creat_grid()
         self.stack: list[list[Cell]] = []
         self.entry = Entry
         self.exit = EXIT
         self.out_file = out_file
 
-    def creat_grid(self) -> list[list[Cell]]:
+    @classmethod
+    def from_grid(cls, grid: Grid, Entry: Any, EXIT: Any,
+                  out_file: Any) -> "MazeGenerator":
         """
-        Create a 2D grid of Cell objects.
+        Wrap an already generated or loaded grid into a generator.
+
+        Args:
+            grid (Grid): The maze grid.
+            Entry (tuple[int, int]): Entry point coordinates.
+            EXIT (tuple[int, int]): Exit point coordinates.
+            out_file (str): Path to the output file.
+
+        Returns:
+            MazeGenerator: A generator whose ``maze`` is ``grid``.
+        """
+        maze = cls(0, 0, Entry, EXIT, out_file)
+        maze.x = grid.width
+        maze.y = grid.height
+        maze.maze = grid
+        return maze
+
+    def creat_grid(self) -> Grid:
+        """
+        Create the array-backed grid of the maze.
 
         Returns:
-            list[list[Cell]]: A grid with all cells initialized with walls.
+            Grid: A grid with all cells initialized with walls.
         """
-        return [[Cell() for _ in range(self.x)] for _ in range(self.y)]
+        return Grid(self.x, self.y)
 
     def find_nighbors(self, cell: Any) -> list[tuple[int, int, str]]:
         """
@@ -84,20 +179,18 @@ class MazeGenerator:
             and direction relative to the current cell.
         """
         x, y = cell
-        maze = self.maze
+        grid = self.maze
+        index = grid.index(x, y)
         unvisited_cells = []
-        if (x - 1 >= 0 and not maze[y][x-1].visited
-                and not self.maze[y][x - 1]._42_path):
-            unvisited_cells.append((x-1, y, "left"))
-        if (x + 1 < self.x and not maze[y][x+1].visited
-                and not self.maze[y][x + 1]._42_path):
-            unvisited_cells.append((x+1, y, "right"))
-        if (y - 1 >= 0 and not maze[y-1][x].visited
-                and not self.maze[y - 1][x]._42_path):
-            unvisited_cells.append((x, y-1, "top"))
-        if (y + 1 < self.y and not maze[y+1][x].visited
-                and not self.maze[y + 1][x]._42_path):
-            unvisited_cells.append((x, y+1, "bottom"))
+        for nx, ny, n_index, direction in (
+                (x - 1, y, index - 1, "left"),
+                (x + 1, y, index + 1, "right"),
+                (x, y - 1, index - self.x, "top"),
+                (x, y + 1, index + self.x, "bottom")):
+            if (0 <= nx < self.x and 0 <= ny < self.y
+                    and not grid.is_visited(n_index)
+                    and not grid.is_blocked(n_index)):
+                unvisited_cells.append((nx, ny, direction))
         return unvisited_cells
 
     def creat_maze_bakctracker_algo(self) -> None:
@@ -118,8 +211,8 @@ class MazeGenerator:
 generat maze without 42 pathern'"
             raise InvalidDistinationFor42Path(str)
         self.creat_42_pathren()
-        if (self.maze[entry[1]][entry[0]]._42_path or
-           self.maze[exit[1]][exit[0]]._42_path):
+        if (self.maze.is_blocked(self.maze.index(*entry)) or
+           self.maze.is_blocked(self.maze.index(*exit))):
             raise InvalidEntryExitPoint("Try other exit or entry point it's \
 invalid (inside '42 path')")
         self.remove_walls_backtracker_algo()
@@ -142,41 +235,71 @@ invalid (inside '42 path')")
 for 42 pathern.\n'we will generat maze without 42 pathern'"
             raise InvalidDistinationFor42Path(str)
         self.creat_42_pathren()
-        if (self.maze[entry[1]][entry[0]]._42_path is True or
-           self.maze[exit[1]][exit[0]]._42_path is True):
+        if (self.maze.is_blocked(self.maze.index(*entry)) or
+           self.maze.is_blocked(self.maze.index(*exit))):
             raise InvalidEntryExitPoint("Try other exit or entry point it's \
 invalid (inside '42 path')")
         self.remove_walls_prims_algo()
 
     def remove_walls_backtracker_algo(self, i: int = 0, j: int = 0) -> None:
         """
-        Recursively remove walls using the backtracker algorithm starting from
-        (i, j).
+        Remove walls using the backtracker algorithm starting from (i, j).
+
+        The depth-first walk keeps its own stack of flat cell indices instead
+        of recursing, so the maze size is not limited by the interpreter's
+        recursion limit and the stack costs 4 bytes per pending cell.
+        Visited/42-pattern tests read a temporary byte-per-cell map from
+        ``Grid.closed_map`` rather than the bitsets.
+        Neighbours are considered in the same order as ``find_nighbors``, so
+        a given seed still produces the same maze.
 
         Args:
             i (int): X-coordinate to start.
             j (int): Y-coordinate to start.
         """
-        self.maze[j][i].visited = True
-        neighbors = self.find_nighbors((i, j))
-        while neighbors:
-            next_cell = random.choice(neighbors)
-            new_x, new_y, direction = next_cell
-            self.maze[new_y][new_x].visited = True
-            if direction == "left":
-                self.maze[j][i].west = False
-                self.maze[new_y][new_x].east = False
-            elif direction == "right":
-                self.maze[j][i].east = False
-                self.maze[new_y][new_x].west = False
-            elif direction == "top":
-                self.maze[j][i].north = False
-                self.maze[new_y][new_x].south = False
-            elif direction == "bottom":
-                self.maze[j][i].south = False
-                self.maze[new_y][new_x].north = False
-            self.remove_walls_backtracker_algo(new_x, new_y)
-            neighbors = self.find_nighbors((i, j))
+        grid = self.maze
+        walls = grid.walls
+        visited = grid.visited
+        closed = grid.closed_map()
+        width = self.x
+        size = width * self.y
+        choice = self.rng.choice
+
+        start = grid.index(i, j)
+        closed[start] = 1
+        visited[start >> 3] |= 1 << (start & 7)
+        stack = array("i", [start])
+        while stack:
+            index = stack[-1]
+            x = index % width
+            neighbors = []
+            if x > 0 and not closed[index - 1]:
+                neighbors.append(index - 1)
+            if x + 1 < width and not closed[index + 1]:
+                neighbors.append(index + 1)
+            if index >= width and not closed[index - width]:
+                neighbors.append(index - width)
+            if index + width < size and not closed[index + width]:
+                neighbors.append(index + width)
+            if not neighbors:
+                stack.pop()
+                continue
+            n = choice(neighbors)
+            closed[n] = 1
+            visited[n >> 3] |= 1 << (n & 7)
+            if n == index - width:
+                walls[index] &= ~NORTH
+                walls[n] &= ~SOUTH
+            elif n == index + width:
+                walls[index] &= ~SOUTH
+                walls[n] &= ~NORTH
+            elif n < index:
+                walls[index] &= ~WEST
+                walls[n] &= ~EAST
+            else:
+                walls[index] &= ~EAST
+                walls[n] &= ~WEST
+            stack.append(n)
 
     def find_visited_cell(self, cell: tuple[int, int]) -> Any:
         """
@@ -191,38 +314,21 @@ invalid (inside '42 path')")
             coordinates and direction relative to the current cell.
         """
         x, y = cell
-        maze = self.maze
+        grid = self.maze
+        index = grid.index(x, y)
         visited_cells = []
-        if x - 1 >= 0 and maze[y][x-1].visited:
+        if x - 1 >= 0 and grid.is_visited(index - 1):
             visited_cells.append((x-1, y, "left"))
-        if x + 1 < self.x and maze[y][x+1].visited:
+        if x + 1 < self.x and grid.is_visited(index + 1):
             visited_cells.append((x+1, y, "right"))
-        if y - 1 >= 0 and maze[y-1][x].visited:
+        if y - 1 >= 0 and grid.is_visited(index - self.x):
             visited_cells.append((x, y-1, "top"))
-        if y + 1 < self.y and maze[y+1][x].visited:
+        if y + 1 < self.y and grid.is_visited(index + self.x):
             visited_cells.append((x, y+1, "bottom"))
         # if visited_cells != []:
         return visited_cells
         # return None
 
-    @staticmethod
-    def remove_duplicate_and_visited(items: Any) -> Any:
-        """
-        Remove duplicates from a list of cells.
-
-        Args:
-            items (list[tuple[int, int, str]]): List of cells with coordinates
-            and directions.
-
-        Returns:
-            list[tuple[int, int, str]]: List with duplicates removed.
-        """
-        none_duplicate: Any = []
-        for item in items:
-            if item not in none_duplicate:
-                none_duplicate.append(item)
-        return none_duplicate
-
     def remove_wall(self, cell1: tuple[int, int, str], cell2: Any) -> None:
         """
         Remove the wall between two adjacent cells.
@@ -233,208 +339,206 @@ invalid (inside '42 path')")
             cell2 (tuple[int, int, str]): Coordinates (x, y) and direction of
             the second cell.
         """
-        x1 = cell1[0]
-        y1 = cell1[1]
-        x2 = cell2[0]
-        y2 = cell2[1]
-
-        if x1 - 1 == x2 and y1 == y2:
-            self.maze[y1][x1].west = False
-            self.maze[y2][x2].east = False
-        elif x1 + 1 == x2 and y1 == y2:
-            self.maze[y1][x1].east = False
-            self.maze[y2][x2].west = False
-        elif x1 == x2 and y1 + 1 == y2:
-            self.maze[y1][x1].south = False
-            self.maze[y2][x2].north = False
-        elif x1 == x2 and y1 - 1 == y2:
-            self.maze[y1][x1].north = False
-            self.maze[y2][x2].south = False
+        grid = self.maze
+        grid.carve(grid.index(cell1[0], cell1[1]),
+                   grid.index(cell2[0], cell2[1]))
 
     def remove_walls_prims_algo(self, i: int = 0, j: int = 0) -> None:
         """
-    Generate a maze using Prim's algorithm starting from the cell (i, j).
+        Generate a maze using Prim's algorithm starting from the cell (i, j).
 
-    This algorithm works by maintaining a list of frontier cells (cells
-    adjacent
-    to the maze) and repeatedly adding a random frontier cell to the maze while
-    removing the wall between it and an already visited neighboring cell.
+        The frontier (cells adjacent to the maze but not yet part of it) is
+        an indexed set: an ``array('i')`` of flat indices plus a state byte
+        per cell. A random frontier cell is taken with a swap-remove, joined
+        to a random neighbour already in the maze, and its untouched
+        neighbours are added to the frontier. Every step is amortised O(1),
+        each cell is joined exactly once and the result is a spanning tree
+        of all cells outside the "42 pattern".
 
-    Args:
-        i (int): X-coordinate of the starting cell. Defaults to 0.
-        j (int): Y-coordinate of the starting cell. Defaults to 0.
-
-    Notes:
-        - Uses `self.find_nighbors` to find unvisited neighboring cells.
-        - Uses `self.find_visited_cell` to select which wall to remove when
-          connecting the frontier cell to the maze.
-        - Handles cells with the "42 pattern" if present.
-        - Random choice is used both for selecting the next frontier cell and
-          in case multiple visited neighbors exist.
-        - Walls are removed appropriately using `self.remove_wall` or direct
-          attribute manipulation depending on directions.
-
-    Modifies:
-        - `self.maze`: Updates visited status of cells and removes walls
-        between
-          cells to form the maze.
-        - `frentier_cells`: Dynamically updated as the algorithm progresses.
-    """
-        self.maze[j][i].visited = True
-
-        frentier_cells = self.find_nighbors((i, j))
-        while frentier_cells:
-            target_cell = random.choice(frentier_cells)
-            new_x, new_y, old_direction = target_cell
-            self.maze[new_y][new_x].visited = True
-            frentier_cells.extend(self.find_nighbors((new_x, new_y)))
-            frentier_cells = self.remove_duplicate_and_visited(frentier_cells)
-            cell = self.find_visited_cell((new_x, new_y))
-            if len(cell) == 1:
-                i, j, new_direction = cell[0][0], cell[0][1], cell[0][2]
-                if old_direction == "left" and new_direction == "right":
-                    self.maze[j][i].west = False
-                    self.maze[new_y][new_x].east = False
-                elif old_direction == "right" and new_direction == "left":
-                    self.maze[j][i].east = False
-                    self.maze[new_y][new_x].west = False
-                elif old_direction == "top" and new_direction == "bottom":
-                    self.maze[j][i].north = False
-                    self.maze[new_y][new_x].south = False
-                elif old_direction == "bottom" and new_direction == "top":
-                    self.maze[j][i].south = False
-                    self.maze[new_y][new_x].north = False
-                    i = new_x
-                    j = new_y
+        Args:
+            i (int): X-coordinate of the starting cell. Defaults to 0.
+            j (int): Y-coordinate of the starting cell. Defaults to 0.
+        """
+        grid = self.maze
+        walls = grid.walls
+        visited = grid.visited
+        width = self.x
+        size = width * self.y
+        randrange = self.rng.randrange
+        choice = self.rng.choice
+
+        # 0: untouched, 1: visited or 42 pattern, 2: in maze, 3: frontier
+        state = grid.closed_map()
+        frontier = array("i")
+
+        index = grid.index(i, j)
+        while True:
+            state[index] = 2
+            visited[index >> 3] |= 1 << (index & 7)
+            x = index % width
+            if x > 0 and not state[index - 1]:
+                state[index - 1] = 3
+                frontier.append(index - 1)
+            if x + 1 < width and not state[index + 1]:
+                state[index + 1] = 3
+                frontier.append(index + 1)
+            if index >= width and not state[index - width]:
+                state[index - width] = 3
+                frontier.append(index - width)
+            if index + width < size and not state[index + width]:
+                state[index + width] = 3
+                frontier.append(index + width)
+            if not frontier:
+                break
+
+            k = randrange(len(frontier))
+            index = frontier[k]
+            frontier[k] = frontier[-1]
+            frontier.pop()
+
+            x = index % width
+            in_maze = []
+            if x > 0 and state[index - 1] == 2:
+                in_maze.append(index - 1)
+            if x + 1 < width and state[index + 1] == 2:
+                in_maze.append(index + 1)
+            if index >= width and state[index - width] == 2:
+                in_maze.append(index - width)
+            if index + width < size and state[index + width] == 2:
+                in_maze.append(index + width)
+            n = choice(in_maze)
+            if n == index - width:
+                walls[index] &= ~NORTH
+                walls[n] &= ~SOUTH
+            elif n == index + width:
+                walls[index] &= ~SOUTH
+                walls[n] &= ~NORTH
+            elif n < index:
+                walls[index] &= ~WEST
+                walls[n] &= ~EAST
             else:
-                cell = random.choice(cell)
-                self.remove_wall(target_cell, cell)
-                i = cell[0]
-                j = cell[1]
+                walls[index] &= ~EAST
+                walls[n] &= ~WEST
+
+    def open_extra_walls(self, ratio: float = EXTRA_WALLS_RATIO) -> int:
+        """
+        Open random walls between neighbouring cells outside the 42 pattern.
+
+        Run after a spanning-tree algorithm, every opened wall adds a loop,
+        so the maze is no longer perfect. The closed inner walls are listed
+        once and a partial Fisher-Yates shuffle picks the ones to open.
+
+        Args:
+            ratio (float): Walls to open per cell of the maze. Defaults to
+            about as many loops as the former Prim's implementation made.
 
-            frentier_cells.remove(target_cell)
+        Returns:
+            int: Number of walls opened.
+        """
+        grid = self.maze
+        walls = grid.walls
+        closed = b"".join(map(grid.blocked_row, range(self.y)))
+        width = self.x
+        size = width * self.y
+        randrange = self.rng.randrange
+
+        # 2 * index for the east wall of a cell, 2 * index + 1 for its south
+        candidates = array("i")
+        for index in range(size):
+            if closed[index]:
+                continue
+            mask = walls[index]
+            if (mask & EAST and (index + 1) % width
+                    and not closed[index + 1]):
+                candidates.append(2 * index)
+            if (mask & SOUTH and index + width < size
+                    and not closed[index + width]):
+                candidates.append(2 * index + 1)
+
+        count = min(len(candidates), int(size * ratio))
+        for k in range(count):
+            j = k + randrange(len(candidates) - k)
+            wall = candidates[j]
+            candidates[j] = candidates[k]
+            index = wall >> 1
+            grid.carve(index, index + (width if wall & 1 else 1))
+        return count
 
     def creat_42_pathren(self) -> None:
         """
         Generate a predefined '42' shaped path inside the maze.
 
-        The path is marked by setting the _42_path attribute of cells to True.
+        The path is marked in the grid's 42-pattern bitset, which is what the
+        ``_42_path`` attribute of the cell views reports.
         Ensures the 42 pattern is centered in the maze and does not overlap
         walls.
         """
-        x = self.x // 2 - 3
-        y = self.y // 2 - 3
-        first_y = y
-        # show 4
-        for move in range(0, 4):
-            self.maze[y + move][x]._42_path = True
-            last_y = move
-        y += last_y
-        for move in range(1, 3):
-            self.maze[y][x + move]._42_path = True
-            last_x = move
-        x += last_x
-        for move in range(1, 4):
-            self.maze[y + move][x]._42_path = True
-            last_y = move
-        y += last_y
-        y = first_y
-        x += 2
-        # show 2
-        for move in range(0, 3):
-            self.maze[y][x + move]._42_path = True
-            last_x = move
-        x += last_x
-        for move in range(1, 4):
-            self.maze[y + move][x]._42_path = True
-            last_y = move
-        y += last_y
-        for move in range(1, 3):
-            self.maze[y][x - move]._42_path = True
-            last_x = move
-        x -= last_x
-        for move in range(1, 4):
-            self.maze[y + move][x]._42_path = True
-            last_y = move
-        y += last_y
-        for move in range(1, 3):
-            self.maze[y][x + move]._42_path = True
-            last_x = move
-        x += last_x
-
-    #  i need to fix return
+        for x, y in pattern_42_cells(self.x, self.y):
+            self.maze.mark_blocked(self.maze.index(x, y))
+
     @staticmethod
-    def print_walls_as_hex(cell: Cell) -> Any:
+    def print_walls_as_hex(cell: Any) -> Any:
         """
         Convert the walls of a cell into a single hexadecimal character.
 
         Each wall corresponds to a bit: N=1, E=2, S=4, W=8 (F=all walls).
 
         Args:
-            cell (Cell): The cell to convert.
+            cell (Cell | CellView): The cell to convert.
 
         Returns:
             str: Hexadecimal representation of the cell's walls.
         """
-        if (cell.north and cell.east and cell.south and cell.west):
-            return "F"
-        elif (not cell.north and cell.east and cell.south and cell.west):
-            return "E"
-        elif (cell.north and not cell.east and cell.south and cell.west):
-            return "D"
-        elif (not cell.north and not cell.east and cell.south
-              and cell.west):
-            return "C"
-        elif (cell.north and cell.east and not cell.south and cell.west):
-            return "B"
-        elif (not cell.north and cell.east and not cell.south and cell.west):
-            return "A"
-        elif (cell.north and not cell.east and not cell.south and cell.west):
-            return "9"
-        elif (not cell.north and not cell.east and not cell.south
-              and cell.west):
-            return "8"
-        elif (cell.north and cell.east and cell.south and not cell.west):
-            return "7"
-        elif (not cell.north and cell.east and cell.south and not cell.west):
-            return "6"
-        elif (cell.north and not cell.east and cell.south and not cell.west):
-            return "5"
-        elif (not cell.north and not cell.east and cell.south
-              and not cell.west):
-            return "4"
-        elif (cell.north and cell.east and not cell.south and not cell.west):
-            return "3"
-        elif (not cell.north and cell.east and not cell.south
-              and not cell.west):
-            return "2"
-        elif (cell.north and not cell.east and not cell.south
-              and not cell.west):
-            return "1"
-        elif (not cell.north and not cell.east and not cell.south
-              and not cell.west):
-            return "0"
-        return None
-
-    # this function those not finish
+        mask = getattr(cell, "mask", None)
+        if mask is None:
+            mask = ((NORTH if cell.north else 0) | (EAST if cell.east else 0)
+                    | (SOUTH if cell.south else 0)
+                    | (WEST if cell.west else 0))
+        return HEX_DIGITS[mask]
+
+    def hex_rows(self, rows_per_chunk: int = 0) -> Iterator[bytes]:
+        """
+        Encode the maze walls as hex text, many rows at a time.
+
+        Each chunk is produced by a single ``bytes.translate`` over the wall
+        masks of several rows, followed by a join that inserts the line
+        breaks, so no Python code runs per cell.
+
+        Args:
+            rows_per_chunk (int): Number of rows per chunk. Defaults to as
+            many rows as fit in about 1 MiB of output.
+
+        Yields:
+            bytes: Consecutive hex rows, each terminated by a newline.
+        """
+        width = self.x
+        walls = self.maze.walls
+        if rows_per_chunk <= 0:
+            rows_per_chunk = max(1, (1 << 20) // (width + 1))
+        for first in range(0, self.y, rows_per_chunk):
+            last = min(self.y, first + rows_per_chunk)
+            block = bytes(walls[first * width:last * width]).translate(
+                HEX_TABLE)
+            yield b"".join([block[i:i + width] + b"\n"
+                            for i in range(0, len(block), width)])
+
     def creat_output_file(self, path: Any) -> None:
         """
         Save the maze to a file with walls in hex and the path, entry, and
         exit.
 
+        The hex grid is written in large chunks from ``hex_rows``.
+
         Args:
             path (list[tuple[int, int]]): The solution path to print in the
             file.
         """
-        with open(self.out_file, "w") as file:
-            for y in range(self.y):
-                for x in range(self.x):
-                    file.write(f"{self.print_walls_as_hex(self.maze[y][x])}")
-                file.write("\n")
-            file.write("\n")
-            file.write(f"{self.entry[0]}, {self.entry[1]}\n"
-                       f"{self.exit[0]}, {self.exit[1]}\n")
-            file.write(f"{self.print_path(path)}\n")
+        with open(self.out_file, "wb") as file:
+            for chunk in self.hex_rows():
+                file.write(chunk)
+            file.write(f"\n{self.entry[0]}, {self.entry[1]}\n"
+                       f"{self.exit[0]}, {self.exit[1]}\n"
+                       f"{self.print_path(path)}\n".encode())
 
     @staticmethod
     def print_path(path: list[tuple[int, int]]) -> str:
@@ -0,0 +1,307 @@
+"""Compact binary maze file format with a memory-mapped loader.
+
+Layout (all integers little-endian)::
+
+    header    48 bytes, see ``HEADER``
+    walls     ceil(width * height / 2) bytes, two cells per byte: the cell
+              with the even flat index in the low nibble, the next cell in
+              the high nibble (N=1, E=2, S=4, W=8 as in the hex file)
+    solution  optional, ceil(moves / 4) bytes, four 2-bit moves per byte
+              starting from the low bits (N=0, E=1, S=2, W=3)
+
+``load_packed`` maps the file with ``mmap`` and exposes the walls through a
+read-only ``PackedGrid`` that decodes nibbles straight from the mapping,
+so reopening a huge maze costs neither parsing nor a copy of the walls.
+"""
+
+import mmap
+import struct
+from typing import Any, Iterator, Optional
+from maze.grid import Grid
+from maze.mazegen import MazeGenerator, pattern_42_cells
+from utils.errors import InvalidMazeFile
+
+MAGIC = b"AMZB"
+VERSION = 1
+# magic, version, algorithm, flags, width, height, entry x/y, exit x/y,
+# seed (-1 when unknown), number of solution moves
+HEADER = struct.Struct("<4sBBHIIIIIIqQ")
+FLAG_SOLUTION = 1
+FLAG_42_PATTERN = 2
+ALGORITHMS = ("unknown", "backtracker", "prims", "eller", "binary_tree",
+              "sidewinder")
+
+_MOVES = "NESW"
+_MOVE_CODES = bytes.maketrans(_MOVES.encode(), bytes(range(4)))
+_MOVE_BYTES = ["".join(_MOVES[(value >> shift) & 3] for shift in (0, 2, 4, 6))
+               for value in range(256)]
+_LOW_NIBBLE = bytes(value & 0xF for value in range(256))
+_HIGH_NIBBLE = bytes(value >> 4 for value in range(256))
+_CHUNK = 1 << 20
+
+
+def _or_bytes(a: bytes, b: bytes) -> bytes:
+    """Return the bytewise OR of two buffers of equal length."""
+    return (int.from_bytes(a, "little")
+            | int.from_bytes(b, "little")).to_bytes(len(a), "little")
+
+
+def pack_walls(walls: Any) -> Iterator[bytes]:
+    """Pack one-byte-per-cell wall masks two cells per byte.
+
+    Args:
+        walls: Buffer of wall masks (values 0-15).
+
+    Yields:
+        bytes: Consecutive chunks of the packed walls section.
+    """
+    shift = bytes(((value << 4) & 0xFF) for value in range(256))
+    for start in range(0, len(walls), _CHUNK):
+        chunk = bytes(walls[start:start + _CHUNK])
+        low = chunk[0::2]
+        high = chunk[1::2].translate(shift)
+        if len(high) < len(low):
+            high += b"\0"
+        yield _or_bytes(low, high)
+
+
+def unpack_walls(packed: Any, size: int) -> bytearray:
+    """Unpack a packed walls section back to one byte per cell.
+
+    Args:
+        packed: Buffer holding the packed walls.
+        size (int): Number of cells to unpack.
+
+    Returns:
+        bytearray: ``size`` wall masks.
+    """
+    packed = bytes(packed)
+    walls = bytearray(len(packed) * 2)
+    walls[0::2] = packed.translate(_LOW_NIBBLE)
+    walls[1::2] = packed.translate(_HIGH_NIBBLE)
+    del walls[size:]
+    return walls
+
+
+def pack_moves(moves: str) -> bytes:
+    """Pack a N/E/S/W direction string four moves per byte."""
+    codes = moves.encode().translate(_MOVE_CODES)
+    codes += b"\0" * (-len(codes) % 4)
+    packed = codes[0::4]
+    for shift, part in ((2, codes[1::4]), (4, codes[2::4]),
+                        (6, codes[3::4])):
+        packed = _or_bytes(packed, part.translate(
+            bytes(((value << shift) & 0xFF) for value in range(256))))
+    return packed
+
+
+def unpack_moves(packed: Any, count: int) -> str:
+    """Unpack ``count`` moves packed by ``pack_moves``."""
+    table = _MOVE_BYTES
+    return "".join([table[value] for value in bytes(packed)])[:count]
+
+
+class PackedWalls:
+    """
+    Read-only sequence of wall masks decoded from a packed buffer.
+
+    Indexing with an integer decodes one nibble; indexing with a slice
+    returns the unpacked masks as ``bytes``, so code written for the
+    ``bytearray`` of a ``Grid`` can read it unchanged.
+
+    Attributes:
+        packed (memoryview): The packed walls section.
+        size (int): Number of cells.
+    """
+    __slots__ = ("packed", "size")
+
+    def __init__(self, packed: Any, size: int) -> None:
+        """Wrap the packed buffer of a grid of ``size`` cells."""
+        self.packed = memoryview(packed)
+        self.size = size
+
+    def __len__(self) -> int:
+        """Return the number of cells."""
+        return self.size
+
+    def __getitem__(self, index: Any) -> Any:
+        """Return one mask, or the unpacked masks of a slice as bytes."""
+        if isinstance(index, slice):
+            start, stop, step = index.indices(self.size)
+            if step != 1:
+                raise ValueError("PackedWalls slices must be contiguous")
+            if stop <= start:
+                return b""
+            walls = unpack_walls(
+                self.packed[start >> 1:(stop + 1) >> 1], stop - (start & ~1))
+            return bytes(walls[start & 1:])
+        if index < 0:
+            index += self.size
+        if not 0 <= index < self.size:
+            raise IndexError("cell index out of range")
+        return (self.packed[index >> 1] >> ((index & 1) << 2)) & 0xF
+
+
+class PackedGrid(Grid):
+    """
+    Read-only ``Grid`` whose walls stay packed in a (mapped) buffer.
+
+    Reads work like on a ``Grid`` (``grid[y][x].north``, ``grid.walls[i]``,
+    ``grid.mask(i)``); carving raises ``TypeError``.
+    """
+    __slots__ = ()
+
+    def __init__(self, width: int, height: int, packed: Any) -> None:
+        """
+        Wrap a packed walls section without copying it.
+
+        Args:
+            width (int): Number of columns.
+            height (int): Number of rows.
+            packed: Buffer holding ``ceil(width * height / 2)`` bytes.
+        """
+        size = width * height
+        self.width = width
+        self.height = height
+        self.walls = PackedWalls(packed, size)  # type: ignore[assignment]
+        self.visited = bytearray((size + 7) >> 3)
+        self.blocked = bytearray((size + 7) >> 3)
+
+    def mask(self, index: int) -> int:
+        """Return the wall mask of the cell at ``index``."""
+        walls: PackedWalls = self.walls  # type: ignore[assignment]
+        return (walls.packed[index >> 1] >> ((index & 1) << 2)) & 0xF
+
+    def unpacked(self) -> Grid:
+        """Return a writable ``Grid`` copy with one byte per cell."""
+        grid = Grid.from_walls(self.width, self.height, self.walls[:])
+        grid.blocked[:] = self.blocked
+        return grid
+
+
+class PackedMaze:
+    """
+    A maze opened from a packed file.
+
+    Keeps the file mapped for as long as the object lives; use it as a
+    context manager or call ``close`` to release the mapping.
+
+    Attributes:
+        grid (PackedGrid): The maze grid, read straight from the mapping.
+        entry (tuple[int, int]): Entry point coordinates.
+        exit (tuple[int, int]): Exit point coordinates.
+        seed (int | None): Seed the maze was generated with, if known.
+        algorithm (str): Name of the generation algorithm.
+        solution (str | None): Solution as N/E/S/W moves, if stored.
+    """
+
+    def __init__(self, path: str) -> None:
+        """
+        Map ``path`` and parse its header.
+
+        Args:
+            path (str): Path of a file written by ``save_packed``.
+
+        Raises:
+            InvalidMazeFile: If the file is not a packed maze or is
+            truncated.
+        """
+        with open(path, "rb") as file:
+            try:
+                self._map = mmap.mmap(file.fileno(), 0,
+                                      access=mmap.ACCESS_READ)
+            except ValueError:
+                raise InvalidMazeFile(f"Error: '{path}' is empty")
+        self._view = memoryview(self._map)
+        if len(self._view) < HEADER.size:
+            self.close()
+            raise InvalidMazeFile(f"Error: '{path}' is truncated")
+        (magic, version, algorithm, flags, width, height, entry_x, entry_y,
+         exit_x, exit_y, seed, moves) = HEADER.unpack_from(self._view)
+        walls_size = (width * height + 1) >> 1
+        solution_size = (moves + 3) >> 2 if flags & FLAG_SOLUTION else 0
+        if magic != MAGIC or version != VERSION:
+            self.close()
+            raise InvalidMazeFile(f"Error: '{path}' is not a packed maze")
+        if len(self._view) < HEADER.size + walls_size + solution_size:
+            self.close()
+            raise InvalidMazeFile(f"Error: '{path}' is truncated")
+
+        walls_end = HEADER.size + walls_size
+        self.grid = PackedGrid(width, height,
+                               self._view[HEADER.size:walls_end])
+        if flags & FLAG_42_PATTERN:
+            for x, y in pattern_42_cells(width, height):
+                self.grid.mark_blocked(self.grid.index(x, y))
+        self.entry = (entry_x, entry_y)
+        self.exit = (exit_x, exit_y)
+        self.seed: Optional[int] = None if seed < 0 else seed
+        self.algorithm = (ALGORITHMS[algorithm]
+                          if algorithm < len(ALGORITHMS) else "unknown")
+        self.solution: Optional[str] = None
+        if flags & FLAG_SOLUTION:
+            self.solution = unpack_moves(
+                self._view[walls_end:walls_end + solution_size], moves)
+
+    def close(self) -> None:
+        """Release the file mapping."""
+        grid = getattr(self, "grid", None)
+        if grid is not None:
+            grid.walls.packed.release()
+        self._view.release()
+        self._map.close()
+
+    def __enter__(self) -> "PackedMaze":
+        """Return the maze itself."""
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        """Release the file mapping."""
+        self.close()
+
+
+def save_packed(maze: MazeGenerator, path: str,
+                solution: Optional[str] = None, seed: Optional[int] = None,
+                algorithm: str = "unknown") -> None:
+    """
+    Write a generated maze to ``path`` in the packed binary format.
+
+    Args:
+        maze (MazeGenerator): The generated maze.
+        path (str): Path of the file to write.
+        solution (str | None): Solution as N/E/S/W moves, e.g. from
+        ``MazeGenerator.print_path``.
+        seed (int | None): Seed the maze was generated with.
+        algorithm (str): One of ``ALGORITHMS``.
+    """
+    grid = maze.maze
+    flags = 0
+    if solution is not None:
+        flags |= FLAG_SOLUTION
+    if any(grid.blocked):
+        flags |= FLAG_42_PATTERN
+    code = ALGORITHMS.index(algorithm) if algorithm in ALGORITHMS else 0
+    with open(path, "wb") as file:
+        file.write(HEADER.pack(
+            MAGIC, VERSION, code, flags, grid.width, grid.height,
+            maze.entry[0], maze.entry[1], maze.exit[0], maze.exit[1],
+            -1 if seed is None else seed,
+            len(solution) if solution is not None else 0))
+        for chunk in pack_walls(grid.walls):
+            file.write(chunk)
+        if solution is not None:
+            file.write(pack_moves(solution))
+
+
+def load_packed(path: str) -> PackedMaze:
+    """
+    Open a packed maze file without copying its walls.
+
+    Args:
+        path (str): Path of a file written by ``save_packed``.
+
+    Returns:
+        PackedMaze: The mapped maze; ``.grid`` can be passed to
+        ``pathfinder`` and the renderer like ``MazeGenerator.maze``.
+    """
+    return PackedMaze(path)
@@ -1,26 +1,308 @@
 """Pathfinding module using Breadth-First Search algorithm.
 
 This module provides functionality to find the shortest path through a maze
-from an entry point to an exit point using BFS traversal.
+from an entry point to an exit point using BFS traversal. Bidirectional BFS
+and A* are available as alternative strategies through ``solve``; new ones
+can be added with ``register_solver``. ``DistanceField`` precomputes the
+distance to the exit and the next move from every cell, so hints toward a
+fixed exit need no search at all, and ``PathTracker`` keeps such a path up
+to date while the start cell moves one step at a time. ``solve_batch``
+answers many (source, target) queries on one maze with one search per
+source, or with one ``maze.tree_index.TreeIndex`` for perfect mazes.
+
+The search runs over flat cell indices (``y * width + x``) and reads
+neighbours straight from the wall bitmasks of the grid. Its parent, queue
+and visited buffers are preallocated once per thread and reused by every
+query of that thread; "visited" is a generation stamp per cell, so
+starting a new search never has to clear anything.
 """
 
+import heapq
+import threading
+from array import array
 from collections import deque
-from typing import Any
+from typing import Any, Callable, NamedTuple, Optional
+from maze.grid import ALL_WALLS, EAST, NORTH, SOUTH, WEST
+
+
+class SearchBuffers:
+    """
+    Reusable buffers for searches over a grid of up to ``size`` cells.
+
+    Attributes:
+        size (int): Number of cells the buffers can hold.
+        parent (array): Parent index of every reached cell.
+        stamp (array): Generation in which each cell was last reached.
+        queue (array): BFS queue of cell indices.
+        cost (array): Distance from the source of every reached cell.
+        generation (int): Stamp of the current search.
+    """
+    __slots__ = ("size", "parent", "stamp", "queue", "cost", "generation")
+
+    def __init__(self) -> None:
+        """Create empty buffers; they grow on first use."""
+        self.size = 0
+        self.parent = array("i")
+        self.stamp = array("I")
+        self.queue = array("i")
+        self.cost = array("i")
+        self.generation = 0
+
+    def start(self, size: int) -> int:
+        """
+        Prepare the buffers for a new search and return its generation.
+
+        Buffers only grow, and stamps are only cleared when the 32-bit
+        generation counter wraps around.
 
+        Args:
+            size (int): Number of cells of the grid to search.
+        """
+        if size > self.size:
+            grow = size - self.size
+            self.parent.extend(array("i", [0]) * grow)
+            self.stamp.extend(array("I", [0]) * grow)
+            self.queue.extend(array("i", [0]) * grow)
+            self.cost.extend(array("i", [0]) * grow)
+            self.size = size
+        self.generation += 1
+        if self.generation > 0xFFFFFFFF:
+            self.stamp = array("I", [0]) * self.size
+            self.generation = 1
+        return self.generation
 
-def init_path(maze: Any) -> Any:
-    """Initialize maze cells for BFS pathfinding.
 
-    Resets the BFS-related attributes on all cells in the maze to prepare
-    for a new pathfinding operation.
+UNREACHABLE = 0xFFFFFFFF
+
+
+class _ThreadBuffers(threading.local):
+    """The shared search buffers, one set per thread."""
+
+    def __init__(self) -> None:
+        """Create this thread's buffers."""
+        self.forward = SearchBuffers()
+        self.backward = SearchBuffers()
+
+
+_BUFFERS = _ThreadBuffers()
+
+Solver = Callable[[Any, int, int, int, int], tuple[list[int], int]]
+SOLVERS: dict[str, Solver] = {}
+
+
+class SolveResult(NamedTuple):
+    """
+    Result of ``solve``.
+
+    Attributes:
+        path (list[tuple[int, int]]): (x, y) cells from entry to exit, empty
+            if the exit cannot be reached.
+        expanded (int): Number of nodes the strategy expanded.
+    """
+    path: list[tuple[int, int]]
+    expanded: int
+
+
+def register_solver(name: str) -> Callable[[Solver], Solver]:
+    """Register a search function as the ``name`` strategy of ``solve``.
+
+    A solver is called as ``solver(walls, width, size, source, target)``
+    with flat cell indices and returns ``(path, expanded)`` like ``bfs``.
+    """
+    def decorator(solver: Solver) -> Solver:
+        SOLVERS[name] = solver
+        return solver
+    return decorator
+
+
+def walls_of(maze: Any, WIDTH: int, HEIGHT: int) -> Any:
+    """Return the flat wall-mask buffer of a maze.
 
     Args:
-        maze: A 2D array of cell objects representing the maze.
+        maze: A ``Grid`` (or anything with a ``walls`` buffer), or a 2D list
+            of cell objects with north/east/south/west attributes.
+        WIDTH: The width of the maze in cells.
+        HEIGHT: The height of the maze in cells.
+
+    Returns:
+        The grid's own wall buffer, or a new ``bytearray`` built from the
+        cells for 2D lists.
     """
-    for row in maze:
-        for cell in row:
-            cell.BFSvisited = False
-            cell.parent = None
+    walls = getattr(maze, "walls", None)
+    if walls is not None:
+        return walls
+    return bytearray(
+        (NORTH if cell.north else 0) | (EAST if cell.east else 0)
+        | (SOUTH if cell.south else 0) | (WEST if cell.west else 0)
+        for row in maze for cell in row)
+
+
+@register_solver("bfs")
+def bfs(walls: Any, width: int, size: int, source: int, target: int,
+        buffers: Optional[SearchBuffers] = None) -> tuple[list[int], int]:
+    """Breadth-first search between two flat cell indices.
+
+    This is ``bfs_all`` with a single target, plus the walk back up the
+    search tree. Neighbours are visited in N, E, S, W order.
+
+    Args:
+        walls: Wall mask of every cell.
+        width: The width of the maze in cells.
+        size: Number of cells.
+        source: Flat index of the start cell.
+        target: Flat index of the goal cell.
+        buffers: Buffers to search with; defaults to the current thread's
+            shared buffers.
+
+    Returns:
+        A tuple of the path as flat indices from source to target (empty if
+        the target cannot be reached) and the number of nodes expanded.
+    """
+    if buffers is None:
+        buffers = _BUFFERS.forward
+    expanded = bfs_all(walls, width, size, source, {target}, buffers)
+    if not 0 <= target < size or buffers.stamp[target] != buffers.generation:
+        return [], expanded
+    parent = buffers.parent
+    path = [target]
+    i = target
+    while i != source:
+        i = parent[i]
+        path.append(i)
+    path.reverse()
+    return path, expanded
+
+
+def open_neighbours(walls: Any, width: int, size: int, i: int) -> list[int]:
+    """Return the open neighbours of cell ``i`` in N, E, S, W order."""
+    m = walls[i]
+    found = []
+    if not m & NORTH and i >= width:
+        found.append(i - width)
+    if not m & EAST and (i + 1) % width:
+        found.append(i + 1)
+    if not m & SOUTH and i + width < size:
+        found.append(i + width)
+    if not m & WEST and i % width:
+        found.append(i - 1)
+    return found
+
+
+@register_solver("bidirectional")
+def bidirectional(walls: Any, width: int, size: int, source: int,
+                  target: int) -> tuple[list[int], int]:
+    """Breadth-first search from both ends until the frontiers meet.
+
+    Whole levels are expanded at a time, always on the side with the
+    smaller frontier; the shortest meeting found within a level gives the
+    shortest path.
+
+    Returns:
+        A tuple of the path as flat indices from source to target (empty if
+        the target cannot be reached) and the number of nodes expanded.
+    """
+    sides = (_BUFFERS.forward, _BUFFERS.backward)
+    generations = [side.start(size) for side in sides]
+    frontiers = [[source], [target]]
+    for side, generation, start in zip(sides, generations, (source, target)):
+        side.stamp[start] = generation
+        side.parent[start] = start
+        side.cost[start] = 0
+    expanded = 0
+    meet = source if source == target else -1
+    while meet < 0 and frontiers[0] and frontiers[1]:
+        k = 0 if len(frontiers[0]) <= len(frontiers[1]) else 1
+        here, there = sides[k], sides[1 - k]
+        generation, other = generations[k], generations[1 - k]
+        best = -1
+        level = []
+        for i in frontiers[k]:
+            expanded += 1
+            for n in open_neighbours(walls, width, size, i):
+                if here.stamp[n] == generation:
+                    continue
+                here.stamp[n] = generation
+                here.parent[n] = i
+                here.cost[n] = here.cost[i] + 1
+                level.append(n)
+                if there.stamp[n] == other and (
+                        best < 0 or here.cost[n] + there.cost[n]
+                        < here.cost[best] + there.cost[best]):
+                    best = n
+        frontiers[k] = level
+        meet = best
+    if meet < 0:
+        return [], expanded
+    forward, backward = sides
+    path = [meet]
+    i = meet
+    while i != source:
+        i = forward.parent[i]
+        path.append(i)
+    path.reverse()
+    i = meet
+    while i != target:
+        i = backward.parent[i]
+        path.append(i)
+    return path, expanded
+
+
+@register_solver("astar")
+def astar(walls: Any, width: int, size: int, source: int,
+          target: int) -> tuple[list[int], int]:
+    """A* search with the Manhattan distance to the target as heuristic.
+
+    The open set is a binary heap of ``(f, h, index)`` entries; stale
+    entries left behind by a cheaper route are skipped when popped.
+
+    Returns:
+        A tuple of the path as flat indices from source to target (empty if
+        the target cannot be reached) and the number of nodes expanded.
+    """
+    buffers = _BUFFERS.forward
+    generation = buffers.start(size)
+    parent = buffers.parent
+    stamp = buffers.stamp
+    cost = buffers.cost
+    tx, ty = target % width, target // width
+    stamp[source] = generation
+    parent[source] = source
+    cost[source] = 0
+    h = abs(source % width - tx) + abs(source // width - ty)
+    heap = [(h, h, source)]
+    expanded = 0
+    found = False
+    while heap:
+        f, h, i = heapq.heappop(heap)
+        g = f - h
+        if g > cost[i]:
+            continue
+        expanded += 1
+        if i == target:
+            found = True
+            break
+        for n in open_neighbours(walls, width, size, i):
+            if stamp[n] == generation and cost[n] <= g + 1:
+                continue
+            stamp[n] = generation
+            parent[n] = i
+            cost[n] = g + 1
+            h = abs(n % width - tx) + abs(n // width - ty)
+            heapq.heappush(heap, (g + 1 + h, h, n))
+    if not found:
+        return [], expanded
+    path = [target]
+    i = target
+    while i != source:
+        i = parent[i]
+        path.append(i)
+    path.reverse()
+    return path, expanded
+
+
+def to_cells(path: list[int], WIDTH: int) -> list[tuple[int, int]]:
+    """Convert a path of flat indices into (x, y) tuples."""
+    return [(i % WIDTH, i // WIDTH) for i in path]
 
 
 def pathfinder(maze: Any, ENTRY: Any, EXIT: Any, WIDTH: Any,
@@ -31,7 +313,7 @@ def pathfinder(maze: Any, ENTRY: Any, EXIT: Any, WIDTH: Any,
     to the exit point, respecting maze walls.
 
     Args:
-        maze: A 2D array of cell objects representing the maze.
+        maze: A ``Grid`` or 2D array of cell objects representing the maze.
         ENTRY: A tuple (x, y) representing the starting coordinates.
         EXIT: A tuple (x, y) representing the target coordinates.
         WIDTH: The width of the maze in cells.
@@ -39,41 +321,445 @@ def pathfinder(maze: Any, ENTRY: Any, EXIT: Any, WIDTH: Any,
 
     Returns:
         A list of (x, y) tuples representing the path from ENTRY to EXIT,
-        in order from start to finish.
+        in order from start to finish (empty if EXIT cannot be reached).
     """
-    init_path(maze)
-    q = deque([ENTRY])
-    x, y = ENTRY
-    maze[y][x].BFSvisited = True
-    while q:
+    path, _ = bfs(walls_of(maze, WIDTH, HEIGHT), WIDTH, WIDTH * HEIGHT,
+                  ENTRY[1] * WIDTH + ENTRY[0], EXIT[1] * WIDTH + EXIT[0])
+    return to_cells(path, WIDTH)
 
-        x, y = q.popleft()
 
-        if (x, y) == EXIT:
-            break
+def solve(maze: Any, ENTRY: Any, EXIT: Any, WIDTH: Any, HEIGHT: Any,
+          strategy: str = "bfs") -> SolveResult:
+    """Find the shortest path through a maze with the chosen strategy.
 
-        directions = [
-            (maze[y][x].north, x, y - 1),
-            (maze[y][x].east, x + 1, y),
-            (maze[y][x].south, x, y + 1),
-            (maze[y][x].west, x - 1, y)
-        ]
-
-        for d, dx, dy in directions:
-            if (0 <= dx < WIDTH and 0 <= dy < HEIGHT
-               and d is False and maze[dy][dx].BFSvisited is False):
-                maze[dy][dx].BFSvisited = True
-                q.append((dx, dy))
-                maze[dy][dx].parent = (x, y)
-
-    path = []
-    path.append((x, y))
-    while True:
-        cx, cy = maze[y][x].parent
-        path.append((cx, cy))
-        if (cx, cy) == ENTRY:
-            break
-        x = cx
-        y = cy
-    path.reverse()
-    return path
+    Args:
+        maze: A ``Grid`` or 2D array of cell objects representing the maze.
+        ENTRY: A tuple (x, y) representing the starting coordinates.
+        EXIT: A tuple (x, y) representing the target coordinates.
+        WIDTH: The width of the maze in cells.
+        HEIGHT: The height of the maze in cells.
+        strategy: Name of a registered solver: "bfs", "bidirectional" or
+            "astar".
+
+    Returns:
+        SolveResult: The path (same format as ``pathfinder``) and the
+        number of nodes expanded.
+
+    Raises:
+        ValueError: If ``strategy`` is not a registered solver.
+    """
+    if strategy not in SOLVERS:
+        raise ValueError(f"Error: unknown solver '{strategy}' "
+                         f"(choose from {', '.join(SOLVERS)})")
+    path, expanded = SOLVERS[strategy](
+        walls_of(maze, WIDTH, HEIGHT), WIDTH, WIDTH * HEIGHT,
+        ENTRY[1] * WIDTH + ENTRY[0], EXIT[1] * WIDTH + EXIT[0])
+    return SolveResult(to_cells(path, WIDTH), expanded)
+
+
+class DistanceField:
+    """
+    Distance to a fixed target and next move from every cell of a maze.
+
+    Built with one BFS from the target; afterwards the distance from any
+    cell is an O(1) lookup and its path is found by following the next-step
+    directions, without searching.
+
+    Attributes:
+        width (int): The width of the maze in cells.
+        target (tuple[int, int]): The (x, y) cell every path leads to.
+        distance (array): ``uint32`` moves to the target per flat cell,
+            ``UNREACHABLE`` for cells with no path.
+        step (bytearray): Wall bit (N=1, E=2, S=4, W=8) of the first move
+            from each cell, 0 at the target and on unreachable cells.
+        order (array): ``uint32`` preorder number of each cell in the tree
+            of first moves, rooted at the target; ``UNREACHABLE`` for cells
+            with no path.
+        subtree (array): ``uint32`` number of cells whose path runs through
+            each cell, itself included; 0 for cells with no path.
+    """
+    __slots__ = ("width", "target", "distance", "step", "order", "subtree")
+
+    def __init__(self, maze: Any, WIDTH: int, HEIGHT: int,
+                 EXIT: tuple[int, int]) -> None:
+        """
+        Run the BFS from ``EXIT`` and fill the field.
+
+        Args:
+            maze: A ``Grid`` or 2D array of cell objects.
+            WIDTH: The width of the maze in cells.
+            HEIGHT: The height of the maze in cells.
+            EXIT: (x, y) of the target cell.
+        """
+        size = WIDTH * HEIGHT
+        self.width = WIDTH
+        self.target = EXIT
+        self.distance = array("I", [UNREACHABLE]) * size
+        self.step = bytearray(size)
+        _, reached = bfs(walls_of(maze, WIDTH, HEIGHT), WIDTH, size,
+                         EXIT[1] * WIDTH + EXIT[0], -1)
+        # cells leave the queue in BFS order, so parents come first
+        buffers = _BUFFERS.forward
+        parent = buffers.parent
+        distance = self.distance
+        step = self.step
+        cells = buffers.queue[:reached]
+        distance[cells[0]] = 0
+        for n in cells[1:]:
+            i = parent[n]
+            distance[n] = distance[i] + 1
+            if i == n - WIDTH:
+                step[n] = NORTH
+            elif i == n + WIDTH:
+                step[n] = SOUTH
+            elif i == n + 1:
+                step[n] = EAST
+            else:
+                step[n] = WEST
+        # preorder intervals: the cells whose path runs through a cell get
+        # the numbers order[i] to order[i] + subtree[i] - 1
+        self.subtree = subtree = array("I", bytes(4 * size))
+        for n in cells:
+            subtree[n] = 1
+        for n in reversed(cells[1:]):
+            subtree[parent[n]] += subtree[n]
+        self.order = order = array("I", [UNREACHABLE]) * size
+        following = array("I", bytes(4 * size))
+        order[cells[0]] = 0
+        following[cells[0]] = 1
+        for n in cells[1:]:
+            i = parent[n]
+            order[n] = following[i]
+            following[i] += subtree[n]
+            following[n] = order[n] + 1
+
+    def distance_from(self, cell: tuple[int, int]) -> int:
+        """Return the number of moves from ``cell`` to the target, or
+        ``UNREACHABLE``."""
+        return self.distance[cell[1] * self.width + cell[0]]
+
+    def on_path(self, cell: tuple[int, int], start: tuple[int, int]) -> bool:
+        """
+        Return True if ``cell`` lies on the path from ``start`` to the target.
+
+        An O(1) check on the preorder intervals, without following the path.
+        """
+        width = self.width
+        i = cell[1] * width + cell[0]
+        j = start[1] * width + start[0]
+        return 0 <= self.order[j] - self.order[i] < self.subtree[i]
+
+    def path_from(self, cell: tuple[int, int]) -> list[tuple[int, int]]:
+        """
+        Return the shortest path from ``cell`` to the target.
+
+        Returns:
+            list[tuple[int, int]]: (x, y) cells in the same format as
+            ``pathfinder``, empty if the target cannot be reached.
+        """
+        width = self.width
+        i = cell[1] * width + cell[0]
+        if self.distance[i] == UNREACHABLE:
+            return []
+        offsets = {NORTH: -width, EAST: 1, SOUTH: width, WEST: -1}
+        step = self.step
+        path = [i]
+        while step[i]:
+            i += offsets[step[i]]
+            path.append(i)
+        return to_cells(path, width)
+
+
+class PathTracker:
+    """
+    Shortest path from a moving cell to a fixed target, kept up to date.
+
+    After a one-cell move the path is repaired in O(1): stepping onto the
+    next cell of the path drops the first cell, and in a perfect maze
+    stepping off the path prepends the new cell (the only way back runs
+    through the previous one). Any other move, such as a jump, falls back
+    to a full solve.
+
+    Attributes:
+        solve (Callable): Returns the path from a cell to the target, e.g.
+            ``DistanceField.path_from``.
+        perfect (bool): True if the maze has no loops.
+        cells (deque): The current path, from the tracked cell to the
+            target.
+        full_solves (int): Number of times ``solve`` was called.
+    """
+    __slots__ = ("solve", "perfect", "cells", "full_solves")
+
+    def __init__(self, solve: Callable[[tuple[int, int]],
+                                       list[tuple[int, int]]],
+                 start: tuple[int, int], perfect: bool = True) -> None:
+        """
+        Solve once from ``start``.
+
+        Args:
+            solve: Function returning the path from a cell to the target.
+            start: (x, y) of the tracked cell.
+            perfect: True if the maze has no loops; otherwise only moves
+                along the path are repaired incrementally.
+        """
+        self.solve = solve
+        self.perfect = perfect
+        self.full_solves = 0
+        self.cells: deque[tuple[int, int]] = deque()
+        self.reset(start)
+
+    def reset(self, cell: tuple[int, int]) -> None:
+        """Recompute the path from ``cell`` with a full solve."""
+        self.cells = deque(self.solve(cell))
+        self.full_solves += 1
+
+    def move(self, cell: tuple[int, int]) -> None:
+        """
+        Update the path after the tracked cell moved to ``cell``.
+
+        Args:
+            cell: The new (x, y) of the tracked cell.
+        """
+        cells = self.cells
+        if not cells:
+            self.reset(cell)
+            return
+        x, y = cells[0]
+        if cell == (x, y):
+            return
+        if len(cells) > 1 and cell == cells[1]:
+            cells.popleft()
+        elif self.perfect and abs(cell[0] - x) + abs(cell[1] - y) == 1:
+            cells.appendleft(cell)
+        else:
+            self.reset(cell)
+
+    @property
+    def path(self) -> list[tuple[int, int]]:
+        """The current path as a list, in the format of ``pathfinder``."""
+        return list(self.cells)
+
+
+def bfs_all(walls: Any, width: int, size: int, source: int,
+            targets: set[int], buffers: SearchBuffers) -> int:
+    """Breadth-first search from ``source`` until every target is reached.
+
+    Neighbours are visited in N, E, S, W order. Targets outside the maze,
+    such as -1, are never reached, so the search covers everything
+    reachable from ``source``.
+
+    The search tree is left in ``buffers``: a cell was reached if its stamp
+    equals ``buffers.generation``, and its parent is ``buffers.parent``.
+
+    Args:
+        walls: Wall mask of every cell.
+        width: The width of the maze in cells.
+        size: Number of cells.
+        source: Flat index of the start cell.
+        targets: Flat indices of the cells to reach.
+        buffers: Buffers to search with.
+
+    Returns:
+        The number of nodes expanded.
+    """
+    generation = buffers.start(size)
+    parent = buffers.parent
+    stamp = buffers.stamp
+    queue = buffers.queue
+    stamp[source] = generation
+    parent[source] = source
+    queue[0] = source
+    remaining = len(targets)
+    head = 0
+    tail = 1
+    while head < tail:
+        i = queue[head]
+        head += 1
+        if i in targets:
+            remaining -= 1
+            if not remaining:
+                break
+        m = walls[i]
+        if not m & NORTH and i >= width:
+            n = i - width
+            if stamp[n] != generation:
+                stamp[n] = generation
+                parent[n] = i
+                queue[tail] = n
+                tail += 1
+        if not m & EAST and (i + 1) % width:
+            n = i + 1
+            if stamp[n] != generation:
+                stamp[n] = generation
+                parent[n] = i
+                queue[tail] = n
+                tail += 1
+        if not m & SOUTH and i + width < size:
+            n = i + width
+            if stamp[n] != generation:
+                stamp[n] = generation
+                parent[n] = i
+                queue[tail] = n
+                tail += 1
+        if not m & WEST and i % width:
+            n = i - 1
+            if stamp[n] != generation:
+                stamp[n] = generation
+                parent[n] = i
+                queue[tail] = n
+                tail += 1
+    return head
+
+
+def _moves_to(buffers: SearchBuffers, width: int, source: int,
+              target: int) -> Optional[str]:
+    """Read the N/E/S/W moves from ``source`` to ``target`` off a search
+    tree, or None if the search did not reach ``target``."""
+    if buffers.stamp[target] != buffers.generation:
+        return None
+    parent = buffers.parent
+    moves = []
+    i = target
+    while i != source:
+        p = parent[i]
+        if i == p - width:
+            moves.append("N")
+        elif i == p + width:
+            moves.append("S")
+        elif i == p + 1:
+            moves.append("E")
+        else:
+            moves.append("W")
+        i = p
+    moves.reverse()
+    return "".join(moves)
+
+
+def _solve_groups(walls: Any, width: int, size: int,
+                  groups: list[tuple[int, list[int]]],
+                  buffers: Optional[SearchBuffers] = None
+                  ) -> list[list[Optional[str]]]:
+    """Run one multi-target search per (source, targets) group."""
+    if buffers is None:
+        buffers = _BUFFERS.forward
+    answers = []
+    for source, targets in groups:
+        bfs_all(walls, width, size, source, set(targets), buffers)
+        answers.append([_moves_to(buffers, width, source, target)
+                        for target in targets])
+    return answers
+
+
+def _solve_tree(maze: Any, PAIRS: list[tuple[Any, Any]], WIDTH: int,
+                HEIGHT: int) -> list[Optional[str]]:
+    """Answer every query from one ``TreeIndex`` of a perfect maze."""
+    # maze.tree_index imports this module
+    from maze.tree_index import TreeIndex
+    walls = walls_of(maze, WIDTH, HEIGHT)
+    size = WIDTH * HEIGHT
+    # every open cell of a perfect maze is in the tree, whatever its root
+    root = next((i for i in range(size) if walls[i] != ALL_WALLS), 0)
+    index = TreeIndex(maze, WIDTH, HEIGHT, (root % WIDTH, root // WIDTH))
+    first = index.first
+    results: list[Optional[str]] = []
+    for source, target in PAIRS:
+        if (first[source[1] * WIDTH + source[0]] < 0
+                or first[target[1] * WIDTH + target[0]] < 0):
+            results.append("" if source == target else None)
+            continue
+        path = index.path(source, target)
+        results.append("".join(
+            ("N" if y2 < y1 else "S") if x1 == x2 else
+            ("W" if x2 < x1 else "E")
+            for (x1, y1), (x2, y2) in zip(path, path[1:])))
+    return results
+
+
+_shared: dict[str, Any] = {}
+
+
+def _attach(name: str, width: int, size: int) -> None:
+    """Pool initializer: map the shared wall buffer into this worker."""
+    from multiprocessing import shared_memory
+    memory = shared_memory.SharedMemory(name=name)
+    _shared.update(memory=memory, walls=memory.buf, width=width, size=size)
+
+
+def _solve_shared(groups: list[tuple[int, list[int]]]
+                  ) -> list[list[Optional[str]]]:
+    """Solve groups in a pool worker over the shared wall buffer."""
+    return _solve_groups(_shared["walls"], _shared["width"], _shared["size"],
+                         groups)
+
+
+def solve_batch(maze: Any, PAIRS: list[tuple[Any, Any]], WIDTH: int,
+                HEIGHT: int, workers: Optional[int] = None,
+                perfect: bool = False) -> list[Optional[str]]:
+    """Solve many (source, target) queries on the same maze.
+
+    Queries are grouped by source and each source gets one BFS that stops
+    once all of its targets are reached; the search buffers are reused
+    from one group to the next. With ``workers`` > 1 the groups are split
+    across a process pool whose workers all read the walls from one
+    shared-memory buffer instead of receiving a copy of the maze.
+
+    A perfect maze is indexed once with a ``TreeIndex`` instead, and each
+    query then costs O(path length) with no search, so ``workers`` is
+    ignored.
+
+    Args:
+        maze: A ``Grid`` or 2D array of cell objects representing the maze.
+        PAIRS: (source, target) pairs of (x, y) tuples.
+        WIDTH: The width of the maze in cells.
+        HEIGHT: The height of the maze in cells.
+        workers: Number of worker processes; None or 1 solves in this
+            process.
+        perfect: True if the open cells of the maze form a single tree
+            (e.g. ``Maze.perfect``).
+
+    Returns:
+        list[str | None]: For each pair, in order, the shortest path as
+        N/E/S/W moves (the ``MazeGenerator.print_path`` format), or None if
+        the target cannot be reached.
+
+    Raises:
+        ValueError: If ``perfect`` is True but the maze has a loop.
+    """
+    if perfect:
+        return _solve_tree(maze, PAIRS, WIDTH, HEIGHT)
+    size = WIDTH * HEIGHT
+    walls = walls_of(maze, WIDTH, HEIGHT)
+    slots: dict[int, dict[int, list[int]]] = {}
+    for position, (source, target) in enumerate(PAIRS):
+        slots.setdefault(source[1] * WIDTH + source[0], {}).setdefault(
+            target[1] * WIDTH + target[0], []).append(position)
+    groups = [(source, list(targets)) for source, targets in slots.items()]
+
+    if workers is None or workers <= 1 or len(groups) < 2:
+        answers = _solve_groups(walls, WIDTH, size, groups)
+    else:
+        # only the parallel path pays for importing multiprocessing
+        from concurrent.futures import ProcessPoolExecutor
+        from multiprocessing import shared_memory
+        memory = shared_memory.SharedMemory(create=True, size=max(size, 1))
+        try:
+            memory.buf[:size] = walls[0:size]  # type: ignore[index]
+            chunk = -(-len(groups) // (workers * 4))
+            batches = [groups[i:i + chunk]
+                       for i in range(0, len(groups), chunk)]
+            with ProcessPoolExecutor(
+                    workers, initializer=_attach,
+                    initargs=(memory.name, WIDTH, size)) as pool:
+                answers = [answer for batch in pool.map(_solve_shared,
+                                                        batches)
+                           for answer in batch]
+        finally:
+            memory.close()
+            memory.unlink()
+
+    results: list[Optional[str]] = [None] * len(PAIRS)
+    for (source, targets), moves in zip(groups, answers):
+        for target, path in zip(targets, moves):
+            for position in slots[source][target]:
+                results[position] = path
+    return results
@@ -0,0 +1,247 @@
+"""Maze generation service, independent of any rendering.
+
+``build_maze`` generates and solves a maze and returns it as an immutable
+``Maze``; ``save_maze`` writes one to an output file. The renderer only
+receives finished ``Maze`` objects, so mazes can be built ahead of time,
+in another thread or process, or cached. ``MazeQueue`` does exactly that:
+a background thread keeps the next few mazes generated, solved and
+serialized, so taking one is a dequeue and a single file write.
+"""
+
+import queue
+import threading
+from typing import Any, Callable, NamedTuple, Optional
+from maze.grid import EAST, SOUTH, Grid
+from maze.mazegen import MazeGenerator
+from maze.pathfinder import bfs, pathfinder
+from utils.errors import InvalidDistinationFor42Path
+
+_OPEN_EAST = bytes(0 if value & EAST else 1 for value in range(256))
+_OPEN_SOUTH = bytes(0 if value & SOUTH else 1 for value in range(256))
+
+
+class Maze(NamedTuple):
+    """
+    A generated and solved maze.
+
+    Attributes:
+        grid (Grid): The maze grid. Treat it as read-only: it may be shared
+            with other consumers of the same maze.
+        entry (tuple[int, int]): Entry point coordinates.
+        exit (tuple[int, int]): Exit point coordinates.
+        solution (tuple[tuple[int, int], ...]): Shortest path from entry to
+            exit.
+        perfect (bool): True if there is exactly one path between any two
+            open cells.
+    """
+    grid: Grid
+    entry: tuple[int, int]
+    exit: tuple[int, int]
+    solution: tuple[tuple[int, int], ...]
+    perfect: bool
+
+    @property
+    def width(self) -> int:
+        """Number of columns."""
+        return self.grid.width
+
+    @property
+    def height(self) -> int:
+        """Number of rows."""
+        return self.grid.height
+
+    def moves(self) -> str:
+        """Return the solution as N/E/S/W moves."""
+        return MazeGenerator.print_path(list(self.solution))
+
+
+def build_maze(width: int, height: int, entry: Any, exit: Any,
+               perfect: bool, seed: Optional[int] = None, rng: Any = None,
+               warn: bool = False) -> Maze:
+    """
+    Generate and solve a maze.
+
+    Mazes too small for the 42 pattern are generated without it.
+
+    Args:
+        width (int): Number of columns.
+        height (int): Number of rows.
+        entry (tuple[int, int]): Entry point coordinates.
+        exit (tuple[int, int]): Exit point coordinates.
+        perfect (bool): Use the backtracker if True. Otherwise use Prim's
+            and open extra walls, so the maze has loops.
+        seed (int | None): Seed of the generator's ``random.Random``.
+        rng (random.Random | None): Random generator to use instead.
+        warn (bool): Print a warning when the 42 pattern is left out.
+
+    Returns:
+        Maze: The finished maze.
+
+    Raises:
+        InvalidEntryExitPoint: If entry or exit points are inside the 42
+        path.
+    """
+    maze = MazeGenerator(width, height, entry, exit, None, rng=rng,
+                         seed=seed)
+    try:
+        if perfect:
+            maze.creat_maze_bakctracker_algo()
+        else:
+            maze.creat_maze_prims_algo()
+    except InvalidDistinationFor42Path as e:
+        if warn:
+            print(e)
+        if perfect:
+            maze.remove_walls_backtracker_algo()
+        else:
+            maze.remove_walls_prims_algo()
+    # both algorithms carve a spanning tree; each extra wall adds a loop
+    loops = 0 if perfect else maze.open_extra_walls()
+    solution = pathfinder(maze.maze, entry, exit, width, height)
+    return Maze(maze.maze, tuple(entry), tuple(exit), tuple(solution),
+                loops == 0)
+
+
+def is_perfect(grid: Grid) -> bool:
+    """
+    Return True if the open cells of ``grid`` form a single tree.
+
+    Cells of the 42 pattern are ignored.
+    """
+    size = grid.width * grid.height
+    walls = bytes(grid.walls[0:size])
+    open_cells = size - int.from_bytes(grid.blocked, "little").bit_count()
+    start = next((i for i in range(size) if not grid.is_blocked(i)), -1)
+    if start < 0:
+        return True
+    _, reached = bfs(walls, grid.width, size, start, -1)
+    passages = (walls.translate(_OPEN_EAST).count(1)
+                + walls.translate(_OPEN_SOUTH).count(1))
+    return reached == open_cells and passages == reached - 1
+
+
+def from_generator(generator: MazeGenerator) -> Maze:
+    """
+    Solve a maze held by a ``MazeGenerator`` (e.g. one returned by
+    ``maze.hexfile.load_output_file``) and wrap it into a ``Maze``.
+    """
+    grid = generator.maze
+    solution = pathfinder(grid, generator.entry, generator.exit,
+                          grid.width, grid.height)
+    return Maze(grid, tuple(generator.entry), tuple(generator.exit),
+                tuple(solution), is_perfect(grid))
+
+
+def save_maze(maze: Maze, out_file: str) -> None:
+    """
+    Write a maze in the hex output format of ``creat_output_file``.
+
+    Args:
+        maze (Maze): The maze to write.
+        out_file (str): Path to the output file.
+    """
+    generator = MazeGenerator.from_grid(maze.grid, maze.entry, maze.exit,
+                                        out_file)
+    generator.creat_output_file(list(maze.solution))
+
+
+def maze_bytes(maze: Maze) -> bytes:
+    """Return the content ``save_maze`` would write for ``maze``."""
+    generator = MazeGenerator.from_grid(maze.grid, maze.entry, maze.exit,
+                                        None)
+    return b"".join(generator.hex_rows()) + (
+        f"\n{maze.entry[0]}, {maze.entry[1]}\n"
+        f"{maze.exit[0]}, {maze.exit[1]}\n"
+        f"{maze.moves()}\n").encode()
+
+
+class MazeQueue:
+    """
+    Bounded queue of mazes pre-generated by a background thread.
+
+    The thread keeps up to ``size`` mazes ready, each already solved and
+    serialized. ``get`` takes the oldest one and writes it to the output
+    file; it only waits for generation when the queue is empty.
+
+    Attributes:
+        size (int): Maximum number of mazes kept ready.
+        hits (int): ``get`` calls served from the queue without waiting.
+        misses (int): ``get`` calls that had to wait for a maze.
+    """
+
+    def __init__(self, build: Callable[[], Maze], out_file: str,
+                 size: int = 2) -> None:
+        """
+        Start filling the queue.
+
+        Args:
+            build (Callable[[], Maze]): Builds the next maze, e.g.
+            ``build_maze`` with fixed settings.
+            out_file (str): File each maze is written to when taken.
+            size (int): Number of mazes to keep ready.
+        """
+        self.size = size
+        self.hits = 0
+        self.misses = 0
+        self._build = build
+        self._out_file = out_file
+        self._ready: queue.Queue[Any] = queue.Queue(maxsize=size)
+        self._stop = threading.Event()
+        self._worker = threading.Thread(target=self._fill, daemon=True,
+                                        name="maze-queue")
+        self._worker.start()
+
+    def _fill(self) -> None:
+        """Worker loop: build mazes until stopped, blocking when full."""
+        while not self._stop.is_set():
+            try:
+                maze = self._build()
+                item: Any = (maze, maze_bytes(maze))
+            except Exception as e:
+                item = e
+            # a failed build is queued like a maze and the worker carries
+            # on, so every later get gets an answer instead of blocking
+            while not self._stop.is_set():
+                try:
+                    self._ready.put(item, timeout=0.1)
+                    break
+                except queue.Full:
+                    continue
+
+    @property
+    def depth(self) -> int:
+        """Number of mazes ready right now."""
+        return self._ready.qsize()
+
+    def get(self) -> Maze:
+        """
+        Take the next maze and write it to the output file.
+
+        Raises:
+            Exception: Whatever ``build`` raised while generating it, e.g.
+            ``InvalidEntryExitPoint``. The queue keeps working, so the next
+            call tries the next build.
+        """
+        try:
+            item = self._ready.get_nowait()
+            self.hits += 1
+        except queue.Empty:
+            self.misses += 1
+            item = self._ready.get()
+        if isinstance(item, Exception):
+            raise item
+        maze: Maze = item[0]
+        payload: bytes = item[1]
+        with open(self._out_file, "wb") as file:
+            file.write(payload)
+        return maze
+
+    def close(self) -> None:
+        """Stop the background thread."""
+        self._stop.set()
+        self._worker.join()
+
+    def __repr__(self) -> str:
+        """Show the queue depth and hit/miss counts."""
+        return (f"MazeQueue(depth={self.depth}/{self.size}, "
+                f"hits={self.hits}, misses={self.misses})")
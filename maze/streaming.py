@@ -0,0 +1,182 @@
+"""Streaming maze generation with Eller's algorithm.
+
+Eller's algorithm builds a perfect maze one row at a time and only needs
+the set membership of the current row, so a maze of any height can be
+generated with O(width) memory. ``stream_maze`` writes every row to the
+output file as soon as it is finished, which makes mazes such as
+1000 x 10,000,000 possible without ever holding the grid in RAM.
+
+The "42 pattern" is honoured: its cells keep all their walls, no passage
+is opened into them, and sets whose cells all sit above the pattern are
+joined sideways so that every other cell still belongs to one spanning
+tree.
+"""
+
+import random
+from typing import Any, Iterator, Optional
+from maze.grid import ALL_WALLS, EAST, HEX_TABLE, NORTH, SOUTH, WEST
+from maze.mazegen import pattern_42_cells
+from utils.errors import InvalidDistinationFor42Path, InvalidEntryExitPoint
+
+
+def _find(parent: list[int], label: int) -> int:
+    """Return the root of ``label`` in the union-find ``parent`` list."""
+    while parent[label] != label:
+        parent[label] = parent[parent[label]]
+        label = parent[label]
+    return label
+
+
+def eller_rows(width: int, height: int, blocked: Any = None,
+               rng: Any = None) -> Iterator[bytearray]:
+    """Generate a perfect maze with Eller's algorithm, one row at a time.
+
+    Args:
+        width (int): Number of columns.
+        height (int): Number of rows.
+        blocked (dict[int, set[int]] | None): For each row index, the
+        columns of the cells that must stay closed (the 42 pattern).
+        rng (random.Random | None): Random generator to draw from; a new
+        system-seeded ``random.Random`` by default.
+
+    Yields:
+        bytearray: The wall masks (N=1, E=2, S=4, W=8) of each row, north
+        to south. The same buffer is never yielded twice.
+
+    Raises:
+        InvalidDistinationFor42Path: If the blocked cells cut part of the
+        maze off so that no spanning tree exists.
+    """
+    blocked = blocked or {}
+    rng = rng or random.Random()
+    # label of each cell of the current row, -1 for blocked cells
+    labels = list(range(width))
+    open_north = bytearray(width)
+    for y in range(height):
+        last = y == height - 1
+        closed = blocked.get(y, ())
+        for x in closed:
+            labels[x] = -1
+        walls = bytearray([ALL_WALLS]) * width
+        parent = list(range(width))
+
+        def join(x: int) -> bool:
+            """Join cell ``x`` to cell ``x + 1`` if they are in two sets."""
+            a = _find(parent, labels[x])
+            b = _find(parent, labels[x + 1])
+            if a == b:
+                return False
+            parent[b] = a
+            walls[x] &= ~EAST
+            walls[x + 1] &= ~WEST
+            return True
+
+        for x in range(width - 1):
+            if (labels[x] >= 0 and labels[x + 1] >= 0
+                    and (last or rng.random() < 0.5)):
+                join(x)
+
+        open_south = bytearray(width)
+        if not last:
+            below = blocked.get(y + 1, ())
+            # sets with no cell able to go down are joined to a neighbour
+            stuck = bool(below)
+            while stuck:
+                stuck = False
+                can_drop = set()
+                for x in range(width):
+                    if labels[x] >= 0 and x not in below:
+                        can_drop.add(_find(parent, labels[x]))
+                for x in range(width):
+                    if (labels[x] < 0
+                            or _find(parent, labels[x]) in can_drop):
+                        continue
+                    if x + 1 < width and labels[x + 1] >= 0 and join(x):
+                        stuck = True
+                        break
+                    if x > 0 and labels[x - 1] >= 0 and join(x - 1):
+                        stuck = True
+                        break
+            members: dict[int, list[int]] = {}
+            for x in range(width):
+                if labels[x] >= 0:
+                    members.setdefault(_find(parent, labels[x]),
+                                       []).append(x)
+            for cells in members.values():
+                candidates = [x for x in cells if x not in below]
+                if not candidates:
+                    raise InvalidDistinationFor42Path(
+                        "Error: the 42 pattern cuts the maze in two "
+                        f"(row {y})")
+                dropped = False
+                for x in candidates:
+                    if rng.random() < 0.5:
+                        open_south[x] = 1
+                        dropped = True
+                if not dropped:
+                    open_south[rng.choice(candidates)] = 1
+
+        for x in range(width):
+            if open_north[x]:
+                walls[x] &= ~NORTH
+            if open_south[x]:
+                walls[x] &= ~SOUTH
+        yield walls
+
+        # cells below an opening inherit the set, the others get a new one;
+        # labels are renumbered so they always stay below width
+        renumber: dict[int, int] = {}
+        fresh = [0] * width
+        for x in range(width):
+            if open_south[x]:
+                fresh[x] = renumber.setdefault(_find(parent, labels[x]),
+                                               len(renumber))
+        used = len(renumber)
+        for x in range(width):
+            if not open_south[x]:
+                fresh[x] = used
+                used += 1
+        labels = fresh
+        open_north = open_south
+
+
+def stream_maze(width: int, height: int, entry: Any, exit: Any,
+                out_file: str, seed: Optional[int] = None) -> None:
+    """Generate a maze with Eller's algorithm and stream it to a file.
+
+    The file has the same layout as ``MazeGenerator.creat_output_file``:
+    one hex row per maze row, a blank line, the entry and exit lines, then
+    the path line. Solving needs the whole maze, which is exactly what this
+    mode avoids holding, so the path line is left empty.
+
+    Args:
+        width (int): Number of columns.
+        height (int): Number of rows.
+        entry (tuple[int, int]): Entry point coordinates.
+        exit (tuple[int, int]): Exit point coordinates.
+        out_file (str): Path to the output file.
+        seed (int | None): Seed of the generator, None for a different maze
+        on every run.
+
+    Raises:
+        InvalidEntryExitPoint: If entry or exit points are inside the 42
+        path.
+    """
+    blocked: dict[int, set[int]] = {}
+    if width >= 9 and height >= 9:
+        for x, y in pattern_42_cells(width, height):
+            blocked.setdefault(y, set()).add(x)
+        if (entry[0] in blocked.get(entry[1], ())
+                or exit[0] in blocked.get(exit[1], ())):
+            raise InvalidEntryExitPoint("Try other exit or entry point it's \
+invalid (inside '42 path')")
+    else:
+        print("Warning: invalid path for 42 pathern.\n'we will "
+              "generat maze without 42 pathern'")
+    with open(out_file, "wb", buffering=1 << 20) as file:
+        for row in eller_rows(width, height, blocked,
+                              random.Random(seed)):
+            file.write(row.translate(HEX_TABLE))
+            file.write(b"\n")
+        file.write(f"\n{entry[0]}, {entry[1]}\n"
+                   f"{exit[0]}, {exit[1]}\n\n".encode())
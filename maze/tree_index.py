@@ -0,0 +1,165 @@
+"""Constant-time distance queries on perfect mazes.
+
+A perfect maze is a spanning tree of its open cells, so the path between
+two cells goes up from each of them to their lowest common ancestor (LCA).
+``TreeIndex`` roots the tree once, records the depth and parent of every
+cell and an Euler tour of the traversal, and builds a sparse table of range
+minima over the tour depths. After that:
+
+- ``lca`` and ``distance`` cost O(1),
+- ``path`` costs O(path length),
+
+instead of a full BFS per query.
+
+Each sparse-table entry packs ``depth * size + cell`` into one integer, so
+a range minimum is a plain comparison of two integers and also names the
+cell it was found at.
+"""
+
+from array import array
+from typing import Any
+from maze.pathfinder import open_neighbours, walls_of
+
+
+class TreeIndex:
+    """
+    LCA index over the spanning tree of a perfect maze.
+
+    Cells that cannot be reached from the root (such as the fully walled
+    cells of the 42 pattern) are not part of the index.
+
+    Attributes:
+        width (int): The width of the maze in cells.
+        size (int): Number of cells of the maze.
+        root (int): Flat index of the root cell.
+        parent (array): Parent of every indexed cell (the root is its own
+            parent).
+        depth (array): Distance of every indexed cell from the root.
+        first (array): Position of each cell's first visit in the Euler
+            tour, -1 for cells outside the index.
+        table (list[array]): Sparse table; ``table[k][i]`` is the minimum
+            packed entry of the tour range ``[i, i + 2**k)``.
+    """
+
+    def __init__(self, maze: Any, WIDTH: int, HEIGHT: int,
+                 root: tuple[int, int] = (0, 0)) -> None:
+        """
+        Index the maze, rooted at ``root``.
+
+        Args:
+            maze: A ``Grid`` or 2D array of cell objects.
+            WIDTH: The width of the maze in cells.
+            HEIGHT: The height of the maze in cells.
+            root: (x, y) of the root cell, e.g. the maze exit.
+
+        Raises:
+            ValueError: If the open cells reachable from ``root`` contain a
+            loop, i.e. the maze is not perfect.
+        """
+        walls = walls_of(maze, WIDTH, HEIGHT)
+        size = WIDTH * HEIGHT
+        self.width = WIDTH
+        self.size = size
+        self.root = root[1] * WIDTH + root[0]
+        parent = array("i", [-1]) * size
+        depth = array("i", [0]) * size
+        first = array("i", [-1]) * size
+        tour = array("q")
+
+        parent[self.root] = self.root
+        first[self.root] = 0
+        tour.append(self.root)
+        stack = [(self.root,
+                  iter(open_neighbours(walls, WIDTH, size, self.root)))]
+        while stack:
+            cell, children = stack[-1]
+            child = next(children, -1)
+            if child < 0:
+                stack.pop()
+                if stack:
+                    above = stack[-1][0]
+                    tour.append(depth[above] * size + above)
+                continue
+            if child == parent[cell]:
+                continue
+            if first[child] >= 0:
+                raise ValueError(
+                    "Error: the maze has a loop at "
+                    f"({child % WIDTH}, {child // WIDTH}), it is not perfect")
+            parent[child] = cell
+            depth[child] = depth[cell] + 1
+            first[child] = len(tour)
+            tour.append(depth[child] * size + child)
+            stack.append(
+                (child, iter(open_neighbours(walls, WIDTH, size, child))))
+
+        table = [tour]
+        level = tour.tolist()
+        span = 1
+        while span * 2 <= len(tour):
+            level = [a if a < b else b for a, b in zip(level, level[span:])]
+            table.append(array("q", level))
+            span *= 2
+        self.parent = parent
+        self.depth = depth
+        self.first = first
+        self.table = table
+
+    def _entry(self, a: int, b: int) -> int:
+        """Return the packed depth and cell of the LCA of two flat cells."""
+        left, right = self.first[a], self.first[b]
+        if left < 0 or right < 0:
+            missing = a if left < 0 else b
+            raise ValueError(
+                f"Error: cell ({missing % self.width}, "
+                f"{missing // self.width}) is not connected to the maze")
+        if left > right:
+            left, right = right, left
+        k = (right - left + 1).bit_length() - 1
+        row = self.table[k]
+        return min(row[left], row[right - (1 << k) + 1])
+
+    def lca(self, a: tuple[int, int], b: tuple[int, int]) -> tuple[int, int]:
+        """Return the lowest common ancestor of cells ``a`` and ``b``."""
+        cell = self._entry(a[1] * self.width + a[0],
+                           b[1] * self.width + b[0]) % self.size
+        return cell % self.width, cell // self.width
+
+    def distance(self, a: tuple[int, int], b: tuple[int, int]) -> int:
+        """
+        Return the number of moves between cells ``a`` and ``b``.
+
+        Raises:
+            ValueError: If either cell is outside the index.
+        """
+        i = a[1] * self.width + a[0]
+        j = b[1] * self.width + b[0]
+        return (self.depth[i] + self.depth[j]
+                - 2 * (self._entry(i, j) // self.size))
+
+    def path(self, a: tuple[int, int],
+             b: tuple[int, int]) -> list[tuple[int, int]]:
+        """
+        Return the path from ``a`` to ``b`` as a list of (x, y) tuples.
+
+        The format is the same as ``pathfinder``'s, so either can be used
+        to draw or print a solution.
+
+        Raises:
+            ValueError: If either cell is outside the index.
+        """
+        width = self.width
+        parent = self.parent
+        i = a[1] * width + a[0]
+        j = b[1] * width + b[0]
+        top = self._entry(i, j) % self.size
+        up = [i]
+        while i != top:
+            i = parent[i]
+            up.append(i)
+        down = []
+        while j != top:
+            down.append(j)
+            j = parent[j]
+        up.extend(reversed(down))
+        return [(cell % width, cell // width) for cell in up]
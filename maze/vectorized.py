@@ -0,0 +1,281 @@
+"""NumPy engine for bulk maze generation.
+
+Each algorithm here produces a whole grid (or one row at a time) of wall
+masks with array operations instead of stepping cell by cell in Python.
+The result is a ``(height, width)`` ``uint8`` array using the same bits as
+the hex output file (N=1, E=2, S=4, W=8); ``to_grid`` wraps it into a
+``Grid`` so ``MazeGenerator.creat_output_file`` and the pathfinder can use
+it directly.
+
+Like the small-maze fallback of ``MazeGenerator``, this engine does not
+embed the "42 pattern": every cell is part of the (perfect) maze.
+
+``BlockRandom`` brings the same engine to the cell-by-cell algorithms of
+``MazeGenerator``: it draws random numbers from NumPy in large blocks and
+hands them out one by one behind the ``random.Random`` methods they use.
+
+NumPy is an optional dependency; importing this module works without it,
+but calling any generator raises ``ModuleNotFoundError``.
+"""
+
+from typing import Any, Iterator
+from maze.grid import ALL_WALLS, EAST, NORTH, SOUTH, WEST, Grid
+
+try:
+    import numpy as np
+    HAS_NUMPY = True
+except ModuleNotFoundError:
+    HAS_NUMPY = False
+
+
+def _rng(seed: Any) -> Any:
+    """Return a NumPy ``Generator`` for ``seed``.
+
+    Args:
+        seed: None, an integer seed, or an existing ``numpy.random.Generator``
+        (returned unchanged).
+
+    Raises:
+        ModuleNotFoundError: If NumPy is not installed.
+    """
+    if not HAS_NUMPY:
+        raise ModuleNotFoundError(
+            "❌ Error: NumPy is required for the vectorized maze engine.\n"
+            "👉 Install it with `pip install numpy`."
+        )
+    return np.random.default_rng(seed)
+
+
+class BlockRandom:
+    """
+    ``random.Random`` stand-in backed by block draws from NumPy.
+
+    Uniform floats are drawn ``block`` at a time and converted to a Python
+    list once, so each ``choice``/``randrange``/``random`` call is a list
+    step and a multiply instead of a trip through ``Random._randbelow``.
+    Pass it as ``MazeGenerator(..., rng=BlockRandom(seed))``; the mazes are
+    reproducible for a given seed but differ from the ``random.Random``
+    ones.
+
+    Attributes:
+        block (int): Number of values drawn at a time.
+    """
+    __slots__ = ("_generator", "_values", "block")
+
+    def __init__(self, seed: Any = None, block: int = 1 << 16) -> None:
+        """
+        Create the source.
+
+        Args:
+            seed: Integer seed or ``numpy.random.Generator``.
+            block (int): Number of values drawn at a time.
+
+        Raises:
+            ModuleNotFoundError: If NumPy is not installed.
+        """
+        self._generator = _rng(seed)
+        self._values: Iterator[float] = iter(())
+        self.block = block
+
+    def _refill(self) -> float:
+        """Draw the next block and return its first value."""
+        self._values = iter(self._generator.random(self.block).tolist())
+        return next(self._values)
+
+    def random(self) -> float:
+        """Return a float uniformly drawn from [0, 1)."""
+        for value in self._values:
+            return value
+        return self._refill()
+
+    def randrange(self, stop: int) -> int:
+        """Return an integer uniformly drawn from [0, stop)."""
+        for value in self._values:
+            return int(value * stop)
+        return int(self._refill() * stop)
+
+    def choice(self, seq: Any) -> Any:
+        """Return a uniformly chosen element of a non-empty sequence."""
+        for value in self._values:
+            return seq[int(value * len(seq))]
+        return seq[int(self._refill() * len(seq))]
+
+
+def _assemble(open_north: Any, open_east: Any) -> Any:
+    """Build wall masks from the passages leading north and east.
+
+    Args:
+        open_north: Boolean ``(height, width)`` array, True where a cell is
+        open to the cell above it.
+        open_east: Boolean ``(height, width)`` array, True where a cell is
+        open to the cell on its right.
+
+    Returns:
+        numpy.ndarray: ``uint8`` wall masks of shape ``(height, width)``.
+    """
+    walls = np.full(open_north.shape, ALL_WALLS, dtype=np.uint8)
+    walls[open_north] &= ~NORTH & 0xF
+    walls[:-1][open_north[1:]] &= ~SOUTH & 0xF
+    walls[open_east] &= ~EAST & 0xF
+    walls[:, 1:][open_east[:, :-1]] &= ~WEST & 0xF
+    return walls
+
+
+def binary_tree(width: int, height: int, seed: Any = None) -> Any:
+    """Generate a perfect maze with the Binary Tree algorithm.
+
+    Every cell independently opens either its north or its east wall; the
+    top row can only go east and the last column can only go north.
+
+    Args:
+        width: Number of columns.
+        height: Number of rows.
+        seed: Integer seed or ``numpy.random.Generator``.
+
+    Returns:
+        numpy.ndarray: ``uint8`` wall masks of shape ``(height, width)``.
+    """
+    rng = _rng(seed)
+    go_north = rng.random((height, width)) < 0.5
+    go_north[0, :] = False
+    go_north[:, -1] = True
+    open_north = go_north.copy()
+    open_north[0, :] = False
+    open_east = ~go_north
+    open_east[:, -1] = False
+    return _assemble(open_north, open_east)
+
+
+def sidewinder(width: int, height: int, seed: Any = None) -> Any:
+    """Generate a perfect maze with the Sidewinder algorithm.
+
+    The top row is one open corridor. In every other row, cells are grouped
+    into random east-west runs and one random cell of each run opens
+    north. Runs are found for the whole grid at once from the flattened
+    run-closing flags.
+
+    Args:
+        width: Number of columns.
+        height: Number of rows.
+        seed: Integer seed or ``numpy.random.Generator``.
+
+    Returns:
+        numpy.ndarray: ``uint8`` wall masks of shape ``(height, width)``.
+    """
+    rng = _rng(seed)
+    open_north = np.zeros((height, width), dtype=bool)
+    open_east = np.zeros((height, width), dtype=bool)
+    open_east[0, :-1] = True
+    if height > 1:
+        close = rng.random((height - 1, width)) < 0.5
+        close[:, -1] = True
+        open_east[1:] = ~close
+        ends = np.flatnonzero(close)
+        starts = np.empty_like(ends)
+        starts[0] = 0
+        starts[1:] = ends[:-1] + 1
+        picks = starts + (rng.random(ends.size)
+                          * (ends - starts + 1)).astype(ends.dtype)
+        open_north[1:].reshape(-1)[picks] = True
+    return _assemble(open_north, open_east)
+
+
+def eller_rows(width: int, height: int,
+               seed: Any = None) -> Iterator[Any]:
+    """Generate a perfect maze with Eller's algorithm, one row at a time.
+
+    Only the set labels of the current row are kept, so memory is O(width)
+    whatever the height. The vertical step (at least one passage down per
+    set, fresh labels for the cells below) is vectorized; the random
+    horizontal joins walk the candidate pairs of the row with a small
+    union-find so no join ever closes a loop.
+
+    Args:
+        width: Number of columns.
+        height: Number of rows.
+        seed: Integer seed or ``numpy.random.Generator``.
+
+    Yields:
+        numpy.ndarray: The ``uint8`` wall masks of each row, north to south.
+    """
+    rng = _rng(seed)
+    labels = np.arange(width)
+    open_north = np.zeros(width, dtype=bool)
+    for y in range(height):
+        last = y == height - 1
+        if last:
+            join = np.ones(width - 1, dtype=bool)
+        else:
+            join = rng.random(width - 1) < 0.5
+        open_east = np.zeros(width, dtype=bool)
+        parent = list(range(width))
+        row = labels.tolist()
+        for k in np.flatnonzero(join & (labels[:-1] != labels[1:])).tolist():
+            a = row[k]
+            while parent[a] != a:
+                a = parent[a]
+            b = row[k + 1]
+            while parent[b] != b:
+                b = parent[b]
+            if a != b:
+                parent[b] = a
+                open_east[k] = True
+        for k, label in enumerate(row):
+            while parent[label] != label:
+                label = parent[label]
+            row[k] = label
+        labels = np.array(row)
+
+        if last:
+            open_south = np.zeros(width, dtype=bool)
+        else:
+            open_south = rng.random(width) < 0.5
+            has_down = np.zeros(width, dtype=bool)
+            has_down[labels[open_south]] = True
+            order = rng.permutation(width)
+            shuffled = labels[order]
+            missing = ~has_down[shuffled]
+            _, first = np.unique(shuffled[missing], return_index=True)
+            open_south[order[np.flatnonzero(missing)[first]]] = True
+
+        walls = np.full(width, ALL_WALLS, dtype=np.uint8)
+        walls[open_north] &= ~NORTH & 0xF
+        walls[open_south] &= ~SOUTH & 0xF
+        walls[open_east] &= ~EAST & 0xF
+        walls[1:][open_east[:-1]] &= ~WEST & 0xF
+        yield walls
+
+        fresh = np.where(open_south, labels, width + np.arange(width))
+        labels = np.unique(fresh, return_inverse=True)[1].reshape(-1)
+        open_north = open_south
+
+
+def eller(width: int, height: int, seed: Any = None) -> Any:
+    """Generate a whole perfect maze with Eller's algorithm.
+
+    Args:
+        width: Number of columns.
+        height: Number of rows.
+        seed: Integer seed or ``numpy.random.Generator``.
+
+    Returns:
+        numpy.ndarray: ``uint8`` wall masks of shape ``(height, width)``.
+    """
+    rng = _rng(seed)
+    walls = np.empty((height, width), dtype=np.uint8)
+    for y, row in enumerate(eller_rows(width, height, rng)):
+        walls[y] = row
+    return walls
+
+
+def to_grid(walls: Any) -> Grid:
+    """Wrap a ``(height, width)`` array of wall masks into a ``Grid``.
+
+    Args:
+        walls: ``uint8`` wall masks as returned by the generators above.
+
+    Returns:
+        Grid: A grid holding a copy of the masks.
+    """
+    height, width = walls.shape
+    return Grid.from_walls(width, height, walls.tobytes())
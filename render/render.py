@@ -1,11 +1,14 @@
+import sys
 import time
 import random
-import sys
-from typing import Any
-from maze.mazegen import (MazeGenerator)
-from maze.pathfinder import pathfinder
-from utils.errors import (InvalidCoordinates, InvalidDistinationFor42Path,
-                          InvalidEntryExitPoint)
+from array import array
+from collections import deque
+from itertools import islice
+from typing import Any, Callable, Optional
+from maze.grid import EAST, NORTH, SOUTH, WEST
+from maze.pathfinder import DistanceField, PathTracker
+from maze.service import Maze
+from utils.errors import InvalidCoordinates
 
 try:
     from mlx import Mlx
@@ -25,30 +28,47 @@ using the MiniLibX graphics library. It supports player movement, pathfinding
 visualization, and maze regeneration.
 """
 
-
-def mlx_render(width: Any, length: Any, ENTRY: Any, EXIT: Any,
-               out_file: str, is_perfect: bool, seed: bool) -> Any:
+# seconds a wall animation lasts, whatever the size of the maze
+ANIMATION_TIME = 1.0
+# seconds of drawing allowed per loop iteration, so that key presses are
+# still handled while an animation runs
+FRAME_BUDGET = 0.008
+# cells shown at most (1920x1000 pixels); larger mazes scroll
+VIEW_COLUMNS = 48
+VIEW_ROWS = 25
+# the view scrolls once the player gets this close to one of its edges
+SCROLL_MARGIN = 3
+# path cells compared before and after a move to find changed arrows
+PATH_HEAD = 2
+# index in the arrow images of each first move of the distance field
+STEP_ARROWS = {SOUTH: 0, NORTH: 1, EAST: 2, WEST: 3}
+# largest side of the minimap in pixels
+MINIMAP_SIZE = 200
+
+
+def mlx_render(maze: Maze, next_maze: Optional[Callable[[], Maze]] = None
+               ) -> Any:
     """Render and display an interactive maze using MiniLibX.
 
-    Creates a graphical window displaying a procedurally generated maze.
-    Supports player movement with arrow keys, pathfinding visualization,
-    and maze regeneration.
+    Creates a graphical window displaying a prebuilt maze. Supports player
+    movement with arrow keys, pathfinding visualization, and maze
+    regeneration.
+
+    Mazes larger than VIEW_COLUMNS x VIEW_ROWS cells are shown through a
+    scrolling view that follows the player, with a minimap of the whole
+    maze in the top right corner. Only the cells in view are ever drawn,
+    so the cost of a frame depends on the window size, not the maze size.
 
     Args:
-        width: The width of the maze in cells (minimum 6, maximum 48).
-        length: The height/length of the maze in cells (minimum 6, maximum 25).
-        ENTRY: A tuple (x, y) representing the entry point coordinates.
-        EXIT: A tuple (x, y) representing the exit point coordinates.
-        out_file: Path to the output file where maze data will be saved.
-        is_perfect: If True, generates a perfect maze using backtracker
-        algorithm.
-            If False, uses Prim's algorithm which may create loops.
-        seed: If True, uses a fixed random seed (1) for reproducible mazes.
+        maze: The maze to show (see ``maze.service.build_maze``), at least
+            6x6 cells.
+        next_maze: Called when G is pressed to get the next maze to show,
+            e.g. ``build_maze`` with the same settings or a queue of
+            pre-generated mazes. It must return mazes of the same size,
+            entry and exit. G does nothing when it is None.
 
     Raises:
-        InvalidCoordinates: If window size exceeds screen resolution
-        (1920x1000) or if dimensions are below minimum (6x6).
-        InvalidEntryExitPoint: If entry or exit points are invalid.
+        InvalidCoordinates: If dimensions are below minimum (6x6).
 
     Controls:
         - Arrow keys: Move player through the maze
@@ -57,74 +77,50 @@ def mlx_render(width: Any, length: Any, ENTRY: Any, EXIT: Any,
         - G: Generate a new maze
         - H: Hide path and refresh display
         - C: Change wall color randomly
+        - M: Show or hide the minimap (scrolling view only)
     """
-    width_pixel = width * 40
-    length_pixel = length * 40
-    if width_pixel > 1920 or length_pixel > 1000:
-        raise InvalidCoordinates(
-                "❌ Error: Window size exceeds screen resolution.\n"
-                f"Requested: {width}x{length}\n"
-                "Maximum allowed: 48x25\n"
-                "👉 Please reduce WIDTH or HEIGHT to fit your screen."
-        )
+    width, length = maze.width, maze.height
+    ENTRY, EXIT = maze.entry, maze.exit
+    columns = min(width, VIEW_COLUMNS)
+    rows = min(length, VIEW_ROWS)
+    width_pixel = columns * 40
+    length_pixel = rows * 40
     if width < 6 or length < 6:
         raise InvalidCoordinates(
             "❌ Error: Invalid coordinates.\n"
             "Minimum allowed: 6x6"
         )
 
-    output_file = out_file
-    maze = MazeGenerator(width, length, ENTRY, EXIT, out_file)
-    try:
-        if seed:
-            random.seed(1)
-        if not is_perfect:
-            maze.creat_maze_prims_algo()
-        else:
-            maze.creat_maze_bakctracker_algo()
-        maze.creat_output_file(pathfinder(maze.maze, ENTRY, EXIT, width,
-                                          length))
-    except InvalidEntryExitPoint as e:
-        print(f"Error: {e}")
-        sys.exit()
-
-    except InvalidDistinationFor42Path as e:
-        print(e)
-        if not is_perfect:
-            maze.remove_walls_prims_algo()
-        else:
-            maze.remove_walls_backtracker_algo()
-        maze.creat_output_file(pathfinder(maze.maze, ENTRY, EXIT, width,
-                                          length))
-
     mlx1 = Mlx()
     k = mlx1.mlx_init()
     win = mlx1.mlx_new_window(k, width_pixel, length_pixel, "YEB&YEN Maze_gen")
-    mz = maze.maze
+    mz = maze.grid
     img = mlx1.mlx_new_image(k, width_pixel, length_pixel)
     result = mlx1.mlx_get_data_addr(img)
     data = result[0]
     size_line = result[2]
 
-    def put_pixel(x: Any, y: Any, color: Any) -> Any:
-        """Put a pixel at (x, y) with the given color in the image data.
+    # one 32-bit word per pixel; walls are written as whole 40-pixel runs,
+    # vertical ones with a stride of one image row
+    pixels = data.cast("I")
+    stride = size_line // 4
+
+    def opaque(color: Any) -> Any:
+        """Return the 32-bit pixel value of an opaque color.
 
         Args:
-            x: The x-coordinate of the pixel.
-            y: The y-coordinate of the pixel.
             color: The color value as an integer (RGB format).
+        """
+        return int.from_bytes(color.to_bytes(3, 'little') + b"\xff",
+                              sys.byteorder)
+
+    def wall_run(color: Any) -> Any:
+        """Return one cell-long run (40 pixels) of an opaque color.
 
-        Note:
-            Pixels outside the image boundaries are silently ignored.
+        Args:
+            color: The color value as an integer (RGB format).
         """
-        if 0 <= x < width_pixel and 0 <= y < length_pixel:
-            offset = y * size_line + x * 4
-            if offset + 4 <= len(data):
-                byte = color.to_bytes(3, 'little')
-                data[offset] = byte[0]
-                data[offset + 1] = byte[1]
-                data[offset + 2] = byte[2]
-                data[offset + 3] = 255
+        return array("I", [opaque(color)]) * 40
 
     bg_img, bg_width, bg_lenght = mlx1.mlx_xpm_file_to_image(
                                         k,
@@ -133,27 +129,37 @@ def mlx_render(width: Any, length: Any, ENTRY: Any, EXIT: Any,
                                         k,
                                         "assets/player_idle1.xpm")
 
-    def back_img() -> Any:
-        """Render the background image by tiling it across the entire window.
-
-        Tiles the background XPM image to cover the complete window area,
-        creating a seamless background pattern for the maze.
-        """
-        for y in range(0, length_pixel, bg_lenght):
-            for x in range(0, width_pixel, bg_width):
-                mlx1.mlx_put_image_to_window(k, win, bg_img, x, y)
-
-    back_img()
-    back_img()
+    def paste(image: Any, image_width: Any, image_length: Any,
+              x: Any, y: Any) -> Any:
+        """Copy an image into the scene image (``img``) at (x, y).
 
-    def player(x: Any, y: Any) -> Any:
-        """Draw the player sprite at the specified position.
+        Transparent pixels (alpha 0, e.g. ``None`` colors of an XPM) keep
+        what is already below them. The image is clipped to the window.
 
         Args:
-            x: The x-coordinate in pixels where the player will be drawn.
-            y: The y-coordinate in pixels where the player will be drawn.
+            image: The MLX image to copy.
+            image_width: Its width in pixels.
+            image_length: Its height in pixels.
+            x: The x-coordinate in pixels of its top left corner.
+            y: The y-coordinate in pixels of its top left corner.
         """
-        mlx1.mlx_put_image_to_window(k, win, pl_img, x, y)
+        source = mlx1.mlx_get_data_addr(image)
+        source_data, source_line = source[0], source[2]
+        columns = min(image_width, width_pixel - x) * 4
+        for row in range(min(image_length, length_pixel - y)):
+            line = source_data[row * source_line:row * source_line + columns]
+            offset = (y + row) * size_line + x * 4
+            if 0 not in line[3::4]:
+                data[offset:offset + columns] = line
+                continue
+            for i in range(0, columns, 4):
+                if line[i + 3]:
+                    data[offset + i:offset + i + 4] = line[i:i + 4]
+
+    def player() -> Any:
+        """Draw the player sprite at its position in the view."""
+        mlx1.mlx_put_image_to_window(k, win, pl_img, pl_x - cam_x * 40,
+                                     pl_y - cam_y * 40)
 
     colors = [
         0xFFFFFF,  # white
@@ -168,7 +174,8 @@ def mlx_render(width: Any, length: Any, ENTRY: Any, EXIT: Any,
 
     path_end_img, path_end_width, path_end_length = mlx1.mlx_xpm_file_to_image(
         k, "assets/path_end.xpm")
-    path_start_img, _, _ = mlx1.mlx_xpm_file_to_image(
+    (path_start_img, path_start_width,
+     path_start_length) = mlx1.mlx_xpm_file_to_image(
         k, "assets/path_start.xpm")
     down_img, _, _ = mlx1.mlx_xpm_file_to_image(
         k, "assets/arrow_down.xpm")
@@ -178,181 +185,436 @@ def mlx_render(width: Any, length: Any, ENTRY: Any, EXIT: Any,
         k, "assets/arrow_right.xpm")
     left_img, _, _ = mlx1.mlx_xpm_file_to_image(
         k, "assets/arrow_left.xpm")
-    image_42, _, _, = mlx1.mlx_xpm_file_to_image(
+    image_42, width_42, length_42 = mlx1.mlx_xpm_file_to_image(
         k, "assets/wall_1337_neon.xpm")
 
-    def draw_42(mz: Any) -> Any:
-        """Draw special '42' themed wall images on cells marked with _42_path.
+    directions = [down_img, up_img, right_img, left_img]
 
-        Iterates through the maze and renders the special 42 neon wall image
-        on any cell that has the _42_path attribute set to True.
+    pl_x = ENTRY[0] * 40 + 10
+    pl_y = ENTRY[1] * 40 + 10
+    # top left cell of the view
+    cam_x = 0
+    cam_y = 0
+
+    def in_view(x: Any, y: Any) -> Any:
+        """Return True if cell (x, y) is inside the view."""
+        return cam_x <= x < cam_x + columns and cam_y <= y < cam_y + rows
+
+    def follow_player() -> Any:
+        """Scroll the view if the player got too close to one of its edges.
+
+        The view is centred on the player again, within the maze bounds.
+
+        Returns:
+            True if the view moved.
+        """
+        nonlocal cam_x, cam_y
+        x, y = pl_x // 40, pl_y // 40
+        new_x, new_y = cam_x, cam_y
+        if not cam_x + SCROLL_MARGIN <= x < cam_x + columns - SCROLL_MARGIN:
+            new_x = max(0, min(x - columns // 2, width - columns))
+        if not cam_y + SCROLL_MARGIN <= y < cam_y + rows - SCROLL_MARGIN:
+            new_y = max(0, min(y - rows // 2, length - rows))
+        moved = (new_x, new_y) != (cam_x, cam_y)
+        cam_x, cam_y = new_x, new_y
+        return moved
+
+    follow_player()
+
+    # solving needs a BFS over the whole maze, so it is only done the
+    # first time the path is shown
+    perfect = maze.perfect
+    field: Any = None
+    tracker: Any = None
+
+    def path_tracker() -> Any:
+        """Return the tracker of the path to the exit, solving on first use.
+        """
+        nonlocal field, tracker
+        if tracker is None:
+            field = DistanceField(mz, width, length, EXIT)
+            tracker = PathTracker(field.path_from,
+                                  (pl_x // 40, pl_y // 40), perfect=perfect)
+        return tracker
+
+    def path_arrows(player_cell: Any) -> Any:
+        """Return the arrows of the solution path that are drawn in view.
+
+        The tracker's path always follows the first moves of the distance
+        field, so the cells of the view are checked against it in O(1) each
+        instead of scanning the path, however long it is. The entry, the
+        exit and the player's cell get no arrow.
 
         Args:
-            mz: The 2D maze array containing cell objects.
+            player_cell: The (x, y) cell of the player.
+
+        Returns:
+            A dict mapping each (x, y) cell to the index in ``directions``
+            of the direction to travel from it.
         """
-        y_offset = 0
-        for row in mz:
-            x_offset = 0
-            for cell in row:
-                if cell._42_path is True:
-                    mlx1.mlx_put_image_to_window(
-                        k, win, image_42, x_offset, y_offset)
-                x_offset += 40
-            y_offset += 40
+        cells = path_tracker().cells
+        arrows: Any = {}
+        if not cells:
+            return arrows
+        start = cells[0]
+        step = field.step
+        for y in range(cam_y, min(cam_y + rows, length)):
+            for x in range(cam_x, min(cam_x + columns, width)):
+                direction = step[y * width + x]
+                if (direction and field.on_path((x, y), start)
+                        and (x, y) != ENTRY and (x, y) != player_cell):
+                    arrows[(x, y)] = STEP_ARROWS[direction]
+        return arrows
+
+    def head_arrows(player_cell: Any) -> Any:
+        """Return the arrows of the first cells of the tracked path.
+
+        A one-cell move only pops or prepends cells at the front of the
+        path, so comparing these before and after it finds every arrow that
+        changed without copying the path.
 
-    directions = [down_img, up_img, right_img, left_img]
+        Args:
+            player_cell: The (x, y) cell of the player.
 
-    mlx1.mlx_put_image_to_window(k,
-                                 win,
-                                 path_start_img,
-                                 ENTRY[0] * 40 + 10,
-                                 ENTRY[1] * 40 + 10)
-
-    mlx1.mlx_put_image_to_window(k,
-                                 win,
-                                 path_end_img,
-                                 EXIT[0] * 40 + 10,
-                                 EXIT[1] * 40 + 10)
-    pl_x = ENTRY[0] * 40 + 10
-    pl_y = ENTRY[1] * 40 + 10
+        Returns:
+            A dict mapping the first PATH_HEAD cells of the path to the
+            index in ``directions`` of their arrow, or None if they
+            have no arrow drawn.
+        """
+        step = field.step
+        arrows: Any = {}
+        for x, y in islice(tracker.cells, PATH_HEAD):
+            direction = step[y * width + x]
+            if (direction and in_view(x, y) and (x, y) != ENTRY
+                    and (x, y) != player_cell):
+                arrows[(x, y)] = STEP_ARROWS[direction]
+            else:
+                arrows[(x, y)] = None
+        return arrows
+
+    def draw_arrow(x: Any, y: Any, direction_i: Any) -> Any:
+        """Draw one arrow of the path on cell (x, y) of the view."""
+        CELL = 40
+        mlx1.mlx_put_image_to_window(k,
+                                     win,
+                                     directions[direction_i],
+                                     (x - cam_x) * CELL + 10,
+                                     (y - cam_y) * CELL + 10)
 
     def draw_path() -> Any:
         """Visualize the solution path from the player's current position to
         the exit.
 
-        Calculates the shortest path using the pathfinder algorithm and renders
-        directional arrow indicators on each cell of the path, showing the
-        direction to travel (up, down, left, or right).
+        Renders directional arrow indicators on each cell of the path,
+        showing the direction to travel (up, down, left, or right).
         """
-        path = pathfinder(mz, (pl_x // 40, pl_y // 40), EXIT, width, length)
-        direction_i = 0
-        CELL = 40
-        i = 1
-        for x, y in path:
-            for nx, ny in path[i:]:
-                if ny > y and nx == x:
-                    direction_i = 0
-                elif ny < y and nx == x:
-                    direction_i = 1
-                elif nx > x and ny == y:
-                    direction_i = 2
-                elif nx < x and ny == y:
-                    direction_i = 3
-                px = x * CELL + 10
-                py = y * CELL + 10
-                if ((x, y) != ENTRY and (x, y) != EXIT
-                   and (x, y) != (pl_x // 40, pl_y // 40)):
-                    time.sleep(0.0001)
-                    mlx1.mlx_put_image_to_window(k,
-                                                 win,
-                                                 directions[direction_i],
-                                                 px,
-                                                 py)
-                i += 1
-                break
+        for (x, y), direction_i in path_arrows(
+                (pl_x // 40, pl_y // 40)).items():
+            draw_arrow(x, y, direction_i)
 
-    def draw_maze(maze: Any, color: Any, sleep: Any) -> Any:
-        """Render the maze walls to the image buffer.
+    def draw_maze(maze: Any, color: Any) -> Any:
+        """Render the maze walls to the image buffer, one cell per step.
 
-        Draws all walls of the maze by iterating through each cell and
-        rendering its north, south, east, and west walls based on the
-        cell's wall properties.
+        Draws the walls of the maze by iterating through each cell in view
+        and writing its north, south, east, and west walls as 40-pixel runs
+        straight into the image buffer, based on the cell's wall bits.
+
+        This is a generator that yields after every cell, so that
+        ``animate`` can spread the drawing over several frames.
 
         Args:
-            maze: The 2D maze array containing cell objects with wall
-            properties.
+            maze: The maze ``Grid``.
             color: The color value for the walls as an integer (RGB format).
-            sleep: If True, adds a small delay between drawing cells for an
-                  animated effect. If False, draws immediately.
         """
         CELL = 40
-        y_offset = 0
-        for row in maze:
-            x_offset = 0
-            for cell in row:
-                if cell.north:
-                    for x in range(x_offset, x_offset + CELL):
-                        put_pixel(x, y_offset, color)
+        run = wall_run(color)
+        walls = maze.walls
+        column = CELL * stride
+        for y in range(cam_y, cam_y + rows):
+            row = y * maze.width
+            top = (y - cam_y) * CELL * stride - cam_x * CELL
+            for x in range(cam_x, cam_x + columns):
+                cell = walls[row + x]
+                left = top + x * CELL
+                right = left + CELL - 1
+                bottom = left + (CELL - 1) * stride
+
+                if cell & NORTH:
+                    pixels[left:left + CELL] = run
+
+                if cell & SOUTH:
+                    pixels[bottom:bottom + CELL] = run
+
+                if cell & WEST:
+                    pixels[left:left + column:stride] = run
+
+                if cell & EAST:
+                    pixels[right:right + column:stride] = run
+
+                yield True
+
+    def build_scene() -> Any:
+        """Composite the static layers of the cells in view into ``img``.
+
+        The tiled background, the 42 tiles, the entry and exit markers and
+        the walls do not change between key presses, so they are drawn once
+        into the scene image and every frame is a single blit of it plus
+        the sprites. The scene is rebuilt only when G replaces the maze;
+        C redraws its walls in place with the new color. The walls are
+        left to ``draw_maze``, usually animated. Scrolling rebuilds it too.
+        """
+        data[:] = bytes(len(data))
+        for x in range(0, width_pixel, bg_width):
+            paste(bg_img, bg_width, bg_lenght, x, 0)
+        band = width_pixel * 4
+        for y in range(bg_lenght, length_pixel):
+            above = (y - bg_lenght) * size_line
+            data[y * size_line:y * size_line + band] = data[above:above + band]
+        for y in range(cam_y, cam_y + rows):
+            for x in range(cam_x, cam_x + columns):
+                if mz.is_blocked(y * width + x):
+                    paste(image_42, width_42, length_42,
+                          (x - cam_x) * 40, (y - cam_y) * 40)
+        if in_view(*ENTRY):
+            paste(path_start_img, path_start_width, path_start_length,
+                  (ENTRY[0] - cam_x) * 40 + 10, (ENTRY[1] - cam_y) * 40 + 10)
+        if in_view(*EXIT):
+            paste(path_end_img, path_end_width, path_end_length,
+                  (EXIT[0] - cam_x) * 40 + 10, (EXIT[1] - cam_y) * 40 + 10)
+
+    # minimap of the whole maze, only when it does not fit the window:
+    # ``scale`` pixels per block, one block for every ``step`` cells
+    minimap: Any = None
+    show_minimap = True
+    # pixels under the player's marker: (offset, saved rows)
+    marker: Any = None
+    if columns < width or rows < length:
+        scale = max(2, min(4, MINIMAP_SIZE // max(width, length)))
+        step = -(-max(width, length) // (MINIMAP_SIZE // scale))
+        minimap_columns = -(-width // step)
+        minimap_rows = -(-length // step)
+        minimap = mlx1.mlx_new_image(k, minimap_columns * scale,
+                                     minimap_rows * scale)
+        minimap_result = mlx1.mlx_get_data_addr(minimap)
+        minimap_pixels = minimap_result[0].cast("I")
+        minimap_stride = minimap_result[2] // 4
+        minimap_x = width_pixel - minimap_columns * scale - 10
+
+    def build_minimap() -> Any:
+        """Draw the minimap of the current maze from its wall bits.
+
+        Every ``step``-th cell of every ``step``-th row becomes one block:
+        the floor, with its east and south walls as one-pixel lines. Cells
+        of the 42 pattern are filled with the wall color.
+        """
+        nonlocal marker
+        wall = opaque(wall_color)
+        floor = array("I", [opaque(0x000000)]) * (scale - 1)
+        solid = array("I", [wall]) * scale
+        walls = mz.walls
+        for block_y in range(minimap_rows):
+            row = block_y * step * width
+            top = block_y * scale * minimap_stride
+            for block_x in range(minimap_columns):
+                cell = walls[row + block_x * step]
+                left = top + block_x * scale
+                blocked = mz.is_blocked(row + block_x * step)
+                for line in range(scale - 1):
+                    start = left + line * minimap_stride
+                    if blocked:
+                        minimap_pixels[start:start + scale] = solid
+                        continue
+                    minimap_pixels[start:start + scale - 1] = floor
+                    minimap_pixels[start + scale - 1] = (
+                        wall if cell & EAST else floor[0])
+                bottom = left + (scale - 1) * minimap_stride
+                if blocked or cell & SOUTH:
+                    minimap_pixels[bottom:bottom + scale] = solid
+                else:
+                    minimap_pixels[bottom:bottom + scale - 1] = floor
+                    minimap_pixels[bottom + scale - 1] = wall
+        marker = None
+
+    def mark_player() -> Any:
+        """Move the player's marker on the minimap to the player's block."""
+        nonlocal marker
+        x, y = pl_x // 40 // step, pl_y // 40 // step
+        offset = y * scale * minimap_stride + x * scale
+        if marker is not None:
+            if marker[0] == offset:
+                return
+            for line, saved in enumerate(marker[1]):
+                start = marker[0] + line * minimap_stride
+                minimap_pixels[start:start + scale] = saved
+        saved = []
+        dot = array("I", [opaque(0xFF8000)]) * scale
+        for line in range(scale):
+            start = offset + line * minimap_stride
+            saved.append(array("I", minimap_pixels[start:start + scale]))
+            minimap_pixels[start:start + scale] = dot
+        marker = (offset, saved)
+
+    def draw_minimap() -> Any:
+        """Blit the minimap, if the maze has one and it is shown."""
+        if minimap is None or not show_minimap:
+            return
+        mark_player()
+        mlx1.mlx_put_image_to_window(k, win, minimap, minimap_x, 10)
+
+    if minimap is not None:
+        build_minimap()
+
+    show_path = False
 
-                if cell.south:
-                    for x in range(x_offset, x_offset + CELL):
-                        put_pixel(x, y_offset + CELL - 1, color)
+    def render() -> Any:
+        """Perform a complete render of the maze scene.
 
-                if sleep is True:
-                    time.sleep(0.001)
-                    mlx1.mlx_put_image_to_window(k, win, img, 0, 0)
+        Blits the cached scene image (background, 42 tiles, markers and
+        walls), the solution path if it is shown, then draws the player
+        sprite and the minimap on top.
+        """
+        mlx1.mlx_put_image_to_window(k, win, img, 0, 0)
+        if show_path:
+            draw_path()
+        player()
+        draw_minimap()
 
-                if cell.west:
-                    for y in range(y_offset, y_offset + CELL):
-                        put_pixel(x_offset, y, color)
+    # running and pending animations: [steps, step count, steps done,
+    # start time]
+    animations: Any = deque()
 
-                if cell.east:
-                    for y in range(y_offset, y_offset + CELL):
-                        put_pixel(x_offset + CELL - 1, y, color)
+    def animate(steps: Any, count: Any) -> Any:
+        """Queue an animation, played after the ones already queued.
 
-                x_offset += CELL
-            y_offset += CELL
+        Args:
+            steps: Iterator drawing one step into the scene image each time
+                it is advanced, such as ``draw_maze``.
+            count: Number of steps, used to pace it over ANIMATION_TIME.
+        """
+        animations.append([steps, count, 0, None])
 
-    draw_maze(mz, wall_color, True)
+    def on_frame(param: Any) -> Any:
+        """Advance the running animation by one frame.
 
-    def render() -> Any:
-        """Perform a complete render of the maze scene.
+        Called by MLX on every loop iteration. Draws as many steps as the
+        elapsed time calls for, so an animation lasts ANIMATION_TIME
+        whatever the maze size, but stops after FRAME_BUDGET seconds so the
+        key hook is never blocked for long. The frame is then blitted.
 
-        Draws all visual elements in the correct order: 42 path markers,
-        maze walls, the image buffer, and finally the player sprite.
+        Args:
+            param: Additional parameter passed by MLX (unused).
         """
-        draw_42(mz)
-        draw_maze(mz, wall_color, False)
-        mlx1.mlx_put_image_to_window(k, win, img, 0, 0)
-        player(pl_x, pl_y)
+        if not animations:
+            return
+        current = animations[0]
+        steps, count, done, started = current
+        now = time.perf_counter()
+        if started is None:
+            started = current[3] = now
+        target = count * (now - started) / ANIMATION_TIME
+        deadline = now + FRAME_BUDGET
+        while done < target and time.perf_counter() < deadline:
+            if next(steps, None) is None:
+                animations.popleft()
+                break
+            done += 1
+        current[2] = done
+        render()
+
+    def transition(old: Any) -> Any:
+        """Animation steps of G: erase the old walls, then draw the new scene.
 
+        Args:
+            old: The ``Grid`` of the maze being replaced.
+        """
+        yield from draw_maze(old, 0x000000)
+        build_scene()
+        yield True
+        yield from draw_maze(mz, wall_color)
+
+    def redraw_view() -> Any:
+        """Rebuild the scene at once after the view scrolled.
+
+        Pending animations are dropped: the rebuilt scene already shows the
+        current maze in the current color.
+        """
+        animations.clear()
+        build_scene()
+        for _ in draw_maze(mz, wall_color):
+            pass
+        render()
+
+    build_scene()
+    animate(draw_maze(mz, wall_color), columns * rows)
     render()
+
+    # scratch images used to re-blit single cells of the scene image; one
+    # per cell that can change on a move (the cell left and the cell
+    # entered)
+    tiles = []
+    for _ in range(2):
+        tile = mlx1.mlx_new_image(k, 40, 40)
+        tile_result = mlx1.mlx_get_data_addr(tile)
+        tiles.append((tile, tile_result[0].cast("I"), tile_result[2] // 4))
+
+    def redraw_cells(cells: Any, arrows: Any = None) -> Any:
+        """Redraw only the given cells instead of the whole window.
+
+        Each cell in view gets its 40x40 block of the scene image (copied
+        into a scratch image, since whole images are blitted), its arrow of
+        the path if it has one and the player if it stands there. The
+        minimap is drawn again on top.
+
+        Args:
+            cells: Up to two (x, y) cells whose content changed.
+            arrows: The arrows of the shown path, from ``path_arrows``.
+        """
+        for (x, y), (tile, tile_pixels, tile_stride) in zip(cells, tiles):
+            if not in_view(x, y):
+                continue
+            source = (y - cam_y) * 40 * stride + (x - cam_x) * 40
+            for row in range(0, 40 * tile_stride, tile_stride):
+                tile_pixels[row:row + 40] = pixels[source:source + 40]
+                source += stride
+            mlx1.mlx_put_image_to_window(k, win, tile, (x - cam_x) * 40,
+                                         (y - cam_y) * 40)
+            if arrows and (x, y) in arrows:
+                draw_arrow(x, y, arrows[(x, y)])
+            if (x, y) == (pl_x // 40, pl_y // 40):
+                player()
+        draw_minimap()
+
     prev_x = 0
     prev_y = 0
 
     def regenerate_maze() -> Any:
         """Generate and display a new maze, resetting the player position.
 
-        Creates a new maze using the same parameters as the original,
-        animates the transition by erasing the old maze and drawing the new
-        one, and resets the player to the entry point.
+        Takes the next maze from ``next_maze``, animates the transition by
+        erasing the old maze and drawing the new one into a rebuilt scene
+        image, and resets the player to the entry point.
         """
-        nonlocal pl_x, pl_y
+        if next_maze is None:
+            return
+        nonlocal pl_x, pl_y, show_path
         pl_x = ENTRY[0] * 40 + 10
         pl_y = ENTRY[1] * 40 + 10
-        nonlocal mz
-        maze = MazeGenerator(width, length, ENTRY, EXIT, output_file)
-        if seed:
-            random.seed(1)
-        try:
-            if not is_perfect:
-                maze.creat_maze_prims_algo()
-            else:
-                maze.creat_maze_bakctracker_algo()
-            maze.creat_output_file(pathfinder(maze.maze, ENTRY, EXIT, width,
-                                              length))
-        except InvalidDistinationFor42Path as e:
-            print(e)
-            if not is_perfect:
-                maze.remove_walls_prims_algo()
-            else:
-                maze.remove_walls_backtracker_algo()
-            maze.creat_output_file(pathfinder(maze.maze, ENTRY, EXIT, width,
-                                              length))
-        except InvalidEntryExitPoint as e:
-            print(f"Error: {e}")
-            sys.exit()
-
-        new_maze = maze.maze
-        back_img()
-        back_img()
-        draw_maze(mz, 0x000000, True)
-        draw_maze(new_maze, wall_color, True)
-        mlx1.mlx_put_image_to_window(
-            k, win, path_start_img, ENTRY[0] * 40 + 10, ENTRY[1] * 40 + 10)
-        mlx1.mlx_put_image_to_window(
-            k, win, path_end_img, EXIT[0] * 40 + 10, EXIT[1] * 40 + 10)
-        mz = new_maze
+        show_path = False
+        nonlocal mz, perfect, field, tracker
+        maze = next_maze()
+        old = mz
+        mz = maze.grid
+        perfect = maze.perfect
+        field = tracker = None
+        if minimap is not None:
+            build_minimap()
+        if follow_player():
+            # the old walls are out of view: no erase animation
+            animations.clear()
+            build_scene()
+            animate(draw_maze(mz, wall_color), columns * rows)
+        else:
+            animate(transition(old), 2 * columns * rows + 1)
 
     def on_key(keycode: Any, param: Any) -> Any:
         """Handle keyboard input events for player interaction.
@@ -374,8 +636,10 @@ def mlx_render(width: Any, length: Any, ENTRY: Any, EXIT: Any,
             - 112 (P): Show solution path
             - 103 (G): Generate new maze
             - 104 (H): Hide path and refresh display
+            - 109 (M): Show or hide the minimap
         """
-        nonlocal pl_x, pl_y, wall_color, prev_x, prev_y
+        nonlocal pl_x, pl_y, wall_color, prev_x, prev_y, show_path
+        nonlocal show_minimap
         prev_x = pl_x
         prev_y = pl_y
         is_moved = False
@@ -385,7 +649,10 @@ def mlx_render(width: Any, length: Any, ENTRY: Any, EXIT: Any,
 
         if keycode == 99:
             wall_color = random.choice(colors)
-            draw_maze(mz, wall_color, True)
+            # same walls, new color: redrawn in place in the scene image
+            animate(draw_maze(mz, wall_color), columns * rows)
+            if minimap is not None:
+                build_minimap()
 
         if keycode == 65364 and mz[pl_y // 40][pl_x // 40].south is False:
             is_moved = True
@@ -404,37 +671,54 @@ def mlx_render(width: Any, length: Any, ENTRY: Any, EXIT: Any,
             pl_x -= 40
 
         if is_moved is True:
+            cells = [(prev_x // 40, prev_y // 40),
+                     (pl_x // 40, pl_y // 40)]
+            # front of the path before the tracker follows the move
+            tracking = show_path and tracker is not None
+            if tracking:
+                old_arrows = head_arrows(cells[0])
+                solves = tracker.full_solves
+            if tracker is not None:
+                tracker.move((pl_x // 40, pl_y // 40))
             if (pl_x, pl_y) == (EXIT[0] * 40 + 10, EXIT[1] * 40 + 10):
                 mlx1.mlx_loop_exit(k)
-            mlx1.mlx_put_image_to_window(
-                k, win, bg_img, prev_x - 10, prev_y - 10)
-            mlx1.mlx_put_image_to_window(k, win, bg_img, pl_x - 10, pl_y - 10)
-            mlx1.mlx_put_image_to_window(
-                k, win, path_start_img, ENTRY[0] * 40 + 10, ENTRY[1] * 40 + 10)
+            if follow_player():
+                redraw_view()
+            elif not tracking:
+                redraw_cells(cells)
+            elif tracker.full_solves != solves:
+                # the tracker solved the path again: redraw it all
+                render()
+            else:
+                new_arrows = head_arrows(cells[1])
+                # cells further along are shared by both paths, so only
+                # cells in both heads can have had their arrow change
+                cells += [cell for cell in old_arrows.keys() & new_arrows
+                          if old_arrows[cell] != new_arrows[cell]
+                          and cell not in cells]
+                arrows = {cell: direction_i
+                          for cell, direction_i in new_arrows.items()
+                          if direction_i is not None}
+                if len(cells) > len(tiles):
+                    render()
+                else:
+                    redraw_cells(cells, arrows)
 
         if keycode == 112:
-            back_img()
-            back_img()
-            mlx1.mlx_put_image_to_window(
-                k, win, path_start_img, ENTRY[0] * 40 + 10, ENTRY[1] * 40 + 10)
-            mlx1.mlx_put_image_to_window(
-                k, win, path_end_img, EXIT[0] * 40 + 10, EXIT[1] * 40 + 10)
-            player(pl_x, pl_y)
-            draw_path()
+            show_path = True
 
         if keycode == 103:
             regenerate_maze()
 
         if keycode == 104:
-            back_img()
-            back_img()
-            mlx1.mlx_put_image_to_window(
-                k, win, path_start_img, ENTRY[0] * 40 + 10, ENTRY[1] * 40 + 10)
-            mlx1.mlx_put_image_to_window(
-                k, win, path_end_img, EXIT[0] * 40 + 10, EXIT[1] * 40 + 10)
-            player(pl_x, pl_y)
+            show_path = False
 
-        render()
+        if keycode == 109:
+            show_minimap = not show_minimap
+
+        if keycode in (99, 103, 104, 109, 112):
+            render()
 
     mlx1.mlx_key_hook(win, on_key, None)
+    mlx1.mlx_loop_hook(k, on_frame, None)
     mlx1.mlx_loop(k)
@@ -15,5 +15,5 @@ setup(
     name="mazegen",
     version="1.0.0",
     python_requires=">=3",
-    packages=find_packages()
+    packages=find_packages(exclude=["tests"])
 )
@@ -0,0 +1,142 @@
+"""Shared helpers of the test suite."""
+
+import random
+from typing import Any
+
+from maze.grid import EAST, NORTH, SOUTH, WEST, Grid
+from maze.mazegen import MazeGenerator
+
+
+def seeded(seed: int) -> Any:
+    """Return the random source a generator seeded with ``seed`` draws."""
+    return random.Random(seed)
+
+
+def generator(width: int, height: int, entry: Any, exit: Any,
+              seed: int) -> MazeGenerator:
+    """Create a generator whose maze depends only on ``seed``."""
+    return MazeGenerator(width, height, entry, exit, None, seed=seed)
+
+
+def check_walls(grid: Grid) -> None:
+    """Assert that neighbours agree on shared walls and borders are closed."""
+    width, height = grid.width, grid.height
+    walls = grid.walls
+    for index in range(width * height):
+        x, y = index % width, index // width
+        mask = walls[index]
+        if x + 1 < width:
+            assert bool(mask & EAST) == bool(walls[index + 1] & WEST)
+        else:
+            assert mask & EAST
+        if y + 1 < height:
+            assert bool(mask & SOUTH) == bool(walls[index + width] & NORTH)
+        else:
+            assert mask & SOUTH
+        if not x:
+            assert mask & WEST
+        if not y:
+            assert mask & NORTH
+
+
+def passages(grid: Grid) -> int:
+    """Count the open walls between neighbouring cells."""
+    return sum(not mask & EAST for mask in grid.walls) + sum(
+        not mask & SOUTH for mask in grid.walls)
+
+
+def reachable(grid: Grid, start: int = 0) -> set[int]:
+    """Return the flat indices of the cells reachable from ``start``."""
+    width = grid.width
+    walls = grid.walls
+    seen = {start}
+    stack = [start]
+    while stack:
+        index = stack.pop()
+        mask = walls[index]
+        for wall, other in ((NORTH, index - width), (EAST, index + 1),
+                            (SOUTH, index + width), (WEST, index - 1)):
+            if not mask & wall and other not in seen:
+                seen.add(other)
+                stack.append(other)
+    return seen
+
+
+def with_loops(grid: Grid, seed: int, count: int) -> Grid:
+    """Carve ``count`` extra random passages, keeping the 42 pattern."""
+    rng = random.Random(seed)
+    width = grid.width
+    size = width * grid.height
+    while count:
+        index = rng.randrange(size)
+        step = rng.choice((1, width))
+        other = index + step
+        if (other >= size or (step == 1 and not other % width)
+                or grid.is_blocked(index) or grid.is_blocked(other)):
+            continue
+        grid.carve(index, other)
+        count -= 1
+    return grid
+
+
+def loopy(width: int, height: int, seed: int, loops: int) -> Grid:
+    """Generate a maze with the 42 pattern and ``loops`` extra passages."""
+    maze = generator(width, height, (0, 0), (width - 1, height - 1), seed)
+    if width < 9 or height < 9:
+        maze.remove_walls_backtracker_algo()
+    else:
+        maze.creat_maze_bakctracker_algo()
+    return with_loops(maze.maze, seed, loops)
+
+
+def is_walk(grid: Grid, path: list[tuple[int, int]]) -> bool:
+    """Return True if consecutive cells of ``path`` share an open side."""
+    for (x1, y1), (x2, y2) in zip(path, path[1:]):
+        cell = grid[y1][x1]
+        if (x2, y2) == (x1 + 1, y1) and not cell.east:
+            continue
+        if (x2, y2) == (x1 - 1, y1) and not cell.west:
+            continue
+        if (x2, y2) == (x1, y1 + 1) and not cell.south:
+            continue
+        if (x2, y2) == (x1, y1 - 1) and not cell.north:
+            continue
+        return False
+    return True
+
+
+def distances(grid: Grid, start: tuple[int, int]) -> dict[tuple[int, int],
+                                                          int]:
+    """Return the BFS distance of every cell reachable from ``start``."""
+    found = {start: 0}
+    frontier = [start]
+    while frontier:
+        following = []
+        for x, y in frontier:
+            cell = grid[y][x]
+            for wall, other in ((cell.north, (x, y - 1)),
+                                (cell.east, (x + 1, y)),
+                                (cell.south, (x, y + 1)),
+                                (cell.west, (x - 1, y))):
+                if not wall and other not in found:
+                    found[other] = found[(x, y)] + 1
+                    following.append(other)
+        frontier = following
+    return found
+
+
+def open_cells(grid: Grid) -> list[int]:
+    """Return the flat indices of the cells outside the 42 pattern."""
+    return [index for index in range(grid.width * grid.height)
+            if not grid.is_blocked(index)]
+
+
+def assert_spanning_tree(grid: Grid) -> None:
+    """Assert that the open cells form a spanning tree of the grid."""
+    check_walls(grid)
+    cells = open_cells(grid)
+    for index in range(grid.width * grid.height):
+        if grid.is_blocked(index):
+            assert grid.walls[index] == NORTH | EAST | SOUTH | WEST
+    assert reachable(grid, cells[0]) == set(cells)
+    assert passages(grid) == len(cells) - 1
@@ -0,0 +1,53 @@
+"""Tests for the iterative recursive-backtracker generator."""
+
+from typing import Any
+
+import pytest
+
+from maze.mazegen import MazeGenerator
+from tests.helpers import assert_spanning_tree, generator, seeded
+
+
+def recursive_walls(width: int, height: int, seed: int) -> bytes:
+    """Carve a maze with the former recursive backtracker."""
+    maze = MazeGenerator(width, height, (0, 0), (width - 1, height - 1),
+                         None)
+    if width >= 9 and height >= 9:
+        maze.creat_42_pathren()
+    grid = maze.maze
+    rng = seeded(seed)
+
+    def carve(i: int, j: int) -> None:
+        index = grid.index(i, j)
+        grid.mark_visited(index)
+        neighbors: Any = maze.find_nighbors((i, j))
+        while neighbors:
+            new_x, new_y, _ = rng.choice(neighbors)
+            new_index = grid.index(new_x, new_y)
+            grid.mark_visited(new_index)
+            grid.carve(index, new_index)
+            carve(new_x, new_y)
+            neighbors = maze.find_nighbors((i, j))
+
+    carve(0, 0)
+    return bytes(grid.walls)
+
+
+@pytest.mark.parametrize("width, height, seed", [
+    (5, 4, 0), (12, 9, 1), (20, 15, 2), (31, 17, 3)])
+def test_same_maze_as_recursive_version(width: int, height: int,
+                                        seed: int) -> None:
+    expected = recursive_walls(width, height, seed)
+    maze = generator(width, height, (0, 0), (width - 1, height - 1), seed)
+    if width >= 9 and height >= 9:
+        maze.creat_maze_bakctracker_algo()
+    else:
+        maze.remove_walls_backtracker_algo()
+    assert bytes(maze.maze.walls) == expected
+    assert_spanning_tree(maze.maze)
+
+
+def test_large_maze_does_not_recurse() -> None:
+    maze = generator(100, 100, (0, 0), (99, 99), 4)
+    maze.creat_maze_bakctracker_algo()
+    assert_spanning_tree(maze.maze)
@@ -0,0 +1,46 @@
+"""Tests for parallel batch generation."""
+
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from maze.batch import batch_file, generate_batch
+
+
+def configs(tmp_path: Path, perfect: bool) -> dict[str, Any]:
+    """Return a parsed configuration writing into ``tmp_path``."""
+    return {"WIDTH": 17, "HEIGHT": 11, "ENTRY": (0, 0), "EXIT": (16, 10),
+            "OUTPUT_FILE": str(tmp_path / "maze.txt"), "PERFECT": perfect}
+
+
+def test_batch_file_names() -> None:
+    assert batch_file("out/maze.txt", 7, 12) == "out/maze_07.txt"
+    assert batch_file("maze.txt", 0, 1) == "maze_0.txt"
+
+
+@pytest.mark.parametrize("perfect", [True, False])
+def test_batch_is_identical_across_workers(tmp_path: Path,
+                                           perfect: bool) -> None:
+    (tmp_path / "one").mkdir()
+    (tmp_path / "two").mkdir()
+    serial = generate_batch(configs(tmp_path / "one", perfect), 6,
+                            base_seed=40, workers=1)
+    parallel = generate_batch(configs(tmp_path / "two", perfect), 6,
+                              base_seed=40, workers=2)
+    assert [Path(name).name for name in serial] == [
+        f"maze_{i}.txt" for i in range(6)]
+    contents = [Path(name).read_bytes() for name in serial]
+    assert contents == [Path(name).read_bytes() for name in parallel]
+    assert len(set(contents)) == 6
+
+
+def test_job_depends_only_on_its_seed(tmp_path: Path) -> None:
+    (tmp_path / "a").mkdir()
+    (tmp_path / "b").mkdir()
+    whole = generate_batch(configs(tmp_path / "a", True), 4, base_seed=10,
+                           workers=1)
+    tail = generate_batch(configs(tmp_path / "b", True), 2, base_seed=12,
+                          workers=1)
+    assert ([Path(name).read_bytes() for name in whole[2:]]
+            == [Path(name).read_bytes() for name in tail])
@@ -0,0 +1,50 @@
+"""Cross-checks of the distance field against BFS."""
+
+import pytest
+
+from maze.grid import Grid
+from maze.pathfinder import UNREACHABLE, DistanceField
+from tests.helpers import distances, is_walk, loopy
+
+
+@pytest.mark.parametrize("loops", [0, 40])
+def test_distance_field_matches_bfs(loops: int) -> None:
+    grid = loopy(22, 15, 8, loops)
+    exit = (21, 14)
+    field = DistanceField(grid, 22, 15, exit)
+    found = distances(grid, exit)
+    for y in range(15):
+        for x in range(22):
+            if (x, y) not in found:
+                assert field.distance_from((x, y)) == UNREACHABLE
+                assert field.path_from((x, y)) == []
+                continue
+            path = field.path_from((x, y))
+            assert field.distance_from((x, y)) == found[(x, y)]
+            assert len(path) == found[(x, y)] + 1
+            assert (path[0], path[-1]) == ((x, y), exit)
+            assert is_walk(grid, path)
+
+
+def test_target_and_isolated_cells() -> None:
+    grid = Grid(3, 1)
+    grid.carve(1, 2)
+    field = DistanceField(grid, 3, 1, (2, 0))
+    assert field.path_from((2, 0)) == [(2, 0)]
+    assert field.path_from((1, 0)) == [(1, 0), (2, 0)]
+    assert field.distance_from((0, 0)) == UNREACHABLE
+    assert field.path_from((0, 0)) == []
+    assert field.on_path((2, 0), (1, 0))
+    assert not field.on_path((0, 0), (0, 0))
+    assert not field.on_path((2, 0), (0, 0))
+
+
+@pytest.mark.parametrize("loops", [0, 40])
+def test_on_path_matches_path_from(loops: int) -> None:
+    grid = loopy(12, 10, 3, loops)
+    field = DistanceField(grid, 12, 10, (11, 9))
+    cells = [(x, y) for y in range(10) for x in range(12)]
+    for start in cells:
+        path = set(field.path_from(start))
+        for cell in cells:
+            assert field.on_path(cell, start) == (cell in path)
@@ -0,0 +1,88 @@
+"""Round-trip and validation tests for the hex maze file reader."""
+
+from pathlib import Path
+
+import pytest
+
+from maze.hexfile import load_output_file
+from maze.pathfinder import pathfinder
+from tests.helpers import generator
+from utils.errors import InvalidMazeFile
+
+# 2x1 maze with a passage between its two cells
+VALID = "D7\n\n0, 0\n1, 0\nE\n"
+
+
+@pytest.mark.parametrize("width, height, perfect", [
+    (6, 6, True), (20, 15, True), (20, 15, False), (31, 9, True)])
+def test_round_trip(tmp_path: Path, width: int, height: int,
+                    perfect: bool) -> None:
+    exit = (width - 1, height - 1)
+    maze = generator(width, height, (0, 0), exit, width * height)
+    maze.out_file = str(tmp_path / "maze.txt")
+    if width < 9 or height < 9:
+        maze.remove_walls_backtracker_algo()
+    elif perfect:
+        maze.creat_maze_bakctracker_algo()
+    else:
+        maze.creat_maze_prims_algo()
+    path = pathfinder(maze.maze, (0, 0), exit, width, height)
+    maze.creat_output_file(path)
+    loaded, solution = load_output_file(maze.out_file)
+    assert loaded.maze.walls == maze.maze.walls
+    assert loaded.maze.blocked == maze.maze.blocked
+    assert (loaded.entry, loaded.exit) == (maze.entry, maze.exit)
+    assert solution == path
+
+
+def test_file_without_path_line(tmp_path: Path) -> None:
+    path = tmp_path / "maze.txt"
+    path.write_text("D7\n\n0, 0\n1, 0\n")
+    generator, solution = load_output_file(str(path))
+    assert solution is None
+    assert bytes(generator.maze.walls) == bytes([13, 7])
+
+
+def test_lowercase_and_crlf(tmp_path: Path) -> None:
+    path = tmp_path / "maze.txt"
+    path.write_bytes(b"d7\r\n\r\n0, 0\r\n1, 0\r\nE\r\n")
+    _, solution = load_output_file(str(path))
+    assert solution == [(0, 0), (1, 0)]
+
+
+@pytest.mark.parametrize("content, message", [
+    ("", "holds no maze"),
+    ("DX\n\n0, 0\n1, 0\nE\n", "invalid hex digit in column 1"),
+    ("D7\nD\n\n0, 0\n1, 0\n", "expected 2 cells, got 1"),
+    ("C6\n\n0, 0\n1, 0\nE\n", "north border is open"),
+    ("57\n\n0, 0\n1, 0\nE\n", "west or east border is open"),
+    ("F7\n\n0, 0\n1, 0\nE\n", "east and west walls disagree in column 0"),
+    ("D3\nFF\n\n0, 0\n1, 0\n", "disagrees with the row above in column 1"),
+    ("93\n\n0, 0\n1, 0\nE\n", "south border is open"),
+    ("D7\n\n0, 0\n", "missing entry/exit lines"),
+    ("D7\n\n0 0\n1, 0\nE\n", "invalid entry line"),
+    ("D7\n\n0, 0\n2, 0\nE\n", r"exit \(2, 0\) is out of the maze"),
+    ("D7\n\n0, 0\n1, 0\nX\n", "invalid move 'X'"),
+    ("D7\n\n0, 0\n1, 0\nN\n", r"move 1 \('N'\) goes through a wall"),
+    ("D7\n\n0, 0\n1, 0\nEW\n", "does not end at the exit"),
+    ("FF\n\n0, 0\n1, 0\n", "exit cannot be reached"),
+])
+def test_invalid_files_are_rejected(tmp_path: Path, content: str,
+                                    message: str) -> None:
+    path = tmp_path / "maze.txt"
+    path.write_text(content)
+    with pytest.raises(InvalidMazeFile, match=message):
+        load_output_file(str(path))
+
+
+def test_missing_file_is_rejected(tmp_path: Path) -> None:
+    with pytest.raises(InvalidMazeFile, match="cannot read"):
+        load_output_file(str(tmp_path / "missing.txt"))
+
+
+def test_valid_sample(tmp_path: Path) -> None:
+    path = tmp_path / "maze.txt"
+    path.write_text(VALID)
+    generator, solution = load_output_file(str(path), "out.txt")
+    assert solution == [(0, 0), (1, 0)]
+    assert generator.out_file == "out.txt"
@@ -0,0 +1,58 @@
+"""Tests for the table-driven hex output writer."""
+
+from pathlib import Path
+
+import pytest
+
+from maze.mazegen import Cell, MazeGenerator
+from maze.pathfinder import pathfinder
+from tests.helpers import generator
+
+
+def reference_output(maze: MazeGenerator, path: list[tuple[int, int]]) -> str:
+    """Format a maze file one cell at a time from the wall booleans."""
+    lines = []
+    for row in maze.maze:
+        lines.append("".join(
+            "0123456789ABCDEF"[cell.north | cell.east << 1
+                               | cell.south << 2 | cell.west << 3]
+            for cell in row))
+    lines += ["", f"{maze.entry[0]}, {maze.entry[1]}",
+              f"{maze.exit[0]}, {maze.exit[1]}", maze.print_path(path), ""]
+    return "\n".join(lines)
+
+
+@pytest.mark.parametrize("width, height, perfect", [
+    (2, 1, True), (20, 15, True), (20, 15, False), (77, 31, True)])
+def test_output_file_is_byte_identical(tmp_path: Path, width: int,
+                                       height: int, perfect: bool) -> None:
+    exit = (width - 1, height - 1)
+    maze = generator(width, height, (0, 0), exit, width + height)
+    maze.out_file = str(tmp_path / "maze.txt")
+    if width < 9 or height < 9:
+        maze.remove_walls_backtracker_algo()
+    elif perfect:
+        maze.creat_maze_bakctracker_algo()
+    else:
+        maze.creat_maze_prims_algo()
+    path = pathfinder(maze.maze, (0, 0), exit, width, height)
+    maze.creat_output_file(path)
+    assert (Path(maze.out_file).read_bytes()
+            == reference_output(maze, path).encode())
+
+
+@pytest.mark.parametrize("rows_per_chunk", [1, 2, 7, 31, 100])
+def test_chunking_does_not_change_output(rows_per_chunk: int) -> None:
+    maze = generator(23, 31, (0, 0), (22, 30), 3)
+    maze.creat_maze_bakctracker_algo()
+    expected = b"".join(maze.hex_rows())
+    assert b"".join(maze.hex_rows(rows_per_chunk)) == expected
+    assert expected.count(b"\n") == 31
+
+
+def test_cell_digits() -> None:
+    for mask in range(16):
+        cell = Cell()
+        cell.north, cell.east = bool(mask & 1), bool(mask & 2)
+        cell.south, cell.west = bool(mask & 4), bool(mask & 8)
+        assert MazeGenerator.print_walls_as_hex(cell) == f"{mask:X}"
@@ -0,0 +1,105 @@
+"""Tests for the offscreen PNG/PPM export."""
+
+import struct
+import zlib
+from pathlib import Path
+
+import pytest
+
+from maze.image import (ENTRY_COLOR, EXIT_COLOR, PATH_COLOR, PATTERN_COLOR,
+                        export_image, scanlines)
+from maze.service import Maze, build_maze
+
+
+def read_png(path: Path) -> tuple[int, int, bytes]:
+    """Check the chunks of a PNG and return its size and raw lines."""
+    data = path.read_bytes()
+    assert data[:8] == b"\x89PNG\r\n\x1a\n"
+    position = 8
+    kinds = []
+    compressed = b""
+    header = b""
+    while position < len(data):
+        length, = struct.unpack(">I", data[position:position + 4])
+        kind = data[position + 4:position + 8]
+        payload = data[position + 8:position + 8 + length]
+        crc, = struct.unpack(">I", data[position + 8 + length:
+                                        position + 12 + length])
+        assert crc == zlib.crc32(kind + payload)
+        kinds.append(kind)
+        if kind == b"IHDR":
+            header = payload
+        elif kind == b"IDAT":
+            compressed += payload
+        position += 12 + length
+    assert kinds[0] == b"IHDR" and kinds[-1] == b"IEND"
+    assert set(kinds[1:-1]) == {b"IDAT"}
+    width, height, depth, color, _, _, _ = struct.unpack(">IIBBBBB", header)
+    assert (depth, color) == (8, 2)
+    return width, height, zlib.decompress(compressed)
+
+
+def read_ppm(path: Path) -> tuple[int, int, bytes]:
+    """Parse a binary PPM and return its size and pixels."""
+    magic, size, top, pixels = path.read_bytes().split(b"\n", 3)
+    assert (magic, top) == (b"P6", b"255")
+    width, height = map(int, size.split())
+    assert len(pixels) == width * height * 3
+    return width, height, pixels
+
+
+def pixel(pixels: bytes, width: int, x: int, y: int) -> int:
+    """Return the RGB color at (x, y) of tightly packed pixels."""
+    offset = (y * width + x) * 3
+    return int.from_bytes(pixels[offset:offset + 3], "big")
+
+
+@pytest.fixture
+def maze() -> Maze:
+    return build_maze(20, 15, (0, 0), (19, 14), True, seed=2)
+
+
+@pytest.mark.parametrize("cell_size", [3, 10, 13])
+def test_png_and_ppm_hold_the_same_pixels(tmp_path: Path, maze: Maze,
+                                          cell_size: int) -> None:
+    export_image(maze, str(tmp_path / "maze.png"), cell_size)
+    export_image(maze, str(tmp_path / "maze.ppm"), cell_size)
+    width, height, raw = read_png(tmp_path / "maze.png")
+    assert (width, height) == (20 * cell_size, 15 * cell_size)
+    assert read_ppm(tmp_path / "maze.ppm") == (width, height, b"".join(
+        raw[i + 1:i + 1 + width * 3]
+        for i in range(0, len(raw), width * 3 + 1)))
+    assert raw[::width * 3 + 1] == bytes(height)
+    assert b"".join(scanlines(maze, cell_size)) == read_ppm(
+        tmp_path / "maze.ppm")[2]
+
+
+def test_cells_are_coloured(tmp_path: Path, maze: Maze) -> None:
+    export_image(maze, str(tmp_path / "maze.ppm"), 10, wall_color=0x123456)
+    width, _, pixels = read_ppm(tmp_path / "maze.ppm")
+    assert pixel(pixels, width, 0, 0) == 0x123456
+    assert pixel(pixels, width, 5, 5) == ENTRY_COLOR
+    assert pixel(pixels, width, 195, 145) == EXIT_COLOR
+    x, y = maze.solution[len(maze.solution) // 2]
+    assert pixel(pixels, width, x * 10 + 5, y * 10 + 5) == PATH_COLOR
+    x, y = next((x, y) for y in range(15) for x in range(20)
+                if maze.grid[y][x]._42_path)
+    assert pixel(pixels, width, x * 10 + 5, y * 10 + 5) == PATTERN_COLOR
+
+
+def test_large_png_spans_several_chunks(tmp_path: Path) -> None:
+    maze = build_maze(400, 300, (0, 0), (399, 299), False, seed=4)
+    export_image(maze, str(tmp_path / "maze.png"), 12)
+    assert (tmp_path / "maze.png").read_bytes().count(b"IDAT") > 1
+    width, height, raw = read_png(tmp_path / "maze.png")
+    assert len(raw) == height * (width * 3 + 1)
+
+
+@pytest.mark.parametrize("name, cell_size, message", [
+    ("maze.jpg", 10, "unsupported image format '.jpg'"),
+    ("maze.png", 2, "at least 3 pixels")])
+def test_bad_arguments_are_rejected(tmp_path: Path, maze: Maze, name: str,
+                                    cell_size: int, message: str) -> None:
+    with pytest.raises(ValueError, match=message):
+        export_image(maze, str(tmp_path / name), cell_size)
+    assert not (tmp_path / name).exists()
@@ -0,0 +1,85 @@
+"""Round-trip and rejection tests for the packed binary maze format."""
+
+from pathlib import Path
+
+import pytest
+
+from maze.mazegen import MazeGenerator
+from maze.packed import (HEADER, load_packed, pack_moves, pack_walls,
+                         save_packed, unpack_moves, unpack_walls)
+from maze.pathfinder import pathfinder
+from tests.helpers import generator
+from utils.errors import InvalidMazeFile
+
+
+def solved(width: int, height: int, seed: int) -> tuple[MazeGenerator, str]:
+    """Generate a maze and its solution moves."""
+    maze = generator(width, height, (0, 0), (width - 1, height - 1), seed)
+    maze.creat_maze_bakctracker_algo()
+    path = pathfinder(maze.maze, maze.entry, maze.exit, width, height)
+    return maze, maze.print_path(path)
+
+
+@pytest.mark.parametrize("size", [0, 1, 2, 7, 16, 333])
+def test_walls_round_trip(size: int) -> None:
+    walls = bytes(i * 7 % 16 for i in range(size))
+    packed = b"".join(pack_walls(walls))
+    assert len(packed) == (size + 1) // 2
+    assert unpack_walls(packed, size) == walls
+
+
+@pytest.mark.parametrize("moves", ["", "N", "ESW", "NESW", "SSEEWNNE" * 9])
+def test_moves_round_trip(moves: str) -> None:
+    assert unpack_moves(pack_moves(moves), len(moves)) == moves
+
+
+def test_save_and_load(tmp_path: Path) -> None:
+    maze, moves = solved(21, 15, 3)
+    path = str(tmp_path / "maze.amz")
+    save_packed(maze, path, solution=moves, seed=3, algorithm="backtracker")
+    with load_packed(path) as saved:
+        assert saved.grid.walls[:] == bytes(maze.maze.walls)
+        assert saved.grid.blocked == maze.maze.blocked
+        assert saved.grid.unpacked().walls == maze.maze.walls
+        assert (saved.entry, saved.exit) == (maze.entry, maze.exit)
+        assert (saved.seed, saved.algorithm) == (3, "backtracker")
+        assert saved.solution == moves
+        assert maze.print_path(pathfinder(saved.grid, saved.entry,
+                                          saved.exit, 21, 15)) == moves
+
+
+def test_save_without_solution(tmp_path: Path) -> None:
+    maze = generator(7, 6, (0, 0), (6, 5), 1)
+    maze.remove_walls_prims_algo()
+    path = str(tmp_path / "maze.amz")
+    save_packed(maze, path)
+    with load_packed(path) as saved:
+        assert saved.grid.walls[:] == bytes(maze.maze.walls)
+        assert not any(saved.grid.blocked)
+        assert (saved.seed, saved.algorithm) == (None, "unknown")
+        assert saved.solution is None
+
+
+@pytest.mark.parametrize("cut, message", [
+    (0, "is empty"),
+    (HEADER.size - 1, "is truncated"),
+    (HEADER.size + 3, "is truncated"),
+])
+def test_truncated_files_are_rejected(tmp_path: Path, cut: int,
+                                      message: str) -> None:
+    maze, moves = solved(10, 10, 5)
+    path = str(tmp_path / "maze.amz")
+    save_packed(maze, path, solution=moves)
+    with open(path, "rb") as file:
+        data = file.read()
+    with open(path, "wb") as file:
+        file.write(data[:cut])
+    with pytest.raises(InvalidMazeFile, match=message):
+        load_packed(path)
+
+
+def test_foreign_file_is_rejected(tmp_path: Path) -> None:
+    path = tmp_path / "maze.amz"
+    path.write_bytes(b"PNG?" + bytes(HEADER.size))
+    with pytest.raises(InvalidMazeFile, match="is not a packed maze"):
+        load_packed(str(path))
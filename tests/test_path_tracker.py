@@ -0,0 +1,43 @@
+"""Tests for the incrementally repaired hint path."""
+
+import random
+
+import pytest
+
+from maze.pathfinder import DistanceField, PathTracker, pathfinder
+from tests.helpers import is_walk, loopy
+
+
+@pytest.mark.parametrize("loops", [0, 30])
+def test_tracker_follows_random_walk(loops: int) -> None:
+    grid = loopy(20, 14, 4, loops)
+    exit = (19, 13)
+    field = DistanceField(grid, 20, 14, exit)
+    tracker = PathTracker(field.path_from, (0, 0), perfect=not loops)
+    rng = random.Random(loops)
+    position = (0, 0)
+    for _ in range(300):
+        expected = pathfinder(grid, position, exit, 20, 14)
+        assert len(tracker.path) == len(expected)
+        assert tracker.path[0] == position and tracker.path[-1] == exit
+        assert is_walk(grid, tracker.path)
+        x, y = position
+        position = rng.choice([cell for cell in ((x + 1, y), (x - 1, y),
+                                                 (x, y + 1), (x, y - 1))
+                               if is_walk(grid, [(x, y), cell])])
+        tracker.move(position)
+    if not loops:
+        assert tracker.full_solves == 1
+
+
+def test_jumps_fall_back_to_a_full_solve() -> None:
+    grid = loopy(12, 10, 2, 0)
+    field = DistanceField(grid, 12, 10, (11, 9))
+    tracker = PathTracker(field.path_from, (0, 0))
+    tracker.move((0, 0))
+    assert tracker.full_solves == 1
+    tracker.move((5, 0))
+    assert tracker.full_solves == 2
+    assert tracker.path == field.path_from((5, 0))
+    tracker.reset((0, 9))
+    assert tracker.path == field.path_from((0, 9))
@@ -0,0 +1,79 @@
+"""Tests for the flat-index BFS and the pathfinder wrapper."""
+
+import random
+from typing import Any
+
+import pytest
+
+from maze.grid import Grid
+from maze.mazegen import Cell
+from maze.pathfinder import SearchBuffers, bfs, pathfinder
+from tests.helpers import distances, is_walk, loopy
+
+# register_solver types bfs as a plain Solver, which hides its optional
+# buffers argument
+search: Any = bfs
+
+
+@pytest.mark.parametrize("seed, loops", [(0, 0), (1, 10), (2, 60)])
+def test_pathfinder_finds_shortest_paths(seed: int, loops: int) -> None:
+    grid = loopy(24, 17, seed, loops)
+    rng = random.Random(seed)
+    for _ in range(20):
+        a = (rng.randrange(24), rng.randrange(17))
+        b = (rng.randrange(24), rng.randrange(17))
+        found = distances(grid, a)
+        path = pathfinder(grid, a, b, 24, 17)
+        if b not in found:
+            assert path == []
+            continue
+        assert len(path) == found[b] + 1
+        assert (path[0], path[-1]) == (a, b)
+        assert is_walk(grid, path)
+
+
+def test_unreachable_target_gives_empty_path() -> None:
+    grid = Grid(3, 2)
+    grid.carve(0, 1)
+    assert pathfinder(grid, (0, 0), (2, 1), 3, 2) == []
+    assert pathfinder(grid, (0, 0), (1, 0), 3, 2) == [(0, 0), (1, 0)]
+    assert pathfinder(grid, (2, 1), (2, 1), 3, 2) == [(2, 1)]
+
+
+def test_cell_lists_are_accepted() -> None:
+    grid = loopy(12, 10, 3, 5)
+    cells: list[list[Cell]] = []
+    for row in grid:
+        cells.append([])
+        for view in row:
+            cell = Cell()
+            cell.north, cell.east = view.north, view.east
+            cell.south, cell.west = view.south, view.west
+            cells[-1].append(cell)
+    assert (pathfinder(cells, (0, 0), (11, 9), 12, 10)
+            == pathfinder(grid, (0, 0), (11, 9), 12, 10))
+
+
+def test_buffers_are_reused_across_sizes() -> None:
+    buffers = SearchBuffers()
+    small = loopy(10, 9, 4, 5)
+    large = loopy(40, 30, 5, 50)
+    for grid in (large, small, large):
+        size = grid.width * grid.height
+        path, expanded = search(grid.walls, grid.width, size, 0,
+                                size - 1, buffers)
+        assert len(path) == distances(grid, (0, 0))[
+            (grid.width - 1, grid.height - 1)] + 1
+        assert 0 < expanded <= size
+    assert buffers.size == 40 * 30
+
+
+def test_generation_wrap_clears_stamps() -> None:
+    buffers = SearchBuffers()
+    grid = loopy(15, 12, 6, 10)
+    size = 15 * 12
+    expected, _ = search(grid.walls, 15, size, 0, size - 1, buffers)
+    buffers.generation = 0xFFFFFFFF
+    assert search(grid.walls, 15, size, 0, size - 1,
+                  buffers)[0] == expected
+    assert buffers.generation == 1
@@ -0,0 +1,59 @@
+"""Tests for the Prim's algorithm generator."""
+
+import pytest
+
+from maze.grid import ALL_WALLS
+from tests.helpers import (assert_spanning_tree, check_walls, generator,
+                           open_cells, passages, reachable)
+from utils.errors import InvalidEntryExitPoint
+
+
+@pytest.mark.parametrize("width, height, seed", [
+    (9, 9, 0), (20, 15, 1), (33, 21, 2), (60, 40, 3)])
+def test_prims_carves_a_spanning_tree(width: int, height: int,
+                                      seed: int) -> None:
+    maze = generator(width, height, (0, 0), (width - 1, height - 1), seed)
+    maze.creat_maze_prims_algo()
+    assert any(maze.maze.blocked)
+    assert_spanning_tree(maze.maze)
+
+
+@pytest.mark.parametrize("width, height", [(1, 1), (1, 6), (7, 1), (8, 5)])
+def test_prims_without_42_pattern(width: int, height: int) -> None:
+    maze = generator(width, height, (0, 0), (width - 1, height - 1), 5)
+    maze.remove_walls_prims_algo()
+    assert not any(maze.maze.blocked)
+    assert_spanning_tree(maze.maze)
+
+
+def test_entry_inside_42_pattern_is_rejected() -> None:
+    # the top of the '4' is the first cell of the pattern
+    maze = generator(20, 15, (20 // 2 - 3, 15 // 2 - 3), (19, 14), 0)
+    with pytest.raises(InvalidEntryExitPoint):
+        maze.creat_maze_prims_algo()
+
+
+@pytest.mark.parametrize("width, height", [(20, 15), (33, 21), (7, 5)])
+def test_extra_walls_add_loops(width: int, height: int) -> None:
+    maze = generator(width, height, (0, 0), (width - 1, height - 1), 6)
+    if width < 9 or height < 9:
+        maze.remove_walls_prims_algo()
+    else:
+        maze.creat_maze_prims_algo()
+    opened = maze.open_extra_walls(0.25)
+    assert opened == int(width * height * 0.25)
+    check_walls(maze.maze)
+    cells = open_cells(maze.maze)
+    assert passages(maze.maze) == len(cells) - 1 + opened
+    assert reachable(maze.maze, cells[0]) == set(cells)
+    for index in range(width * height):
+        if maze.maze.is_blocked(index):
+            assert maze.maze.walls[index] == ALL_WALLS
+
+
+def test_extra_walls_stop_when_none_are_left() -> None:
+    maze = generator(3, 2, (0, 0), (2, 1), 0)
+    maze.remove_walls_prims_algo()
+    assert maze.open_extra_walls(10) == 2
+    assert passages(maze.maze) == 7
+    assert maze.open_extra_walls() == 0
@@ -0,0 +1,68 @@
+"""Tests for seeded generation and the SEED configuration key."""
+
+import random
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from configs.config_parser import parser
+from maze.mazegen import MazeGenerator
+
+CONFIG = """WIDTH=20
+HEIGHT=15
+ENTRY=0,0
+EXIT=19,14
+OUTPUT_FILE=maze.txt
+PERFECT=True
+"""
+
+
+def parse_seed(tmp_path: Path, value: str) -> Any:
+    """Parse a configuration with ``SEED=value`` and return its SEED."""
+    path = tmp_path / "config.txt"
+    path.write_text(CONFIG + f"SEED={value}\n")
+    return parser(str(path))["SEED"]
+
+
+@pytest.mark.parametrize("value, seed", [
+    ("0", 0), ("42", 42), ("123456789", 123456789), ("True", 1),
+    ("False", None)])
+def test_seed_values(tmp_path: Path, value: str, seed: Any) -> None:
+    assert parse_seed(tmp_path, value) == seed
+
+
+@pytest.mark.parametrize("value, message", [
+    ("-1", "non-negative integer"), ("true", "non-negative integer"),
+    ("1.5", "non-negative integer"), ("", "non-negative integer")])
+def test_invalid_seeds(tmp_path: Path, capsys: pytest.CaptureFixture[str],
+                       value: str, message: str) -> None:
+    with pytest.raises(SystemExit):
+        parse_seed(tmp_path, value)
+    assert message in capsys.readouterr().out
+
+
+def test_seed_is_mandatory(tmp_path: Path,
+                           capsys: pytest.CaptureFixture[str]) -> None:
+    path = tmp_path / "config.txt"
+    path.write_text(CONFIG)
+    with pytest.raises(SystemExit):
+        parser(str(path))
+    assert "missing mandatory configuration key: 'SEED'" in (
+        capsys.readouterr().out)
+
+
+@pytest.mark.parametrize("perfect", [True, False])
+def test_generators_own_their_random_state(perfect: bool) -> None:
+    walls = []
+    for rng in (None, random.Random(9)):
+        random.seed(0)
+        maze = MazeGenerator(20, 15, (0, 0), (19, 14), None, rng=rng,
+                             seed=9)
+        if perfect:
+            maze.creat_maze_bakctracker_algo()
+        else:
+            maze.creat_maze_prims_algo()
+        walls.append(bytes(maze.maze.walls))
+        assert random.random() == random.Random(0).random()
+    assert walls[0] == walls[1]
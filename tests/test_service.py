@@ -0,0 +1,101 @@
+"""Tests for the maze service layer and its background queue."""
+
+from pathlib import Path
+
+import pytest
+
+from maze.grid import Grid
+from maze.hexfile import load_output_file
+from maze.pathfinder import pathfinder
+from maze.service import (Maze, MazeQueue, build_maze, from_generator,
+                          is_perfect, maze_bytes, save_maze)
+from tests.helpers import (generator, open_cells, passages, reachable,
+                           with_loops)
+
+
+@pytest.mark.parametrize("perfect", [True, False])
+def test_build_maze_matches_the_generator(perfect: bool) -> None:
+    maze = build_maze(20, 15, (0, 0), (19, 14), perfect, seed=11)
+    expected = generator(20, 15, (0, 0), (19, 14), 11)
+    if perfect:
+        expected.creat_maze_bakctracker_algo()
+    else:
+        expected.creat_maze_prims_algo()
+        expected.open_extra_walls()
+    assert maze.grid.walls == expected.maze.walls
+    assert maze.grid.blocked == expected.maze.blocked
+    assert list(maze.solution) == pathfinder(expected.maze, (0, 0),
+                                             (19, 14), 20, 15)
+    assert (maze.entry, maze.exit) == ((0, 0), (19, 14))
+    assert maze.perfect == perfect == is_perfect(maze.grid)
+
+
+@pytest.mark.parametrize("width, height", [(20, 15), (8, 5), (40, 30)])
+def test_imperfect_mazes_have_loops(width: int, height: int) -> None:
+    maze = build_maze(width, height, (0, 0), (width - 1, height - 1), False,
+                      seed=width)
+    assert not maze.perfect and not is_perfect(maze.grid)
+    cells = open_cells(maze.grid)
+    assert passages(maze.grid) > len(cells) - 1
+    assert reachable(maze.grid, cells[0]) == set(cells)
+
+
+def test_small_maze_leaves_out_the_pattern(
+        capsys: pytest.CaptureFixture[str]) -> None:
+    maze = build_maze(8, 5, (0, 0), (7, 4), True, seed=1, warn=True)
+    assert "42 pathern" in capsys.readouterr().out
+    assert not any(maze.grid.blocked)
+    assert maze.solution[0] == (0, 0) and maze.solution[-1] == (7, 4)
+
+
+def test_save_and_reload(tmp_path: Path) -> None:
+    maze = build_maze(21, 13, (0, 0), (20, 12), True, seed=5)
+    path = str(tmp_path / "maze.txt")
+    save_maze(maze, path)
+    generator, solution = load_output_file(path)
+    assert solution == list(maze.solution)
+    assert from_generator(generator)[1:] == maze[1:]
+    assert Path(path).read_bytes() == maze_bytes(maze)
+
+
+def test_is_perfect() -> None:
+    maze = build_maze(16, 12, (0, 0), (15, 11), True, seed=3)
+    assert is_perfect(maze.grid)
+    assert not is_perfect(with_loops(maze.grid, 3, 1))
+    assert not is_perfect(Grid(3, 3))
+    assert is_perfect(Grid(1, 1))
+
+
+def test_queue_writes_each_maze_it_hands_out(tmp_path: Path) -> None:
+    seeds = iter(range(100))
+    out_file = tmp_path / "maze.txt"
+    ready = MazeQueue(lambda: build_maze(8, 7, (0, 0), (7, 6), True,
+                                         seed=next(seeds)),
+                      str(out_file), size=2)
+    try:
+        for seed in range(4):
+            maze = ready.get()
+            expected = build_maze(8, 7, (0, 0), (7, 6), True, seed=seed)
+            assert maze.grid.walls == expected.grid.walls
+            assert out_file.read_bytes() == maze_bytes(expected)
+        assert ready.hits + ready.misses == 4
+    finally:
+        ready.close()
+
+
+def test_queue_keeps_working_after_a_failed_build(tmp_path: Path) -> None:
+    calls = iter(range(100))
+
+    def build() -> Maze:
+        if next(calls) % 2 == 0:
+            raise ValueError("bad maze")
+        return build_maze(6, 6, (0, 0), (5, 5), True, seed=1)
+
+    ready = MazeQueue(build, str(tmp_path / "maze.txt"), size=1)
+    try:
+        for _ in range(3):
+            with pytest.raises(ValueError, match="bad maze"):
+                ready.get()
+            assert ready.get().solution[-1] == (5, 5)
+    finally:
+        ready.close()
@@ -0,0 +1,81 @@
+"""Tests for the batch solver."""
+
+import random
+import subprocess
+import sys
+from typing import Optional
+
+import pytest
+
+from maze.grid import Grid
+from maze.pathfinder import pathfinder, solve_batch
+from tests.helpers import loopy
+
+OFFSETS = {"N": (0, -1), "E": (1, 0), "S": (0, 1), "W": (-1, 0)}
+
+
+def follow(grid: Grid, start: tuple[int, int],
+           moves: str) -> Optional[tuple[int, int]]:
+    """Return the cell ``moves`` lead to from ``start``, or None if one of
+    them goes through a wall."""
+    x, y = start
+    for move in moves:
+        cell = grid[y][x]
+        if getattr(cell, {"N": "north", "E": "east", "S": "south",
+                          "W": "west"}[move]):
+            return None
+        dx, dy = OFFSETS[move]
+        x, y = x + dx, y + dy
+    return x, y
+
+
+def test_solve_batch_matches_pathfinder() -> None:
+    grid = loopy(15, 12, 6, 20)
+    rng = random.Random(6)
+    pairs = [((rng.randrange(15), rng.randrange(12)),
+              (rng.randrange(15), rng.randrange(12))) for _ in range(40)]
+    # repeated sources and repeated pairs share their searches
+    pairs += [(pairs[0][0], (x, 11)) for x in range(15)] + pairs[:5]
+    answers = solve_batch(grid, pairs, 15, 12)
+    assert len(answers) == len(pairs)
+    for (a, b), moves in zip(pairs, answers):
+        expected = pathfinder(grid, a, b, 15, 12)
+        if not expected:
+            assert moves is None
+            continue
+        assert moves is not None and len(moves) == len(expected) - 1
+        assert follow(grid, a, moves) == b
+
+
+def test_solve_batch_in_worker_processes() -> None:
+    grid = loopy(15, 12, 7, 10)
+    pairs = [((x, 0), (14 - x, 11)) for x in range(15)]
+    assert (solve_batch(grid, pairs, 15, 12, workers=2)
+            == solve_batch(grid, pairs, 15, 12))
+
+
+def test_importing_does_not_load_multiprocessing() -> None:
+    loaded = subprocess.run(
+        [sys.executable, "-c", "import sys, maze.service; "
+         "print('multiprocessing' in sys.modules)"],
+        capture_output=True, text=True, check=True).stdout
+    assert loaded.strip() == "False"
+
+
+def test_solve_batch_on_perfect_mazes_uses_the_tree() -> None:
+    grid = loopy(21, 14, 8, 0)
+    rng = random.Random(8)
+    pairs = [((rng.randrange(21), rng.randrange(14)),
+              (rng.randrange(21), rng.randrange(14))) for _ in range(60)]
+    blocked = next((x, y) for y in range(14) for x in range(21)
+                   if grid[y][x]._42_path)
+    pairs += [(blocked, (0, 0)), ((0, 0), blocked), (blocked, blocked),
+              ((3, 3), (3, 3))]
+    assert (solve_batch(grid, pairs, 21, 14, perfect=True)
+            == solve_batch(grid, pairs, 21, 14))
+
+
+def test_solve_batch_rejects_loops_when_perfect() -> None:
+    with pytest.raises(ValueError, match="not perfect"):
+        solve_batch(loopy(12, 10, 1, 5), [((0, 0), (11, 9))], 12, 10,
+                    perfect=True)
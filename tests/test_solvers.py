@@ -0,0 +1,46 @@
+"""Cross-checks of the bidirectional and A* solvers against BFS."""
+
+import random
+
+import pytest
+
+from maze.grid import Grid
+from maze.pathfinder import SOLVERS, pathfinder, solve
+from tests.helpers import is_walk, loopy
+
+
+def test_registered_solvers() -> None:
+    assert set(SOLVERS) == {"bfs", "bidirectional", "astar"}
+
+
+@pytest.mark.parametrize("seed", range(5))
+@pytest.mark.parametrize("strategy", ["bfs", "bidirectional", "astar"])
+def test_solvers_match_bfs_on_loops(seed: int, strategy: str) -> None:
+    grid = loopy(25, 18, seed, 60)
+    rng = random.Random(seed)
+    for _ in range(20):
+        a = (rng.randrange(25), rng.randrange(18))
+        b = (rng.randrange(25), rng.randrange(18))
+        expected = pathfinder(grid, a, b, 25, 18)
+        result = solve(grid, a, b, 25, 18, strategy)
+        assert len(result.path) == len(expected)
+        assert result.expanded > 0
+        if result.path:
+            assert (result.path[0], result.path[-1]) == (a, b)
+            assert is_walk(grid, result.path)
+
+
+@pytest.mark.parametrize("strategy", ["bidirectional", "astar"])
+def test_unreachable_and_trivial_targets(strategy: str) -> None:
+    grid = Grid(3, 2)
+    grid.carve(0, 1)
+    assert solve(grid, (0, 0), (2, 1), 3, 2, strategy).path == []
+    assert solve(grid, (1, 0), (0, 0), 3, 2, strategy).path == [(1, 0),
+                                                                (0, 0)]
+    assert solve(grid, (2, 1), (2, 1), 3, 2, strategy).path == [(2, 1)]
+
+
+def test_unknown_solver() -> None:
+    grid = loopy(6, 6, 0, 0)
+    with pytest.raises(ValueError, match="unknown solver"):
+        solve(grid, (0, 0), (5, 5), 6, 6, "dfs")
@@ -0,0 +1,52 @@
+"""Tests for the streaming Eller's-algorithm mode."""
+
+from pathlib import Path
+
+import pytest
+
+from maze.grid import ALL_WALLS, Grid
+from maze.mazegen import pattern_42_cells
+from maze.streaming import stream_maze
+from tests.helpers import assert_spanning_tree
+from utils.errors import InvalidEntryExitPoint
+
+
+def read_streamed(path: Path) -> tuple[Grid, list[str]]:
+    """Parse a streamed maze file into its grid and trailing lines."""
+    lines = path.read_text().split("\n")
+    blank = lines.index("")
+    rows = lines[:blank]
+    walls = bytes(int(digit, 16) for row in rows for digit in row)
+    assert all(len(row) == len(rows[0]) for row in rows)
+    return Grid.from_walls(len(rows[0]), len(rows), walls), lines[blank:]
+
+
+@pytest.mark.parametrize("width, height", [
+    (9, 9), (20, 15), (40, 120), (13, 31)])
+def test_streamed_maze_is_perfect(tmp_path: Path, width: int,
+                                  height: int) -> None:
+    path = tmp_path / "maze.txt"
+    exit = (width - 1, height - 1)
+    stream_maze(width, height, (0, 0), exit, str(path))
+    grid, tail = read_streamed(path)
+    assert tail == ["", "0, 0", f"{exit[0]}, {exit[1]}", "", ""]
+    pattern = pattern_42_cells(width, height)
+    assert pattern
+    for x, y in pattern:
+        index = grid.index(x, y)
+        assert grid.walls[index] == ALL_WALLS
+        grid.mark_blocked(index)
+    assert_spanning_tree(grid)
+
+
+def test_small_maze_has_no_pattern(tmp_path: Path) -> None:
+    path = tmp_path / "maze.txt"
+    stream_maze(8, 5, (0, 0), (7, 4), str(path))
+    grid, _ = read_streamed(path)
+    assert_spanning_tree(grid)
+
+
+def test_entry_inside_42_pattern_is_rejected(tmp_path: Path) -> None:
+    entry = pattern_42_cells(20, 15)[0]
+    with pytest.raises(InvalidEntryExitPoint):
+        stream_maze(20, 15, entry, (19, 14), str(tmp_path / "maze.txt"))
@@ -0,0 +1,19 @@
+"""Tests for searches running in several threads at once."""
+
+import random
+from concurrent.futures import ThreadPoolExecutor
+
+from maze.pathfinder import pathfinder
+from tests.helpers import loopy
+
+
+def test_concurrent_searches_do_not_share_buffers() -> None:
+    grid = loopy(40, 30, 1, 80)
+    rng = random.Random(1)
+    pairs = [((rng.randrange(40), rng.randrange(30)),
+              (rng.randrange(40), rng.randrange(30))) for _ in range(200)]
+    expected = [pathfinder(grid, a, b, 40, 30) for a, b in pairs]
+    with ThreadPoolExecutor(4) as pool:
+        found = list(pool.map(
+            lambda pair: pathfinder(grid, pair[0], pair[1], 40, 30), pairs))
+    assert found == expected
@@ -0,0 +1,45 @@
+"""Cross-checks of the LCA distance index against BFS."""
+
+import random
+
+import pytest
+
+from maze.pathfinder import pathfinder
+from maze.tree_index import TreeIndex
+from tests.helpers import loopy
+
+
+@pytest.mark.parametrize("seed", range(3))
+def test_tree_index_matches_bfs(seed: int) -> None:
+    grid = loopy(23, 17, seed, 0)
+    index = TreeIndex(grid, 23, 17, root=(22, 16))
+    rng = random.Random(seed)
+    for _ in range(50):
+        a = (rng.randrange(23), rng.randrange(17))
+        b = (rng.randrange(23), rng.randrange(17))
+        if grid[a[1]][a[0]]._42_path or grid[b[1]][b[0]]._42_path:
+            continue
+        expected = pathfinder(grid, a, b, 23, 17)
+        assert index.distance(a, b) == len(expected) - 1
+        assert index.path(a, b) == expected
+        assert index.lca(a, b) in expected
+
+
+def test_single_cell() -> None:
+    index = TreeIndex(loopy(1, 1, 0, 0), 1, 1)
+    assert index.distance((0, 0), (0, 0)) == 0
+    assert index.path((0, 0), (0, 0)) == [(0, 0)]
+
+
+def test_cells_outside_the_index_are_rejected() -> None:
+    grid = loopy(20, 15, 1, 0)
+    blocked = next((x, y) for y in range(15) for x in range(20)
+                   if grid[y][x]._42_path)
+    index = TreeIndex(grid, 20, 15)
+    with pytest.raises(ValueError):
+        index.distance((0, 0), blocked)
+
+
+def test_tree_index_rejects_loops() -> None:
+    with pytest.raises(ValueError):
+        TreeIndex(loopy(12, 12, 2, 5), 12, 12)
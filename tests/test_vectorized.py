@@ -0,0 +1,55 @@
+"""Tests for the NumPy maze engine."""
+
+from typing import Any, Callable
+
+import pytest
+
+from maze.mazegen import MazeGenerator
+from tests.helpers import assert_spanning_tree
+
+np = pytest.importorskip("numpy")
+vectorized = pytest.importorskip("maze.vectorized")
+
+ALGORITHMS = [vectorized.binary_tree, vectorized.sidewinder,
+              vectorized.eller]
+
+
+@pytest.mark.parametrize("algorithm", ALGORITHMS)
+@pytest.mark.parametrize("width, height", [
+    (1, 1), (1, 7), (9, 1), (2, 2), (20, 15), (57, 33)])
+def test_perfect_and_valid(algorithm: Callable[..., Any], width: int,
+                           height: int) -> None:
+    walls = algorithm(width, height, seed=width * height)
+    assert walls.shape == (height, width) and walls.dtype == np.uint8
+    grid = vectorized.to_grid(walls)
+    assert (grid.width, grid.height) == (width, height)
+    assert bytes(grid.walls) == walls.tobytes()
+    assert_spanning_tree(grid)
+
+
+@pytest.mark.parametrize("algorithm", ALGORITHMS)
+def test_same_seed_same_maze(algorithm: Callable[..., Any]) -> None:
+    first = algorithm(30, 20, seed=7)
+    assert np.array_equal(first, algorithm(30, 20, seed=7))
+    assert not np.array_equal(first, algorithm(30, 20, seed=8))
+
+
+def test_eller_rows_match_eller() -> None:
+    rows = list(vectorized.eller_rows(25, 12, seed=3))
+    assert len(rows) == 12
+    assert np.array_equal(np.stack(rows), vectorized.eller(25, 12, seed=3))
+
+
+@pytest.mark.parametrize("perfect", [True, False])
+def test_block_random_drives_generators(perfect: bool) -> None:
+    walls = []
+    for _ in range(2):
+        maze = MazeGenerator(30, 20, (0, 0), (29, 19), None,
+                             rng=vectorized.BlockRandom(5, block=100))
+        if perfect:
+            maze.creat_maze_bakctracker_algo()
+        else:
+            maze.creat_maze_prims_algo()
+        assert_spanning_tree(maze.maze)
+        walls.append(bytes(maze.maze.walls))
+    assert walls[0] == walls[1]
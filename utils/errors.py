@@ -39,3 +39,12 @@ class InvalidEntryExitPoint(Exception):
     outside the maze boundaries or otherwise invalid.
     """
     pass
+
+
+class InvalidMazeFile(Exception):
+    """Raised when a saved maze file cannot be loaded.
+
+    This exception is raised for unknown or truncated file headers and
+    for wall data that is inconsistent with the maze dimensions.
+    """
+    pass